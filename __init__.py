@@ -2,63 +2,217 @@
 
 from __future__ import annotations
 
+from importlib import import_module
 import logging
+from pathlib import Path
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.helpers.typing import ConfigType
 
 from .const import (
+    CONF_CHARGING_ANALYTICS,
+    CONF_HEDGE_REQUESTS,
+    CONF_HYSTERESIS_AMPS,
+    CONF_MAX_COMMANDS_PER_HOUR,
+    CONF_MIN_HOLD_TIME,
+    CONF_PREWAKE,
     CONF_REFRESH_TOKEN,
+    CONF_TARGET_POWER_ENTITY,
     CONF_VIN,
     CONF_WALL_CONNECTOR_ID,
+    DEFAULT_CHARGING_ANALYTICS,
+    DEFAULT_HEDGE_REQUESTS,
+    DEFAULT_HYSTERESIS_AMPS,
+    DEFAULT_MAX_COMMANDS_PER_HOUR,
+    DEFAULT_MIN_HOLD_TIME,
+    DEFAULT_PREWAKE,
     DOMAIN,
     PLATFORMS,
 )
-from .coordinator import TeslaVehicleCoordinator, TeslaWallConnectorCoordinator
-from .models.vehicle.vehicle import TeslaVehicle
-from .models.wall_connector.wall_connector import WallConnector
-from .owner_api.client import TeslaAPIClient
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+# Only imported once an entry is set up, so that loading the integration, for
+# instance for its config flow, does not pull in the Owner API stack.
+ENTRY_MODULES = (
+    ".coordinator",
+    ".discovery",
+    ".models.energy_site.energy_site",
+    ".models.vehicle.vehicle",
+    ".models.wall_connector.wall_connector",
+    ".owner_api.client",
+)
+CHARGE_CONTROLLER_MODULE = ".charge_controller"
+PREWAKE_MODULE = ".prewake"
+# The session log and the analytics import numpy
+ANALYTICS_MODULES = (".session_log", ".analytics")
+
+
+def _import_modules(names: tuple[str, ...]) -> None:
+    """Import modules of the integration."""
+    for name in names:
+        import_module(name, __name__)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Tesla Connector services."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Tesla Connector from a config entry."""
-    tesla_client = TeslaAPIClient(
-        entry.data[CONF_REFRESH_TOKEN],
+    target_entity_id = entry.options.get(CONF_TARGET_POWER_ENTITY)
+    prewake_enabled = entry.options.get(CONF_PREWAKE, DEFAULT_PREWAKE)
+    analytics_enabled = entry.options.get(
+        CONF_CHARGING_ANALYTICS, DEFAULT_CHARGING_ANALYTICS
+    )
+    modules = ENTRY_MODULES
+    if target_entity_id:
+        modules += (CHARGE_CONTROLLER_MODULE,)
+    if prewake_enabled:
+        modules += (PREWAKE_MODULE,)
+    if analytics_enabled:
+        modules += ANALYTICS_MODULES
+    await hass.async_add_import_executor_job(_import_modules, modules)
+
+    from .coordinator import (
+        TeslaEnergySiteCoordinator,
+        TeslaVehicleCoordinator,
+        TeslaWallConnectorCoordinator,
     )
+    from .discovery import async_create_client, async_get_cached_client
+    from .models.energy_site.energy_site import EnergySite
+    from .models.vehicle.vehicle import TeslaVehicle
+    from .models.wall_connector.wall_connector import WallConnector
+
+    # Reuse the client of the config flow, its token was just exchanged
+    tesla_client = async_get_cached_client(
+        hass, entry.data[CONF_REFRESH_TOKEN]
+    ) or async_create_client(hass, entry.data[CONF_REFRESH_TOKEN])
+    if entry.options.get(CONF_HEDGE_REQUESTS, DEFAULT_HEDGE_REQUESTS):
+        tesla_client.enable_hedging()
+    # Stops a traffic recording still running
+    entry.async_on_unload(tesla_client.async_close)
 
     tesla_vehicle = TeslaVehicle(
         entry.data[CONF_VIN],
         tesla_client,
     )
 
+    energy_site = EnergySite(
+        entry.data[CONF_WALL_CONNECTOR_ID],
+        tesla_client,
+    )
     wall_connector = WallConnector(
         entry.data[CONF_WALL_CONNECTOR_ID],
         tesla_client,
     )
 
-    tesla_vehicle_coordinator = TeslaVehicleCoordinator(hass, tesla_vehicle)
+    tesla_energy_site_coordinator = TeslaEnergySiteCoordinator(hass, energy_site)
     tesla_wall_connector_coordinator = TeslaWallConnectorCoordinator(
         hass,
         wall_connector,
+        tesla_energy_site_coordinator,
+    )
+    session_log = None
+    if analytics_enabled:
+        from .session_log import ChargingSessionLog
+
+        session_log = ChargingSessionLog(
+            Path(hass.config.path(STORAGE_DIR)), f"{DOMAIN}.{entry.data[CONF_VIN]}"
+        )
+        await hass.async_add_executor_job(session_log.open)
+
+        async def _async_close_session_log() -> None:
+            await hass.async_add_executor_job(session_log.close)
+
+        entry.async_on_unload(_async_close_session_log)
+
+    tesla_vehicle_coordinator = TeslaVehicleCoordinator(
+        hass,
+        tesla_vehicle,
+        tesla_wall_connector_coordinator,
+        session_log,
     )
 
     # Store the coordinator in the entry data
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+        "client": tesla_client,
         "vehicle": tesla_vehicle_coordinator,
         "wall_connector": tesla_wall_connector_coordinator,
+        "energy_site": tesla_energy_site_coordinator,
+        "session_log": session_log,
     }
 
+    @callback
+    def _async_remove_entry_data() -> None:
+        # Services look vehicles up in the entry data
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+
+    entry.async_on_unload(_async_remove_entry_data)
+    entry.async_on_unload(tesla_vehicle.cancel_commands)
+
+    if prewake_enabled:
+        from .prewake import PreWakeScheduler
+
+        prewake = PreWakeScheduler(hass, tesla_vehicle_coordinator)
+        await prewake.async_load()
+        hass.data[DOMAIN][entry.entry_id]["prewake"] = prewake
+
+    if analytics_enabled:
+        from .analytics import ChargingAnalytics
+
+        analytics = ChargingAnalytics(hass, tesla_vehicle_coordinator, session_log)
+        await analytics.async_load()
+        hass.data[DOMAIN][entry.entry_id]["analytics"] = analytics
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     await tesla_vehicle.async_ensure_car_woke_up()
 
+    # Its listener fills the wall connector coordinator
+    await tesla_energy_site_coordinator.async_config_entry_first_refresh()
     await tesla_vehicle_coordinator.async_config_entry_first_refresh()
-    await tesla_wall_connector_coordinator.async_config_entry_first_refresh()
+
+    if target_entity_id:
+        from .charge_controller import ChargeAmpsController
+
+        charge_controller = ChargeAmpsController(
+            hass,
+            tesla_vehicle_coordinator,
+            target_entity_id,
+            entry.options.get(CONF_HYSTERESIS_AMPS, DEFAULT_HYSTERESIS_AMPS),
+            entry.options.get(CONF_MIN_HOLD_TIME, DEFAULT_MIN_HOLD_TIME),
+            entry.options.get(
+                CONF_MAX_COMMANDS_PER_HOUR, DEFAULT_MAX_COMMANDS_PER_HOUR
+            ),
+        )
+        hass.data[DOMAIN][entry.entry_id]["charge_controller"] = charge_controller
+        entry.async_on_unload(charge_controller.async_start())
+
+    if prewake_enabled:
+        entry.async_on_unload(prewake.async_start())
+        entry.async_on_unload(prewake.async_save)
+
+    if analytics_enabled:
+        entry.async_on_unload(analytics.async_start())
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
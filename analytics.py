@@ -0,0 +1,162 @@
+"""Battery health and charging efficiency analytics over charging sessions."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import (
+    ANALYTICS_MIN_SOC_DELTA,
+    ANALYTICS_RECENT_SESSIONS,
+    SENSOR_CHARGING_EFFICIENCY,
+    SENSOR_ESTIMATED_CAPACITY,
+)
+from .session_log import SESSION_DTYPE
+
+if TYPE_CHECKING:
+    from .coordinator import TeslaVehicleCoordinator
+    from .session_log import ChargingSessionLog
+
+SECONDS_PER_YEAR = 365.25 * 24 * 3600
+SOC_BINS = 101
+
+
+def session_capacities(sessions: np.ndarray) -> np.ndarray:
+    """Return the capacity estimated from each session, NaN when too short."""
+    soc_delta = sessions["soc_end"] - sessions["soc_start"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(
+            soc_delta >= ANALYTICS_MIN_SOC_DELTA,
+            sessions["energy_added"] * 100 / soc_delta,
+            np.nan,
+        )
+
+
+def charging_curve(samples: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the summed power and the number of samples per SoC percent."""
+    soc = np.clip(samples["soc"], 0, SOC_BINS - 1).astype(np.intp)
+    return (
+        # bincount returns integers for empty weights
+        np.bincount(soc, weights=samples["power"], minlength=SOC_BINS).astype(
+            np.float64, copy=False
+        ),
+        np.bincount(soc, minlength=SOC_BINS),
+    )
+
+
+class ChargingAnalytics:
+    """Derive battery and efficiency metrics from the charging session log.
+
+    Past sessions are read once when loading, then each session closed by the
+    coordinator updates the session list and the charging curve.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: TeslaVehicleCoordinator,
+        session_log: ChargingSessionLog,
+    ) -> None:
+        """Initialize the analytics."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._session_log = session_log
+
+        self._sessions = np.empty(0, SESSION_DTYPE)
+        self._power_sums = np.zeros(SOC_BINS)
+        self._sample_counts = np.zeros(SOC_BINS, np.int64)
+        self._metrics: dict[str, Any] = {}
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Return the battery and efficiency metrics."""
+        return self._metrics
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Call the listener when the metrics change."""
+        self._listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.remove(listener)
+
+        return _remove
+
+    async def async_load(self) -> None:
+        """Compute the metrics of the logged sessions."""
+        sessions, power_sums, sample_counts = await self._hass.async_add_executor_job(
+            self._load
+        )
+        self._sessions = sessions
+        self._power_sums = power_sums
+        self._sample_counts = sample_counts
+        self._update_metrics()
+
+    def _load(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Read the sessions and the charging curve of the log."""
+        return self._session_log.sessions(), *charging_curve(
+            self._session_log.samples()
+        )
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Follow the sessions closed by the coordinator, return a callback to stop."""
+        return self._coordinator.async_add_session_listener(self._async_handle_session)
+
+    @callback
+    def _async_handle_session(self, session: np.ndarray, samples: np.ndarray) -> None:
+        """Add a closed session to the metrics."""
+        self._sessions = np.concatenate((self._sessions, session))
+        power_sums, sample_counts = charging_curve(samples)
+        self._power_sums += power_sums
+        self._sample_counts += sample_counts
+        self._update_metrics()
+
+    def _update_metrics(self) -> None:
+        """Compute the metrics from the session summaries and the curve."""
+        sessions = self._sessions
+        capacity = session_capacities(sessions)
+        with_capacity = ~np.isnan(capacity)
+        recent = capacity[with_capacity][-ANALYTICS_RECENT_SESSIONS:]
+
+        trend = None
+        starts = sessions["start"][with_capacity]
+        if len(starts) >= 2 and starts[-1] > starts[0]:
+            years = (starts - starts[0]) / SECONDS_PER_YEAR
+            trend = float(np.polyfit(years, capacity[with_capacity], 1)[0])
+
+        connector_energy = sessions["connector_energy"]
+        paired = ~np.isnan(connector_energy) & (connector_energy > 0)
+        delivered = float(connector_energy[paired].sum())
+        added = float(sessions["energy_added"][paired].sum())
+
+        soc = np.flatnonzero(self._sample_counts)
+        self._metrics = {
+            SENSOR_ESTIMATED_CAPACITY: round(float(np.median(recent)), 1)
+            if len(recent)
+            else None,
+            "capacity_trend_kwh_per_year": round(trend, 2)
+            if trend is not None
+            else None,
+            SENSOR_CHARGING_EFFICIENCY: round(added * 100 / delivered, 1)
+            if delivered
+            else None,
+            "sessions": len(sessions),
+            "energy_added_kwh": round(float(sessions["energy_added"].sum()), 1),
+            "connector_energy_kwh": round(delivered, 1),
+            "charging_curve": [
+                {"soc": int(percent), "power_kw": round(float(power), 1)}
+                for percent, power in zip(
+                    soc, self._power_sums[soc] / self._sample_counts[soc]
+                )
+            ],
+        }
+
+        for listener in list(self._listeners):
+            listener()
@@ -1,7 +1,13 @@
 """Base class for Tesla sensors."""
 
-from dataclasses import dataclass
+from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components import persistent_notification
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.components.number import NumberEntity
 from homeassistant.core import callback
@@ -9,24 +15,14 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import utils
 from .const import DOMAIN
-from .coordinator import TeslaBaseCoordinator
+from .entity_descriptions import TeslaSensorDescription
 
+if TYPE_CHECKING:
+    from .coordinator import TeslaBaseCoordinator
 
-@dataclass
-class TeslaSensorDescription:
-    """Class to describe a Tesla sensor."""
+_LOGGER = logging.getLogger(__name__)
 
-    name: str
-    value_path: str
-    unit: str | None = None
-    device_class: str | None = None
-    icon: str | None = None
-    suggested_display_precision: int | None = None
-    min_value: int | None = None
-    max_value: int | None = None
-    step: int | None = None
-    on_value: str | None = None
-    off_value: str | None = None
+_UNSET = object()
 
 
 class TeslaBaseSensor(CoordinatorEntity):
@@ -45,6 +41,9 @@ class TeslaBaseSensor(CoordinatorEntity):
         self._value_path = description.value_path
         self._device = coordinator.device
 
+        self._optimistic_value: Any = _UNSET
+        self._optimistic_task: asyncio.Task | None = None
+
     @property
     def unique_id(self) -> str:
         """Return a unique ID for the sensor."""
@@ -60,6 +59,11 @@ class TeslaBaseSensor(CoordinatorEntity):
         """Return the icon of the sensor."""
         return self._description.icon
 
+    @property
+    def entity_registry_enabled_default(self) -> bool:
+        """Return whether the entity is enabled when first registered."""
+        return self._description.enabled_default
+
     @property
     def device_info(self) -> dict:
         """Return device information."""
@@ -89,13 +93,88 @@ class TeslaBaseSensor(CoordinatorEntity):
         """Handle updated data from the coordinator."""
         data = self.coordinator.data
         self._device = self.coordinator.device
-        self._update_state(self._get_value(data))
+        value = self._get_value(data)
+
+        if self._optimistic_value is not _UNSET:
+            if value != self._optimistic_value:
+                # Keep the optimistic state until the command is confirmed
+                super()._handle_coordinator_update()
+                return
+            self._optimistic_value = _UNSET
+
+        self._update_state(value)
         super()._handle_coordinator_update()
 
     def _update_state(self, value):
         """Update the state of the sensor."""
         raise NotImplementedError("Must be implemented by subclasses.")
 
+    def _value_matches(self, value: Any) -> Callable[[Any], bool]:
+        """Return a predicate checking the entity value in vehicle data."""
+        return lambda data: self._get_value(data) == value
+
+    @callback
+    def async_run_optimistic_command(
+        self,
+        value: Any,
+        command: Callable[[], Awaitable[Any]],
+        confirm: Callable[[], Awaitable[Any]],
+    ) -> None:
+        """Apply a value right away and run the command in the background.
+
+        The value is rolled back and the user notified if the command fails
+        or is not confirmed in time.
+        """
+        if self._optimistic_task is not None and not self._optimistic_task.done():
+            self._optimistic_task.cancel()
+
+        self._optimistic_value = value
+        self._update_state(value)
+        self.async_write_ha_state()
+
+        self._optimistic_task = self.hass.async_create_background_task(
+            self._async_confirm_command(value, command, confirm),
+            name=f"{self.entity_id} command",
+        )
+
+    async def _async_confirm_command(
+        self,
+        value: Any,
+        command: Callable[[], Awaitable[Any]],
+        confirm: Callable[[], Awaitable[Any]],
+    ) -> None:
+        """Run the command and wait for the vehicle to confirm it."""
+        try:
+            await command()
+            await confirm()
+        except Exception as err:
+            _LOGGER.warning("Command for %s failed: %s", self.entity_id, err)
+            self._optimistic_value = _UNSET
+            self._update_state(self._get_value(self.coordinator.data))
+            self.async_write_ha_state()
+            persistent_notification.async_create(
+                self.hass,
+                f"La commande « {self.name} » ({value}) n'a pas pu être confirmée : {err}",
+                title="Tesla Connector",
+                notification_id=f"{self.unique_id}_command",
+            )
+            return
+
+        self._optimistic_value = _UNSET
+        await self.coordinator.async_request_refresh()
+
+    async def async_added_to_hass(self) -> None:
+        """Have the coordinator fetch the data section of the entity."""
+        await super().async_added_to_hass()
+        section, _, _ = self._value_path.partition(".")
+        self.async_on_remove(self.coordinator.async_want_section(section))
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the pending command confirmation."""
+        if self._optimistic_task is not None:
+            self._optimistic_task.cancel()
+        await super().async_will_remove_from_hass()
+
 
 class TeslaBaseBinarySensor(TeslaBaseSensor, BinarySensorEntity):
     """Base class for Tesla switches."""
@@ -0,0 +1,63 @@
+"""Benchmarks of the charging analytics and the charging session log."""
+
+import numpy as np
+import pytest
+from tesla_connector.analytics import charging_curve
+from tesla_connector.session_log import (
+    SAMPLE_DTYPE,
+    ChargingSessionLog,
+    summarize_sessions,
+)
+
+DAYS = 5 * 365
+SESSION_SAMPLES = 180  # a 3 hour session a day, sampled every minute
+
+
+def _samples() -> np.ndarray:
+    """Return five years of daily charging sessions."""
+    day = np.repeat(np.arange(DAYS), SESSION_SAMPLES)
+    minute = np.tile(np.arange(SESSION_SAMPLES), DAYS)
+    samples = np.zeros(DAYS * SESSION_SAMPLES, SAMPLE_DTYPE)
+    samples["session"] = day * 86400.0
+    samples["time"] = samples["session"] + minute * 60
+    samples["soc"] = 30 + minute * 50 / SESSION_SAMPLES
+    samples["energy_added"] = (samples["soc"] - 30) * 0.75
+    samples["connector_energy"] = samples["energy_added"] / 0.9
+    samples["power"] = 11
+    return samples
+
+
+@pytest.fixture(scope="module")
+def session_log(tmp_path_factory):
+    """Return a log of five years of sessions, indexed when opened."""
+    directory = tmp_path_factory.mktemp("session_log")
+    _samples().tofile(directory / "bench.charging_samples")
+    log = ChargingSessionLog(directory, "bench")
+    log.open()
+    yield log
+    log.close()
+
+
+def bench_summarize_sessions(benchmark):
+    """Summarize five years of 1 minute charging samples."""
+    benchmark(summarize_sessions, _samples())
+
+
+def bench_charging_curve(benchmark):
+    """Average the power per SoC over five years of samples."""
+    benchmark(charging_curve, _samples())
+
+
+def bench_last_sessions(benchmark, session_log):
+    """Read the last sessions of five years of sessions."""
+    benchmark(session_log.last_sessions, 10)
+
+
+def bench_sessions_between(benchmark, session_log):
+    """Read the sessions of a month and their samples."""
+
+    def _month() -> None:
+        for session in session_log.sessions_between(400 * 86400, 430 * 86400):
+            session_log.samples(session)
+
+    benchmark(_month)
@@ -0,0 +1,65 @@
+"""Benchmarks of the Owner API client against a local HTTP server."""
+
+from aiohttp import web
+import pytest
+
+from tesla_connector.owner_api.client import TeslaAPIClient
+from tesla_connector.owner_api.endpoints import (
+    GET_VEHICLE_DATA_ENDPOINT,
+    SITE_LIVE_STATUS_ENDPOINT,
+)
+
+from payloads import SITE_ID, SITE_LIVE_STATUS, VEHICLE_DATA, VIN
+
+
+async def _token(request: web.Request) -> web.Response:
+    return web.json_response({"access_token": "access", "refresh_token": "refresh"})
+
+
+async def _vehicle_data(request: web.Request) -> web.Response:
+    return web.json_response({"response": VEHICLE_DATA})
+
+
+async def _site_live_status(request: web.Request) -> web.Response:
+    return web.json_response({"response": SITE_LIVE_STATUS})
+
+
+@pytest.fixture
+def client(loop):
+    """Return a client connected to a local stand-in of the Owner API."""
+    app = web.Application()
+    app.router.add_post("/oauth2/v3/token", _token)
+    app.router.add_get(GET_VEHICLE_DATA_ENDPOINT, _vehicle_data)
+    app.router.add_get(SITE_LIVE_STATUS_ENDPOINT, _site_live_status)
+
+    runner = web.AppRunner(app)
+    loop.run_until_complete(runner.setup())
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    loop.run_until_complete(site.start())
+    port = runner.addresses[0][1]
+
+    client = TeslaAPIClient(
+        "refresh",
+        base_url=f"http://127.0.0.1:{port}",
+        token_url=f"http://127.0.0.1:{port}/oauth2/v3/token",
+    )
+    yield client
+
+    loop.run_until_complete(client.async_close())
+    loop.run_until_complete(runner.cleanup())
+
+
+def bench_request_vehicle_data(benchmark, loop, client):
+    """Fetch and decode a full vehicle_data payload."""
+    endpoint = GET_VEHICLE_DATA_ENDPOINT.format(vehicle_id=VIN)
+    loop.run_until_complete(client._async_request(endpoint))
+
+    benchmark(lambda: loop.run_until_complete(client._async_request(endpoint)))
+
+
+def bench_request_site_live_status(benchmark, loop, client):
+    """Fetch and decode the live status of a site and its wall connectors."""
+    endpoint = SITE_LIVE_STATUS_ENDPOINT.format(site_id=SITE_ID)
+    loop.run_until_complete(client._async_request(endpoint))
+
+    benchmark(lambda: loop.run_until_complete(client._async_request(endpoint)))
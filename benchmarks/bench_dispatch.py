@@ -0,0 +1,113 @@
+"""Benchmarks of the coordinator update fan-out to entities."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from tesla_connector.binary_sensor import TeslaBinarySensor
+from tesla_connector.entity_descriptions import (
+    BINARY_SENSOR_DESCRIPTIONS,
+    NUMBER_DESCRIPTIONS,
+    SENSOR_DESCRIPTIONS,
+    SWITCH_DESCRIPTIONS,
+    WALL_CONNECTOR_SENSOR_DESCRIPTIONS,
+    WALL_CONNECTOR_UNIT_SENSOR_DESCRIPTIONS,
+)
+from tesla_connector.models.vehicle.vehicle_data import VehicleData
+from tesla_connector.models.wall_connector.wall_connector import WallConnector
+from tesla_connector.number import TeslaNumber
+from tesla_connector.sensor import (
+    TeslaVehicleSensor,
+    TeslaWallConnectorSensor,
+    TeslaWallConnectorUnitSensor,
+)
+from tesla_connector.switch import TeslaSwitch
+
+from payloads import SITE_ID, SITE_LIVE_STATUS, VEHICLE_DATA, VIN
+
+
+def _coordinator(device_id: str, data) -> SimpleNamespace:
+    """Return a stand-in coordinator holding the data."""
+    return SimpleNamespace(
+        data=data,
+        device=SimpleNamespace(device_id=device_id, vin=device_id),
+        get_device_info=dict,
+    )
+
+
+def _mute(entity):
+    """Do not write the state of the entity to Home Assistant."""
+    entity.async_write_ha_state = lambda: None
+    return entity
+
+
+@pytest.fixture
+def vehicle_entities():
+    """Return an entity for each vehicle description."""
+    coordinator = _coordinator(VIN, VehicleData(VEHICLE_DATA))
+    entities = [
+        *(
+            TeslaVehicleSensor(coordinator, key, description)
+            for key, description in SENSOR_DESCRIPTIONS.items()
+        ),
+        *(
+            TeslaBinarySensor(coordinator, key, description)
+            for key, description in BINARY_SENSOR_DESCRIPTIONS.items()
+        ),
+        *(
+            TeslaNumber(coordinator, key, description)
+            for key, description in NUMBER_DESCRIPTIONS.items()
+        ),
+        *(
+            TeslaSwitch(coordinator, key, description)
+            for key, description in SWITCH_DESCRIPTIONS.items()
+        ),
+    ]
+    return coordinator, [_mute(entity) for entity in entities]
+
+
+@pytest.fixture
+def wall_connector_entities():
+    """Return an entity for each wall connector description."""
+    wall_connector = WallConnector(SITE_ID, None)
+    data = wall_connector.update_from_live_status(SITE_LIVE_STATUS)
+    coordinator = _coordinator(SITE_ID, data)
+    coordinator.wall_connector = wall_connector
+    entities = [
+        *(
+            TeslaWallConnectorSensor(coordinator, key, description)
+            for key, description in WALL_CONNECTOR_SENSOR_DESCRIPTIONS.items()
+        ),
+        *(
+            TeslaWallConnectorUnitSensor(coordinator, key, description, din)
+            for din in data.by_din
+            for key, description in WALL_CONNECTOR_UNIT_SENSOR_DESCRIPTIONS.items()
+        ),
+    ]
+    return coordinator, [_mute(entity) for entity in entities]
+
+
+def bench_vehicle_update_fan_out(benchmark, vehicle_entities):
+    """Dispatch a fresh vehicle snapshot to every vehicle entity."""
+    coordinator, entities = vehicle_entities
+
+    def dispatch():
+        coordinator.data = VehicleData(VEHICLE_DATA)
+        for entity in entities:
+            entity._handle_coordinator_update()
+
+    benchmark(dispatch)
+
+
+def bench_wall_connector_update_fan_out(benchmark, wall_connector_entities):
+    """Dispatch a fresh site snapshot to every wall connector entity."""
+    coordinator, entities = wall_connector_entities
+
+    def dispatch():
+        coordinator.data = coordinator.wall_connector.update_from_live_status(
+            SITE_LIVE_STATUS
+        )
+        for entity in entities:
+            entity._handle_coordinator_update()
+
+    benchmark(dispatch)
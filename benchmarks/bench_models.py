@@ -0,0 +1,48 @@
+"""Benchmarks of the data models construction."""
+
+import copy
+
+from tesla_connector.models.vehicle.vehicle_data import VehicleData
+from tesla_connector.models.wall_connector.wall_connector_data import (
+    WallConnectorData,
+)
+
+from payloads import SITE_LIVE_STATUS, VEHICLE_DATA
+
+
+def bench_vehicle_data_construction(benchmark):
+    """Build a snapshot without accessing any section."""
+    benchmark(VehicleData, VEHICLE_DATA)
+
+
+def bench_vehicle_data_charge_state(benchmark):
+    """Build a snapshot and parse the charge state."""
+    benchmark(lambda: VehicleData(VEHICLE_DATA).charge_state)
+
+
+def bench_vehicle_data_all_sections(benchmark):
+    """Build a snapshot and parse every section."""
+
+    def build():
+        data = VehicleData(VEHICLE_DATA)
+        return (
+            data.charge_state,
+            data.vehicle_state,
+            data.climate_state,
+            data.drive_state,
+            data.vehicle_config,
+        )
+
+    benchmark(build)
+
+
+def bench_vehicle_data_compare(benchmark):
+    """Compare two parsed snapshots built from equal payloads."""
+    first = VehicleData(VEHICLE_DATA)
+    second = VehicleData(copy.deepcopy(VEHICLE_DATA))
+    benchmark(first.__eq__, second)
+
+
+def bench_wall_connector_data_construction(benchmark):
+    """Build the wall connectors of a three connectors site live status."""
+    benchmark(WallConnectorData, SITE_LIVE_STATUS)
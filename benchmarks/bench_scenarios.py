@@ -0,0 +1,276 @@
+"""Sleep, wake, charge and fleet scenarios of a vehicle on a fake clock.
+
+The vehicle and its Owner API client share a FakeClock with a simulated
+vehicle answering through an in-memory transport, so that hours of polling,
+wake up waits and charging run in milliseconds. Each benchmark checks the
+outcome of its scenario, the timing tells how fast policies can be iterated.
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+import math
+from urllib.parse import urlsplit
+
+from tesla_connector.clock import FakeClock
+from tesla_connector.const import (
+    COMMAND_BUDGET,
+    SLEEP_THRESHOLD,
+    UPDATE_INTERVAL,
+    WAKE_UP_THRESHOLD,
+    WAKE_UP_TIMEOUT,
+)
+from tesla_connector.models.vehicle.commands import (
+    COMMAND_CHARGE_STOP,
+    VehicleCommand,
+)
+from tesla_connector.models.vehicle.fleet import async_send_fleet_commands
+from tesla_connector.models.vehicle.vehicle import TeslaVehicle
+from tesla_connector.models.vehicle.vehicle_data import ChargingState
+from tesla_connector.owner_api.client import TeslaAPIClient
+from tesla_connector.owner_api.hedging import RateBudget
+from tesla_connector.owner_api.transport import TeslaTransport, TransportResponse
+
+from standin import SimulatedVehicle
+
+VIN = "5YJ3SIM0000000000"
+FLEET_SIZE = 8
+WAKE_DELAY = 25  # seconds for the simulated vehicle to come online
+
+
+class ClockTransport(TeslaTransport):
+    """Owner API answered by a simulated vehicle living on the fake clock."""
+
+    def __init__(
+        self, clock: FakeClock, vehicle: SimulatedVehicle, wake_delay: float = 0
+    ) -> None:
+        """Initialize the transport."""
+        self._clock = clock
+        self._wake_delay = wake_delay
+        self._online_at: float | None = None
+        self.vehicle = vehicle
+        self.requests: Counter[str] = Counter()
+
+    async def async_request(self, method: str, url: str, **kwargs) -> TransportResponse:
+        """Answer the request from the simulated vehicle."""
+        name = urlsplit(url).path.rsplit("/", 1)[-1]
+        self.requests[name] += 1
+        now = self._clock.now().timestamp()
+        vehicle = self.vehicle
+        vehicle.advance(now)
+
+        if name == "token":
+            return TransportResponse(
+                200, {"access_token": "access", "refresh_token": "refresh"}
+            )
+        if name == "wake_up":
+            if vehicle.asleep:
+                if self._online_at is None:
+                    self._online_at = now + self._wake_delay
+                if now < self._online_at:
+                    return TransportResponse(200, {"response": {"state": "asleep"}})
+                vehicle.asleep = False
+                self._online_at = None
+            vehicle.touch(now)
+            return TransportResponse(200, {"response": {"state": "online"}})
+        if vehicle.asleep:
+            return TransportResponse(408, {"error": "vehicle unavailable"})
+
+        vehicle.touch(now)
+        if name == "vehicle_data":
+            endpoints = kwargs.get("params", {}).get("endpoints")
+            return TransportResponse(200, {"response": vehicle.payload(now, endpoints)})
+        vehicle.run_command(name, kwargs.get("json") or {})
+        return TransportResponse(200, {"response": {"result": True, "reason": ""}})
+
+
+@dataclass
+class Scenario:
+    """Vehicle, client and simulated vehicle on a fake clock."""
+
+    clock: FakeClock
+    transport: ClockTransport
+    vehicle: TeslaVehicle
+
+    @classmethod
+    def create(
+        cls,
+        asleep: bool = False,
+        charging_enabled: bool = False,
+        clock: FakeClock | None = None,
+        vin: str = VIN,
+        command_budget: RateBudget | None = None,
+    ) -> "Scenario":
+        """Create a plugged in vehicle, on its own clock unless given one."""
+        clock = clock or FakeClock()
+        now = clock.now().timestamp()
+        simulated = SimulatedVehicle(
+            vin,
+            "site",
+            plug_period=math.inf,  # always plugged in
+            plug_offset=0,
+            battery_level=50.0,
+            charging_enabled=charging_enabled,
+            asleep=asleep,
+            last_activity=now,
+            last_update=now,
+        )
+        transport = ClockTransport(clock, simulated, WAKE_DELAY)
+        client = TeslaAPIClient(
+            "refresh", transport=transport, clock=clock, command_budget=command_budget
+        )
+        return cls(clock, transport, TeslaVehicle(vin, client, clock=clock))
+
+    @property
+    def simulated(self) -> SimulatedVehicle:
+        """Return the simulated vehicle, advanced to the virtual time."""
+        self.transport.vehicle.advance(self.clock.now().timestamp())
+        return self.transport.vehicle
+
+    @property
+    def elapsed(self) -> float:
+        """Return the virtual seconds since the start."""
+        return self.clock.monotonic()
+
+    async def async_poll(self, duration: float) -> None:
+        """Poll the vehicle data every update interval, like the coordinator."""
+        end = self.elapsed + duration
+        while self.elapsed < end:
+            await self.vehicle.async_get_vehicle_data()
+            await self.clock.sleep(UPDATE_INTERVAL)
+
+
+def bench_sleep_scenario(benchmark, loop):
+    """Stop polling once idle, then let the vehicle fall asleep over 2 hours."""
+
+    async def _async_run() -> Scenario:
+        scenario = Scenario.create()
+        await scenario.vehicle.async_lock_doors()
+        await scenario.async_poll(2 * 3600)
+        return scenario
+
+    scenario = benchmark(lambda: loop.run_until_complete(_async_run()))
+
+    polls = scenario.transport.requests["vehicle_data"]
+    assert polls <= SLEEP_THRESHOLD * 60 / UPDATE_INTERVAL + 1
+    assert scenario.simulated.asleep
+    assert scenario.vehicle.current_data.state == "offline"
+
+
+def bench_wake_scenario(benchmark, loop):
+    """Wake a sleeping vehicle for a command, the next one reuses the wake up."""
+
+    async def _async_run() -> tuple[Scenario, float, int]:
+        scenario = Scenario.create(asleep=True)
+        await scenario.vehicle.async_start_charge()
+        woken_after = scenario.elapsed
+        wake_ups = scenario.transport.requests["wake_up"]
+        await scenario.async_poll(WAKE_UP_THRESHOLD * 60 / 2)
+        await scenario.vehicle.async_set_charge_amps(10)
+        return scenario, woken_after, wake_ups
+
+    scenario, woken_after, wake_ups = benchmark(
+        lambda: loop.run_until_complete(_async_run())
+    )
+
+    assert WAKE_DELAY <= woken_after < WAKE_UP_TIMEOUT
+    assert scenario.simulated.charging_enabled
+    assert scenario.simulated.charge_amps == 10
+    assert scenario.transport.requests["wake_up"] == wake_ups
+
+
+def bench_charge_scenario(benchmark, loop):
+    """Start charging, confirm it, then keep polling a charging vehicle."""
+
+    async def _async_run() -> Scenario:
+        scenario = Scenario.create()
+        await scenario.vehicle.async_start_charge()
+        await scenario.vehicle.async_wait_charging_state(ChargingState.CHARGING)
+        await scenario.async_poll(3600)
+        return scenario
+
+    scenario = benchmark(lambda: loop.run_until_complete(_async_run()))
+
+    charge_state = scenario.vehicle.current_data.charge_state
+    assert charge_state.charging_state == ChargingState.CHARGING
+    assert charge_state.battery_level > 60
+    # A charging vehicle is polled past the sleep threshold
+    assert scenario.transport.requests["vehicle_data"] >= 3600 / UPDATE_INTERVAL
+
+
+def bench_fleet_scenario(benchmark, loop):
+    """Stop charging a fleet, half asleep, four vehicles at a time."""
+
+    async def _async_run() -> tuple[list[Scenario], list, float]:
+        clock = FakeClock()
+        scenarios = [
+            Scenario.create(
+                asleep=index % 2 == 0,
+                charging_enabled=True,
+                clock=clock,
+                vin=f"{VIN[:-2]}{index:02d}",
+            )
+            for index in range(FLEET_SIZE)
+        ]
+        results = await async_send_fleet_commands(
+            [scenario.vehicle for scenario in scenarios],
+            [VehicleCommand(COMMAND_CHARGE_STOP)],
+            concurrency=FLEET_SIZE // 2,
+            clock=clock,
+        )
+        return scenarios, results, clock.monotonic()
+
+    scenarios, results, elapsed = benchmark(
+        lambda: loop.run_until_complete(_async_run())
+    )
+
+    assert all(result.success for result in results)
+    assert not any(scenario.simulated.charging_enabled for scenario in scenarios)
+    slowest = max(
+        result.wake_up + result.command + result.confirm for result in results
+    )
+    # Two rounds of four vehicles, not eight vehicles one after the other
+    assert elapsed <= 2 * slowest
+    assert elapsed >= WAKE_DELAY
+
+
+def bench_fleet_account_scenario(benchmark, loop):
+    """Stop charging sleeping vehicles of one account, four at a time."""
+
+    async def _async_run() -> tuple[list[Scenario], list, float, RateBudget]:
+        clock = FakeClock()
+        budget = RateBudget(COMMAND_BUDGET, clock=clock)
+        # Commands sent earlier from the same account
+        for _ in range(FLEET_SIZE):
+            budget.record()
+        scenarios = [
+            Scenario.create(
+                asleep=True,
+                charging_enabled=True,
+                clock=clock,
+                vin=f"{VIN[:-2]}{index:02d}",
+                command_budget=budget,
+            )
+            for index in range(FLEET_SIZE)
+        ]
+        for scenario in scenarios:
+            await scenario.vehicle.async_get_vehicle_data()
+        results = await async_send_fleet_commands(
+            [scenario.vehicle for scenario in scenarios],
+            [VehicleCommand(COMMAND_CHARGE_STOP)],
+            concurrency=FLEET_SIZE // 2,
+            clock=clock,
+        )
+        return scenarios, results, clock.monotonic(), budget
+
+    scenarios, results, elapsed, budget = benchmark(
+        lambda: loop.run_until_complete(_async_run())
+    )
+
+    assert all(result.success for result in results)
+    assert not any(scenario.simulated.charging_enabled for scenario in scenarios)
+    slowest = max(
+        result.wake_up + result.command + result.confirm for result in results
+    )
+    # The vehicles share the budget without waiting for each other
+    assert elapsed <= 2 * slowest
+    assert budget.used <= COMMAND_BUDGET
@@ -0,0 +1,271 @@
+"""Soak harness running many vehicles and wall connectors in Home Assistant.
+
+Every vehicle gets its own config entry polling the local Owner API stand-in.
+Time is frozen and, whenever the event loop is idle, jumps straight to the
+next scheduled timer, so days of polling run in minutes while every sleep,
+timeout and update interval keeps its simulated duration. The report gives
+request counts, poll latency percentiles in simulated time, event loop lag
+and memory growth in real time, and state writes per simulated minute.
+
+    pytest -c benchmarks/pytest.ini benchmarks/bench_soak.py --soak \\
+        --soak-vehicles 50 --soak-sites 5 --soak-hours 48
+
+With --soak-tail-ratio some requests are answered after --soak-tail-latency,
+run it with and without --soak-hedge to compare the poll latency tails.
+
+Requires pytest-homeassistant-custom-component.
+"""
+
+import asyncio
+from datetime import timedelta
+import json
+import math
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import tracemalloc
+from unittest.mock import patch
+
+from freezegun import api as freezegun_api
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.setup import async_setup_component
+from tesla_connector.owner_api.hedging import percentile_of
+
+from standin import OwnerAPIStandIn
+
+ROOT = Path(__file__).resolve().parents[1]
+DOMAIN = "tesla_connector"
+PACKAGE = f"custom_components.{DOMAIN}"
+CLOCK_SLACK = 1e-6  # seconds past a timer so that the loop runs it
+
+
+def _perf_counter() -> float:
+    """Return the real performance counter, frozen time notwithstanding."""
+    return freezegun_api.real_perf_counter()
+
+
+@pytest.fixture
+def custom_components():
+    """Make the repository importable as custom_components.tesla_connector."""
+    import custom_components
+
+    with tempfile.TemporaryDirectory() as directory:
+        (Path(directory) / DOMAIN).symlink_to(ROOT, target_is_directory=True)
+        custom_components.__path__.append(directory)
+        yield
+        custom_components.__path__.remove(directory)
+        for name in [name for name in sys.modules if name.startswith(PACKAGE)]:
+            del sys.modules[name]
+
+
+class SimulatedClock:
+    """Drive the frozen clock from one scheduled timer to the next."""
+
+    def __init__(
+        self, freezer: FrozenDateTimeFactory, standin: OwnerAPIStandIn
+    ) -> None:
+        """Initialize the clock."""
+        self._freezer = freezer
+        self._standin = standin
+        self._loop = asyncio.get_running_loop()
+        self.in_flight = 0
+        self.lags: list[float] = []
+
+    def _idle(self) -> bool:
+        """Return whether nothing but timers is left to run.
+
+        Requests in flight only wait for a timer once the stand-in holds them
+        for the simulated latency.
+        """
+        return self.in_flight <= self._standin.delayed and not self._loop._ready
+
+    def _next_timer(self) -> float:
+        """Return the loop time of the next scheduled timer."""
+        return min(
+            (timer.when() for timer in self._loop._scheduled if not timer.cancelled()),
+            default=math.inf,
+        )
+
+    async def async_run(
+        self, duration: float = math.inf, until: asyncio.Future | None = None
+    ) -> None:
+        """Run the loop for a simulated duration or until a future is done."""
+        end = self._loop.time() + duration
+        while self._loop.time() < end and not (until is not None and until.done()):
+            start = _perf_counter()
+            await asyncio.sleep(0)
+            self.lags.append(_perf_counter() - start)
+            if not self._idle():
+                continue
+            target = min(end, self._next_timer() + CLOCK_SLACK)
+            if target == math.inf:
+                raise RuntimeError("Nothing scheduled, the simulation is stuck")
+            self._freezer.tick(timedelta(seconds=target - self._loop.time()))
+
+    def wrap_request(self, request):
+        """Wrap a transport request to count the requests in flight."""
+
+        async def _async_request(transport, *args, **kwargs):
+            self.in_flight += 1
+            try:
+                return await request(transport, *args, **kwargs)
+            finally:
+                self.in_flight -= 1
+
+        return _async_request
+
+
+def _timed(update, latencies: list[float]):
+    """Wrap a coordinator update to record its simulated duration."""
+    loop = asyncio.get_running_loop()
+
+    async def _async_update():
+        start = loop.time()
+        try:
+            return await update()
+        finally:
+            latencies.append(loop.time() - start)
+
+    return _async_update
+
+
+async def bench_soak(
+    request: pytest.FixtureRequest,
+    hass: HomeAssistant,
+    custom_components,
+    enable_custom_integrations,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Run the fleet for the simulated duration and report metrics."""
+    options = request.config.option
+    from custom_components.tesla_connector.owner_api.client import TeslaAPIClient
+    from custom_components.tesla_connector.owner_api.transport import (
+        AiohttpTransport,
+    )
+
+    standin = OwnerAPIStandIn(
+        options.soak_vehicles,
+        options.soak_sites,
+        options.soak_latency,
+        tail_ratio=options.soak_tail_ratio,
+        tail_latency=options.soak_tail_latency,
+    )
+    await standin.async_start()
+    clock = SimulatedClock(freezer, standin)
+
+    client_init = TeslaAPIClient.__init__
+
+    def _client_init(self, refresh_token, *args, **kwargs):
+        kwargs.update(base_url=standin.base_url, token_url=standin.token_url)
+        client_init(self, refresh_token, **kwargs)
+
+    state_writes = 0
+
+    def _count_state_write(event: Event) -> None:
+        nonlocal state_writes
+        state_writes += 1
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _count_state_write)
+
+    with (
+        patch.object(TeslaAPIClient, "__init__", _client_init),
+        patch.object(
+            AiohttpTransport,
+            "async_request",
+            clock.wrap_request(AiohttpTransport.async_request),
+        ),
+    ):
+        for vin, vehicle in standin.vehicles.items():
+            MockConfigEntry(
+                domain=DOMAIN,
+                title=vin,
+                data={
+                    "refresh_token": "refresh",
+                    "vin": vin,
+                    "wall_connector_id": vehicle.site_id,
+                },
+                options={"hedge_requests": options.soak_hedge},
+            ).add_to_hass(hass)
+
+        setup = asyncio.ensure_future(async_setup_component(hass, DOMAIN, {}))
+        await clock.async_run(until=setup)
+        assert setup.result()
+
+        latencies: dict[str, list[float]] = {"vehicle": [], "wall_connector": []}
+        for entry_data in hass.data[DOMAIN].values():
+            for kind, values in latencies.items():
+                coordinator = entry_data[kind]
+                coordinator._async_update_data = _timed(
+                    coordinator._async_update_data, values
+                )
+
+        standin.request_counts.clear()
+        state_writes = 0
+        clock.lags.clear()
+        tracemalloc.start()
+        memory_start = tracemalloc.get_traced_memory()[0]
+
+        duration = options.soak_hours * 3600
+        wall_start = _perf_counter()
+        await clock.async_run(duration)
+        wall_time = _perf_counter() - wall_start
+
+        memory_end = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        hedging: dict[str, float] = {}
+        for entry_data in hass.data[DOMAIN].values():
+            for key, value in (entry_data["client"].hedge_stats or {}).items():
+                if not key.endswith("_rate"):
+                    hedging[key] = hedging.get(key, 0) + value
+
+        for entry in hass.config_entries.async_entries(DOMAIN):
+            await clock.async_run(
+                until=asyncio.ensure_future(
+                    hass.config_entries.async_unload(entry.entry_id)
+                )
+            )
+        await clock.async_run(until=asyncio.ensure_future(hass.async_block_till_done()))
+        await clock.async_run(until=asyncio.ensure_future(standin.async_stop()))
+
+    report = {
+        "vehicles": options.soak_vehicles,
+        "sites": options.soak_sites,
+        "simulated_hours": options.soak_hours,
+        "wall_time_s": round(wall_time, 2),
+        "requests": dict(standin.request_counts),
+        "requests_per_vehicle_hour": round(
+            sum(standin.request_counts.values())
+            / options.soak_vehicles
+            / options.soak_hours,
+            2,
+        ),
+        "poll_latency_s": {
+            kind: {
+                "count": len(values),
+                "p50": round(percentile_of(values, 50), 3),
+                "p99": round(percentile_of(values, 99), 3),
+            }
+            for kind, values in latencies.items()
+        },
+        "loop_lag_ms": {
+            "mean": round(statistics.fmean(clock.lags) * 1000, 3)
+            if clock.lags
+            else 0.0,
+            "p99": round(percentile_of(clock.lags, 99) * 1000, 3),
+            "max": round(max(clock.lags, default=0.0) * 1000, 3),
+        },
+        "hedging": hedging,
+        "memory_growth_kib": round((memory_end - memory_start) / 1024, 1),
+        "state_writes_per_minute": round(state_writes / (duration / 60), 2),
+    }
+    with request.config.pluginmanager.get_plugin(
+        "capturemanager"
+    ).global_and_fixture_disabled():
+        print(json.dumps(report, indent=2))
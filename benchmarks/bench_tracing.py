@@ -0,0 +1,20 @@
+"""Benchmarks of the tracing spans."""
+
+from tesla_connector.tracing import Tracer
+
+
+def _span(tracer: Tracer) -> None:
+    with tracer.span("request", method="GET", endpoint="/vehicles") as span:
+        span.set_attribute("status", 200)
+
+
+def bench_span_disabled(benchmark):
+    """Enter a span while tracing is disabled."""
+    benchmark(_span, Tracer())
+
+
+def bench_span_enabled(benchmark):
+    """Record a span in the ring buffer."""
+    tracer = Tracer()
+    tracer.start()
+    benchmark(_span, tracer)
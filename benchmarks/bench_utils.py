@@ -0,0 +1,19 @@
+"""Benchmarks of the utility functions."""
+
+from tesla_connector.models.vehicle.vehicle_data import VehicleData
+from tesla_connector.utils import get_value_from_path
+
+from payloads import VEHICLE_DATA
+
+
+def bench_get_value_from_path(benchmark):
+    """Resolve a nested path on a parsed snapshot."""
+    data = VehicleData(VEHICLE_DATA)
+    data.charge_state  # noqa: B018
+    benchmark(get_value_from_path, data, "charge_state.battery_level")
+
+
+def bench_get_value_from_path_missing(benchmark):
+    """Resolve a path that does not exist."""
+    data = VehicleData(VEHICLE_DATA)
+    benchmark(get_value_from_path, data, "charge_state.unknown.field")
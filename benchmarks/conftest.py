@@ -0,0 +1,90 @@
+"""Micro-benchmarks for the Tesla Connector hot paths.
+
+Requires Home Assistant and pytest-benchmark. Run from the repository root:
+
+    pytest -c benchmarks/pytest.ini benchmarks
+
+Each run is saved under benchmarks/.benchmarks and compared with the previous
+one; the run fails if a mean regresses by more than 15%. The first run only
+stores the baseline.
+
+The scenarios of bench_scenarios.py run a vehicle on a FakeClock, hours of
+sleep, wake up and charge logic taking milliseconds.
+
+The soak harness (bench_soak.py) only runs with --soak, see its options with
+`pytest -c benchmarks/pytest.ini benchmarks --help`.
+"""
+
+import asyncio
+import importlib.util
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+PACKAGE = "tesla_connector"
+
+
+def _load_integration() -> None:
+    """Import the repository root as the tesla_connector package."""
+    if PACKAGE in sys.modules:
+        return
+    spec = importlib.util.spec_from_file_location(
+        PACKAGE, ROOT / "__init__.py", submodule_search_locations=[str(ROOT)]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[PACKAGE] = module
+    spec.loader.exec_module(module)
+
+
+_load_integration()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the soak harness options."""
+    group = parser.getgroup("soak", "Tesla Connector soak harness")
+    group.addoption("--soak", action="store_true", help="Run the soak harness.")
+    group.addoption("--soak-vehicles", type=int, default=10)
+    group.addoption("--soak-sites", type=int, default=2)
+    group.addoption("--soak-hours", type=float, default=24.0)
+    group.addoption("--soak-latency", type=float, default=0.0)
+    group.addoption(
+        "--soak-tail-ratio",
+        type=float,
+        default=0.0,
+        help="Fraction of the requests answered after --soak-tail-latency.",
+    )
+    group.addoption("--soak-tail-latency", type=float, default=8.0)
+    group.addoption("--soak-hedge", action="store_true", help="Enable request hedging.")
+
+
+def pytest_ignore_collect(collection_path: Path, config: pytest.Config) -> bool | None:
+    """Only collect the soak harness when asked to."""
+    if collection_path.name == "bench_soak.py" and not config.getoption("soak"):
+        return True
+    return None
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """Only check regressions once a baseline has been stored."""
+    storage = Path(config.getoption("benchmark_storage").removeprefix("file://"))
+    if not any(storage.glob("*/*.json")):
+        config.option.benchmark_compare = None
+        config.option.benchmark_compare_fail = None
+
+
+@pytest.fixture
+def loop():
+    """Return a dedicated event loop for the benchmark."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(autouse=True)
+def _allow_local_sockets(request: pytest.FixtureRequest) -> None:
+    """Let the benchmarks reach their local servers under pytest-socket."""
+    if request.config.pluginmanager.has_plugin("socket"):
+        request.getfixturevalue("socket_enabled")
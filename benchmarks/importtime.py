@@ -0,0 +1,140 @@
+"""Import time of the integration measured with `python -X importtime`.
+
+Home Assistant has already imported its core, helpers and the entity
+platforms when it loads the integration, so those are imported first and
+left out of the measure. Each run happens in a fresh interpreter and the
+median over the runs is reported:
+
+    python benchmarks/importtime.py --runs 5
+    python benchmarks/importtime.py --json > importtime.json
+
+With --budget the script exits with an error when the integration takes
+longer than the given number of milliseconds to import.
+"""
+
+import argparse
+import json
+from pathlib import Path
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+PACKAGE = "tesla_connector"
+MARKER = "tesla_connector importtime start"
+
+PRELOAD = (
+    "aiohttp",
+    "voluptuous",
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.event",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.components.binary_sensor",
+    "homeassistant.components.number",
+    "homeassistant.components.sensor",
+    "homeassistant.components.switch",
+)
+TARGETS = ("", ".binary_sensor", ".number", ".sensor", ".switch", ".config_flow")
+
+SCRIPT = f"""
+import importlib
+import importlib.util
+import sys
+
+for name in {PRELOAD!r}:
+    importlib.import_module(name)
+sys.stderr.write({MARKER!r} + "\\n")
+
+spec = importlib.util.spec_from_file_location(
+    {PACKAGE!r},
+    {str(ROOT / "__init__.py")!r},
+    submodule_search_locations=[{str(ROOT)!r}],
+)
+module = importlib.util.module_from_spec(spec)
+sys.modules[{PACKAGE!r}] = module
+spec.loader.exec_module(module)
+for target in {TARGETS[1:]!r}:
+    importlib.import_module({PACKAGE!r} + target)
+"""
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def measure() -> dict[str, int]:
+    """Return the self import time in microseconds of each module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    _, _, lines = result.stderr.partition(MARKER)
+    times = {}
+    for match in LINE.finditer(lines):
+        times[match.group(4)] = int(match.group(1))
+    return times
+
+
+def report(runs: int, top: int) -> dict:
+    """Return the median import times over the runs."""
+    samples = [measure() for _ in range(runs)]
+    modules = set().union(*samples)
+    median = {
+        module: statistics.median(sample.get(module, 0) for sample in samples)
+        for module in modules
+    }
+    own = {
+        module: value
+        for module, value in median.items()
+        if module == PACKAGE or module.startswith(f"{PACKAGE}.")
+    }
+    other = {module: value for module, value in median.items() if module not in own}
+    return {
+        "runs": runs,
+        "total_ms": round(sum(median.values()) / 1000, 2),
+        "integration_ms": round(sum(own.values()) / 1000, 2),
+        "dependencies_ms": round(sum(other.values()) / 1000, 2),
+        "integration_modules": len(own),
+        "dependency_modules": len(other),
+        "slowest": {
+            module: round(value / 1000, 2)
+            for module, value in sorted(
+                median.items(), key=lambda item: item[1], reverse=True
+            )[:top]
+        },
+    }
+
+
+def main() -> int:
+    """Print the import time report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", action="store_true")
+    parser.add_argument("--budget", type=float, help="maximum total in ms")
+    args = parser.parse_args()
+
+    result = report(args.runs, args.top)
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(
+            f"Total {result['total_ms']} ms: integration {result['integration_ms']} ms"
+            f" ({result['integration_modules']} modules), dependencies"
+            f" {result['dependencies_ms']} ms ({result['dependency_modules']} modules)"
+        )
+        for module, value in result["slowest"].items():
+            print(f"{value:>10.2f} ms  {module}")
+
+    if args.budget is not None and result["total_ms"] > args.budget:
+        print(f"Over the budget of {args.budget} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,300 @@
+"""Realistic Owner API payloads used by the benchmarks."""
+
+VIN = "5YJ3E7EB0KF000000"
+SITE_ID = "1234567890"
+
+VEHICLE_DATA = {
+    "id": 1492931520123456,
+    "user_id": 123456,
+    "vehicle_id": 1234567890,
+    "vin": VIN,
+    "color": None,
+    "access_type": "OWNER",
+    "display_name": "Model 3",
+    "granular_access": {"hide_private": False},
+    "tokens": ["0123456789abcdef", "fedcba9876543210"],
+    "state": "online",
+    "in_service": False,
+    "id_s": "1492931520123456",
+    "calendar_enabled": True,
+    "api_version": 71,
+    "backseat_token": None,
+    "backseat_token_updated_at": None,
+    "charge_state": {
+        "battery_heater_on": False,
+        "battery_level": 64,
+        "battery_range": 178.3,
+        "charge_amps": 16,
+        "charge_current_request": 16,
+        "charge_current_request_max": 32,
+        "charge_enable_request": True,
+        "charge_energy_added": 12.48,
+        "charge_limit_soc": 80,
+        "charge_limit_soc_max": 100,
+        "charge_limit_soc_min": 50,
+        "charge_limit_soc_std": 90,
+        "charge_miles_added_ideal": 61.5,
+        "charge_miles_added_rated": 52.0,
+        "charge_port_cold_weather_mode": False,
+        "charge_port_color": "<invalid>",
+        "charge_port_door_open": True,
+        "charge_port_latch": "Engaged",
+        "charge_rate": 21.3,
+        "charger_actual_current": 16,
+        "charger_phases": 3,
+        "charger_pilot_current": 32,
+        "charger_power": 11,
+        "charger_voltage": 229,
+        "charging_state": "Charging",
+        "conn_charge_cable": "IEC",
+        "est_battery_range": 160.12,
+        "fast_charger_brand": "<invalid>",
+        "fast_charger_present": False,
+        "fast_charger_type": "ACSingleWireCAN",
+        "ideal_battery_range": 210.45,
+        "managed_charging_active": False,
+        "managed_charging_start_time": None,
+        "managed_charging_user_canceled": False,
+        "max_range_charge_counter": 0,
+        "minutes_to_full_charge": 55,
+        "not_enough_power_to_heat": None,
+        "off_peak_charging_enabled": False,
+        "off_peak_charging_times": "all_week",
+        "off_peak_hours_end_time": 360,
+        "preconditioning_enabled": False,
+        "preconditioning_times": "all_week",
+        "scheduled_charging_mode": "Off",
+        "scheduled_charging_pending": False,
+        "scheduled_charging_start_time": None,
+        "scheduled_departure_time": 1634914800,
+        "scheduled_departure_time_minutes": 480,
+        "supercharger_session_trip_planner": False,
+        "time_to_full_charge": 0.92,
+        "timestamp": 1700000000000,
+        "trip_charging": False,
+        "usable_battery_level": 63,
+        "user_charge_enable_request": None,
+    },
+    "climate_state": {
+        "allow_cabin_overheat_protection": True,
+        "auto_seat_climate_left": False,
+        "auto_seat_climate_right": False,
+        "battery_heater": False,
+        "battery_heater_no_power": None,
+        "cabin_overheat_protection": "On",
+        "cabin_overheat_protection_actively_cooling": False,
+        "climate_keeper_mode": "off",
+        "defrost_mode": 0,
+        "driver_temp_setting": 21,
+        "fan_status": 0,
+        "hvac_auto_request": "On",
+        "inside_temp": 17.2,
+        "is_auto_conditioning_on": False,
+        "is_climate_on": False,
+        "is_front_defroster_on": False,
+        "is_preconditioning": False,
+        "is_rear_defroster_on": False,
+        "left_temp_direction": 0,
+        "max_avail_temp": 28,
+        "min_avail_temp": 15,
+        "outside_temp": 9.5,
+        "passenger_temp_setting": 21,
+        "remote_heater_control_enabled": False,
+        "right_temp_direction": 0,
+        "seat_heater_left": 0,
+        "seat_heater_rear_center": 0,
+        "seat_heater_rear_left": 0,
+        "seat_heater_rear_right": 0,
+        "seat_heater_right": 0,
+        "side_mirror_heaters": False,
+        "steering_wheel_heater": False,
+        "supports_fan_only_cabin_overheat_protection": True,
+        "timestamp": 1700000000000,
+        "wiper_blade_heater": False,
+    },
+    "drive_state": {
+        "active_route_latitude": 48.8566,
+        "active_route_longitude": 2.3522,
+        "active_route_traffic_minutes_delay": 0,
+        "gps_as_of": 1699999990,
+        "heading": 182,
+        "latitude": 48.8566,
+        "longitude": 2.3522,
+        "native_latitude": 48.8566,
+        "native_location_supported": 1,
+        "native_longitude": 2.3522,
+        "native_type": "wgs",
+        "power": -11,
+        "shift_state": None,
+        "speed": None,
+        "timestamp": 1700000000000,
+    },
+    "gui_settings": {
+        "gui_24_hour_time": True,
+        "gui_charge_rate_units": "km/hr",
+        "gui_distance_units": "km/hr",
+        "gui_range_display": "Rated",
+        "gui_temperature_units": "C",
+        "gui_tirepressure_units": "Bar",
+        "show_range_units": False,
+        "timestamp": 1700000000000,
+    },
+    "vehicle_config": {
+        "aux_park_lamps": "Eu",
+        "badge_version": 0,
+        "can_accept_navigation_requests": True,
+        "can_actuate_trunks": True,
+        "car_special_type": "base",
+        "car_type": "model3",
+        "charge_port_type": "CCS",
+        "cop_user_set_temp_supported": True,
+        "dashcam_clip_save_supported": True,
+        "default_charge_to_max": False,
+        "driver_assist": "TeslaAP3",
+        "ece_restrictions": True,
+        "efficiency_package": "M32021",
+        "eu_vehicle": True,
+        "exterior_color": "MidnightSilver",
+        "exterior_trim": "Black",
+        "has_air_suspension": False,
+        "has_ludicrous_mode": False,
+        "has_seat_cooling": False,
+        "headlamp_type": "Premium",
+        "interior_trim_type": "Black2",
+        "motorized_charge_port": True,
+        "plg": True,
+        "pws": True,
+        "rear_drive_unit": "PM216MOSFET",
+        "rear_seat_heaters": 1,
+        "rhd": False,
+        "roof_color": "RoofColorGlass",
+        "spoiler_type": "None",
+        "supports_qr_pairing": False,
+        "third_row_seats": "None",
+        "timestamp": 1700000000000,
+        "trim_badging": "74d",
+        "use_range_badging": True,
+        "utc_offset": 3600,
+        "webcam_selfie_supported": True,
+        "webcam_supported": True,
+        "wheel_type": "Pinwheel18CapKit",
+    },
+    "vehicle_state": {
+        "api_version": 71,
+        "autopark_state_v2": "unavailable",
+        "calendar_supported": True,
+        "car_version": "2023.44.30.1 a1b2c3d4e5f6",
+        "center_display_state": 0,
+        "dashcam_clip_save_available": True,
+        "dashcam_state": "Recording",
+        "df": 0,
+        "dr": 0,
+        "fd_window": 0,
+        "feature_bitmask": "fbdffbff,187f",
+        "fp_window": 0,
+        "ft": 0,
+        "is_user_present": False,
+        "locked": True,
+        "media_info": {
+            "a2dp_source_name": "",
+            "audio_volume": 2.3333,
+            "audio_volume_increment": 0.333333,
+            "audio_volume_max": 10.333333,
+            "media_playback_status": "Stopped",
+            "now_playing_album": "",
+            "now_playing_artist": "",
+            "now_playing_duration": 0,
+            "now_playing_elapsed": 0,
+            "now_playing_source": "Spotify",
+            "now_playing_station": "",
+            "now_playing_title": "",
+        },
+        "media_state": {"remote_control_enabled": True},
+        "notifications_supported": True,
+        "odometer": 25831.442,
+        "parsed_calendar_supported": True,
+        "pf": 0,
+        "pr": 0,
+        "rd_window": 0,
+        "remote_start": False,
+        "remote_start_enabled": True,
+        "remote_start_supported": True,
+        "rp_window": 0,
+        "rt": 0,
+        "santa_mode": 0,
+        "sentry_mode": False,
+        "sentry_mode_available": True,
+        "service_mode": False,
+        "service_mode_plus": False,
+        "software_update": {
+            "download_perc": 0,
+            "expected_duration_sec": 2700,
+            "install_perc": 1,
+            "status": "",
+            "version": " ",
+        },
+        "speed_limit_mode": {
+            "active": False,
+            "current_limit_mph": 85,
+            "max_limit_mph": 120,
+            "min_limit_mph": 50,
+            "pin_code_set": False,
+        },
+        "timestamp": 1700000000000,
+        "tpms_hard_warning_fl": False,
+        "tpms_pressure_fl": 2.9,
+        "tpms_pressure_fr": 2.9,
+        "tpms_pressure_rl": 2.875,
+        "tpms_pressure_rr": 2.9,
+        "valet_mode": False,
+        "valet_pin_needed": True,
+        "vehicle_name": "Model 3",
+        "vehicle_self_test_progress": 0,
+        "vehicle_self_test_requested": False,
+        "webcam_available": True,
+    },
+}
+
+SITE_LIVE_STATUS = {
+    "solar_power": 4210.0,
+    "battery_power": -1520.0,
+    "grid_power": 12030.0,
+    "load_power": 14720.0,
+    "grid_status": "Active",
+    "island_status": "on_grid",
+    "storm_mode_active": False,
+    "percentage_charged": 78.4,
+    "energy_left": 10584.0,
+    "total_pack_energy": 13500.0,
+    "backup_capable": True,
+    "timestamp": "2024-05-01T18:32:10+02:00",
+    "wall_connectors": [
+        {
+            "din": "1529455-02-D--PGT22125000001",
+            "vin": VIN,
+            "wall_connector_state": 1,
+            "wall_connector_fault_state": 2,
+            "wall_connector_power": 11040.0,
+            "ocpp_status": 1,
+            "powershare_session_state": 0,
+        },
+        {
+            "din": "1529455-02-D--PGT22125000002",
+            "vin": "",
+            "wall_connector_state": 2,
+            "wall_connector_fault_state": 2,
+            "wall_connector_power": 0.0,
+            "ocpp_status": 1,
+            "powershare_session_state": 0,
+        },
+        {
+            "din": "1529455-02-D--PGT22125000003",
+            "vin": "5YJ3E7EB0KF000001",
+            "wall_connector_state": 10,
+            "wall_connector_fault_state": 2,
+            "wall_connector_power": 3680.0,
+            "ocpp_status": 1,
+            "powershare_session_state": 1,
+        },
+    ],
+}
@@ -0,0 +1,365 @@
+"""Local stand-in of the Owner API simulating vehicles and wall connectors.
+
+Vehicles fall asleep when nothing talks to them, wake up on request, get
+plugged in and out of their site wall connector on a fixed schedule and
+charge while plugged in. Time comes from `time.time()` so the simulation
+follows a frozen or accelerated clock.
+
+It can also be served on its own, for instance for the owner_api CLI:
+
+    python benchmarks/standin.py --vehicles 3 --sites 1 --port 8080
+"""
+
+import argparse
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+import random
+import time
+
+from aiohttp import web
+
+SLEEP_AFTER = 10 * 60  # seconds without activity before the vehicle sleeps
+CHARGE_POWER = 11  # kW
+BATTERY_CAPACITY = 75  # kWh
+
+
+@dataclass
+class SimulatedVehicle:
+    """State of a simulated vehicle."""
+
+    vin: str
+    site_id: str
+    plug_period: float
+    plug_offset: float
+    battery_level: float = 50.0
+    charge_limit_soc: int = 80
+    charge_amps: int = 16
+    charge_energy_added: float = 0.0
+    charging_enabled: bool = True
+    locked: bool = True
+    asleep: bool = False
+    last_activity: float = field(default_factory=time.time)
+    last_update: float = field(default_factory=time.time)
+
+    def plugged_in(self, now: float) -> bool:
+        """Return whether the vehicle is plugged in, half of each period."""
+        return (now + self.plug_offset) % self.plug_period < self.plug_period / 2
+
+    def charging(self, now: float) -> bool:
+        """Return whether the vehicle is charging."""
+        return (
+            self.plugged_in(now)
+            and self.charging_enabled
+            and self.battery_level < self.charge_limit_soc
+        )
+
+    def advance(self, now: float) -> None:
+        """Advance the simulation to now."""
+        elapsed = now - self.last_update
+        self.last_update = now
+        if self.charging(now):
+            energy = CHARGE_POWER * self.charge_amps / 16 * elapsed / 3600
+            self.charge_energy_added += energy
+            self.battery_level = min(
+                self.charge_limit_soc,
+                self.battery_level + energy / BATTERY_CAPACITY * 100,
+            )
+        elif not self.plugged_in(now):
+            self.charge_energy_added = 0.0
+            if self.battery_level > 20:
+                self.battery_level -= 2 * elapsed / 3600
+        if not self.charging(now) and now - self.last_activity > SLEEP_AFTER:
+            self.asleep = True
+
+    def touch(self, now: float) -> None:
+        """Record activity keeping the vehicle awake."""
+        self.last_activity = now
+
+    def run_command(self, command: str, body: dict) -> None:
+        """Apply a vehicle command."""
+        if command == "charge_start":
+            self.charging_enabled = True
+        elif command == "charge_stop":
+            self.charging_enabled = False
+        elif command == "set_charging_amps":
+            self.charge_amps = int(body["charging_amps"])
+        elif command == "set_charge_limit":
+            self.charge_limit_soc = int(body["percent"])
+        elif command == "door_lock":
+            self.locked = True
+        elif command == "door_unlock":
+            self.locked = False
+
+    def payload(self, now: float, endpoints: str | None = None) -> dict:
+        """Return the vehicle_data payload, only the requested sections if any."""
+        charging = self.charging(now)
+        if charging:
+            charging_state = "Charging"
+        elif self.plugged_in(now):
+            charging_state = "Stopped"
+        else:
+            charging_state = "Disconnected"
+        payload = {
+            "vin": self.vin,
+            "state": "asleep" if self.asleep else "online",
+            "charge_state": {
+                "battery_level": round(self.battery_level),
+                "battery_range": self.battery_level * 3,
+                "charge_amps": self.charge_amps,
+                "charge_current_request": self.charge_amps,
+                "charge_current_request_max": 32,
+                "charge_energy_added": round(self.charge_energy_added, 2),
+                "charge_limit_soc": self.charge_limit_soc,
+                "charger_actual_current": self.charge_amps if charging else 0,
+                "charger_phases": 3 if charging else None,
+                "charger_power": CHARGE_POWER if charging else 0,
+                "charger_voltage": 230 if charging else 0,
+                "charging_state": charging_state,
+                "minutes_to_full_charge": 60 if charging else 0,
+                "timestamp": int(now * 1000),
+            },
+            "vehicle_state": {
+                "odometer": 25000.0,
+                "locked": self.locked,
+                "timestamp": int(now * 1000),
+            },
+            "drive_state": {"shift_state": None, "timestamp": int(now * 1000)},
+            "climate_state": {"inside_temp": 18.0, "timestamp": int(now * 1000)},
+            "vehicle_config": {"car_type": "model3", "timestamp": int(now * 1000)},
+            "gui_settings": {
+                "gui_distance_units": "km/hr",
+                "timestamp": int(now * 1000),
+            },
+        }
+        if endpoints:
+            sections = set(endpoints.split(";"))
+            payload = {
+                key: value
+                for key, value in payload.items()
+                if not isinstance(value, dict) or key in sections
+            }
+        return payload
+
+
+class OwnerAPIStandIn:
+    """aiohttp application answering like the Owner API."""
+
+    def __init__(
+        self,
+        vehicles: int,
+        sites: int,
+        latency: float = 0.0,
+        plug_period: float = 12 * 3600,
+        seed: int = 0,
+        tail_ratio: float = 0.0,
+        tail_latency: float = 0.0,
+    ) -> None:
+        """Initialize the simulated fleet.
+
+        A `tail_ratio` fraction of the requests is answered after
+        `tail_latency` instead of `latency`.
+        """
+        rng = random.Random(seed)
+        self._rng = random.Random(seed + 1)
+        self.latency = latency
+        self.tail_ratio = tail_ratio
+        self.tail_latency = tail_latency
+        self.request_counts: Counter[str] = Counter()
+        self.delayed = 0  # requests waiting for the simulated latency
+        self.site_ids = [str(1_000_000_000 + index) for index in range(sites)]
+        self.vehicles: dict[str, SimulatedVehicle] = {}
+        for index in range(vehicles):
+            vin = f"5YJ3SIM{index:010d}"
+            self.vehicles[vin] = SimulatedVehicle(
+                vin,
+                self.site_ids[index % sites],
+                plug_period,
+                rng.uniform(0, plug_period),
+                battery_level=rng.uniform(20, 80),
+            )
+
+        self.app = web.Application(middlewares=[self._middleware])
+        self.app.router.add_post("/oauth2/v3/token", self._token)
+        self.app.router.add_post("/api/1/vehicles/{vin}/wake_up", self._wake_up)
+        self.app.router.add_get(
+            "/api/1/vehicles/{vin}/vehicle_data", self._vehicle_data
+        )
+        self.app.router.add_post(
+            "/api/1/vehicles/{vin}/command/{command}", self._command
+        )
+        self.app.router.add_get(
+            "/api/1/energy_sites/{site_id}/live_status", self._live_status
+        )
+        self.app.router.add_get("/api/1/products", self._products)
+        self.app.router.add_get("/api/1/vehicles/{vin}", self._vehicle)
+
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+        self.token_url = ""
+
+    async def async_start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Serve the stand-in."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.base_url = f"http://{host}:{port}/api/1"
+        self.token_url = f"http://{host}:{port}/oauth2/v3/token"
+
+    async def async_stop(self) -> None:
+        """Stop serving the stand-in."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Count requests and add the simulated latency."""
+        self.request_counts[request.match_info.route.resource.canonical] += 1
+        latency = self.latency
+        if self.tail_ratio and self._rng.random() < self.tail_ratio:
+            latency = self.tail_latency
+        if latency:
+            self.delayed += 1
+            try:
+                await asyncio.sleep(latency)
+            finally:
+                self.delayed -= 1
+        return await handler(request)
+
+    def _vehicle_from(self, request: web.Request) -> SimulatedVehicle:
+        """Return the advanced vehicle of the request."""
+        vehicle = self.vehicles.get(request.match_info["vin"])
+        if vehicle is None:
+            raise web.HTTPNotFound
+        vehicle.advance(time.time())
+        return vehicle
+
+    async def _token(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"access_token": "standin-access", "refresh_token": "standin-refresh"}
+        )
+
+    async def _wake_up(self, request: web.Request) -> web.Response:
+        vehicle = self._vehicle_from(request)
+        vehicle.asleep = False
+        vehicle.touch(time.time())
+        return web.json_response({"response": {"state": "online"}})
+
+    async def _vehicle(self, request: web.Request) -> web.Response:
+        vehicle = self._vehicle_from(request)
+        state = "asleep" if vehicle.asleep else "online"
+        return web.json_response({"response": {"vin": vehicle.vin, "state": state}})
+
+    async def _vehicle_data(self, request: web.Request) -> web.Response:
+        vehicle = self._vehicle_from(request)
+        if vehicle.asleep:
+            return web.json_response({"error": "vehicle unavailable"}, status=408)
+        now = time.time()
+        vehicle.touch(now)
+        payload = vehicle.payload(now, request.query.get("endpoints"))
+        return web.json_response({"response": payload})
+
+    async def _command(self, request: web.Request) -> web.Response:
+        vehicle = self._vehicle_from(request)
+        if vehicle.asleep:
+            return web.json_response({"error": "vehicle unavailable"}, status=408)
+        vehicle.touch(time.time())
+        body = await request.json() if request.can_read_body else {}
+        vehicle.run_command(request.match_info["command"], body)
+        return web.json_response({"response": {"result": True, "reason": ""}})
+
+    async def _live_status(self, request: web.Request) -> web.Response:
+        site_id = request.match_info["site_id"]
+        now = time.time()
+        connectors = []
+        for index, vehicle in enumerate(self.vehicles.values()):
+            if vehicle.site_id != site_id:
+                continue
+            vehicle.advance(now)
+            plugged_in = vehicle.plugged_in(now)
+            charging = vehicle.charging(now)
+            connectors.append(
+                {
+                    "din": f"1529455-02-D--SIM{index:010d}",
+                    "vin": vehicle.vin if plugged_in else "",
+                    "wall_connector_state": 1 if charging else 4 if plugged_in else 2,
+                    "wall_connector_fault_state": 2,
+                    "wall_connector_power": CHARGE_POWER * 1000 if charging else 0.0,
+                    "ocpp_status": 1,
+                    "powershare_session_state": 0,
+                }
+            )
+        power = sum(connector["wall_connector_power"] for connector in connectors)
+        return web.json_response(
+            {
+                "response": {
+                    "solar_power": 4000.0,
+                    "battery_power": 0.0,
+                    "grid_power": power - 4000.0,
+                    "load_power": power,
+                    "percentage_charged": 80.0,
+                    "grid_status": "Active",
+                    "island_status": "on_grid",
+                    "storm_mode_active": False,
+                    "timestamp": int(now),
+                    "wall_connectors": connectors,
+                }
+            }
+        )
+
+    async def _products(self, request: web.Request) -> web.Response:
+        products = [
+            {
+                "vin": vehicle.vin,
+                "display_name": f"Simulated {vehicle.vin[-4:]}",
+                "state": "asleep" if vehicle.asleep else "online",
+            }
+            for vehicle in self.vehicles.values()
+        ]
+        products += [
+            {
+                "energy_site_id": int(site_id),
+                "resource_type": "battery",
+                "site_name": f"Site {site_id}",
+                "components": {"wall_connectors": [{"device_id": site_id}]},
+            }
+            for site_id in self.site_ids
+        ]
+        return web.json_response({"response": products, "count": len(products)})
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Serve the stand-in until interrupted."""
+    standin = OwnerAPIStandIn(
+        args.vehicles,
+        args.sites,
+        args.latency,
+        tail_ratio=args.tail_ratio,
+        tail_latency=args.tail_latency,
+    )
+    await standin.async_start(args.host, args.port)
+    print(f"Owner API stand-in on {standin.base_url}")
+    print(f"Token URL {standin.token_url}")
+    print("Vehicles:", ", ".join(standin.vehicles))
+    print("Sites:", ", ".join(standin.site_ids))
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await standin.async_stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vehicles", type=int, default=1)
+    parser.add_argument("--sites", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--tail-ratio", type=float, default=0.0)
+    parser.add_argument("--tail-latency", type=float, default=8.0)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    try:
+        asyncio.run(_async_main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
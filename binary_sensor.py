@@ -1,31 +1,23 @@
 """Binary sensor platform for Tesla Connector."""
 
-from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .base_sensor import TeslaBaseBinarySensor, TeslaSensorDescription
-from .const import BINARY_SENSOR_LOCKED, DOMAIN, SENSOR_VEHICLE_STATE
-from .coordinator import TeslaVehicleCoordinator
-from .models.vehicle.vehicle import TeslaVehicle
-
-BINARY_SENSOR_DESCRIPTIONS: dict[str, TeslaSensorDescription] = {
-    BINARY_SENSOR_LOCKED: TeslaSensorDescription(
-        name="Véhicule verrouillé",
-        value_path="vehicle_state.locked",
-        device_class=BinarySensorDeviceClass.LOCK,
-        on_value="Vérrouillé",
-        off_value="Déverrouillé",
-    ),
-    SENSOR_VEHICLE_STATE: TeslaSensorDescription(
-        name="État du véhicule",
-        value_path="state",
-        icon="mdi:car-connected",
-        on_value="En ligne",
-        off_value="Endormie",
-    ),
-}
+from .base_sensor import TeslaBaseBinarySensor
+from .const import DOMAIN, SENSOR_VEHICLE_STATE
+from .entity_descriptions import (
+    BINARY_SENSOR_DESCRIPTIONS,
+    GENERATED_BINARY_SENSOR_DESCRIPTIONS,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import TeslaVehicleCoordinator
+    from .models.vehicle.vehicle import TeslaVehicle
 
 
 async def async_setup_entry(
@@ -37,7 +29,10 @@ async def async_setup_entry(
     coordinator: TeslaVehicleCoordinator = hass.data[DOMAIN][entry.entry_id]["vehicle"]
     binary_sensors = []
 
-    for sensor_key, sensor_description in BINARY_SENSOR_DESCRIPTIONS.items():
+    for sensor_key, sensor_description in {
+        **BINARY_SENSOR_DESCRIPTIONS,
+        **GENERATED_BINARY_SENSOR_DESCRIPTIONS,
+    }.items():
         binary_sensors.append(
             TeslaBinarySensor(coordinator, sensor_key, sensor_description)
         )
@@ -0,0 +1,203 @@
+"""Closed-loop charge amps controller for Tesla Connector."""
+
+import asyncio
+from collections import deque
+from datetime import datetime, timedelta
+import logging
+import math
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN, UnitOfPower
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+
+from .const import CONTROLLER_DEFAULT_VOLTAGE, CONTROLLER_MAX_AMPS, CONTROLLER_MIN_AMPS
+from .coordinator import TeslaVehicleCoordinator
+from .models.vehicle.vehicle_data import ChargingState, VehicleChargeState
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ChargeAmpsController:
+    """Follow a target power by adjusting the charge amps of the vehicle.
+
+    The setpoint only changes when it moves by at least `hysteresis` amps, no
+    sooner than `hold_time` after the previous command and while the hourly
+    command budget is not exhausted.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: TeslaVehicleCoordinator,
+        target_entity_id: str,
+        hysteresis: int,
+        hold_time: int,
+        max_commands_per_hour: int,
+    ) -> None:
+        """Initialize the controller."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._target_entity_id = target_entity_id
+        self._hysteresis = hysteresis
+        self._hold_time = timedelta(seconds=hold_time)
+        self._max_commands_per_hour = max_commands_per_hour
+
+        self._setpoint: int | None = None
+        self._command_times: deque[datetime] = deque()
+        self._command_task: asyncio.Task | None = None
+        self._unsub_hold: CALLBACK_TYPE | None = None
+
+    @property
+    def setpoint(self) -> int | None:
+        """Return the charge amps of the vehicle, or the last ones sent."""
+        return self._setpoint
+
+    @property
+    def commands_last_hour(self) -> int:
+        """Return the number of commands sent during the last hour."""
+        self._purge_command_times(datetime.now())
+        return len(self._command_times)
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start following the target power, return a callback to stop."""
+        unsub_target = async_track_state_change_event(
+            self._hass, [self._target_entity_id], self._async_handle_target_change
+        )
+        unsub_coordinator = self._coordinator.async_add_listener(
+            self._async_handle_coordinator_update
+        )
+
+        @callback
+        def _stop() -> None:
+            unsub_target()
+            unsub_coordinator()
+            if self._unsub_hold is not None:
+                self._unsub_hold()
+                self._unsub_hold = None
+            if self._command_task is not None:
+                self._command_task.cancel()
+
+        return _stop
+
+    @callback
+    def _async_handle_coordinator_update(self) -> None:
+        """Follow the charge amps set elsewhere, then re-evaluate the setpoint.
+
+        Data fetched before the last command may not show it yet, the setpoint
+        only follows data fetched after it.
+        """
+        data = self._coordinator.data
+        last_fetch = self._coordinator.vehicle.last_data_fetch
+        if (
+            data is not None
+            and data.charge_state.charge_current_request is not None
+            and (self._command_task is None or self._command_task.done())
+            and (
+                not self._command_times
+                or (last_fetch is not None and last_fetch > self._command_times[-1])
+            )
+        ):
+            self._setpoint = data.charge_state.charge_current_request
+        self._async_evaluate()
+
+    @callback
+    def _async_handle_target_change(self, event: Event) -> None:
+        """Re-evaluate the setpoint when the target power changes."""
+        self._async_evaluate()
+
+    def _target_power(self) -> float | None:
+        """Return the target power in W."""
+        state = self._hass.states.get(self._target_entity_id)
+        if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            return None
+        try:
+            power = float(state.state)
+        except ValueError:
+            return None
+
+        if state.attributes.get("unit_of_measurement") == UnitOfPower.KILO_WATT:
+            power *= 1000
+        return power
+
+    @staticmethod
+    def _desired_amps(power: float, charge_state: VehicleChargeState) -> int:
+        """Return the charge amps matching the target power."""
+        voltage = charge_state.charger_voltage
+        if not voltage or voltage < 100:
+            voltage = CONTROLLER_DEFAULT_VOLTAGE
+        phases = charge_state.charger_phases or 1
+        max_amps = charge_state.charge_current_request_max or CONTROLLER_MAX_AMPS
+
+        amps = math.floor(power / (voltage * phases))
+        return max(CONTROLLER_MIN_AMPS, min(max_amps, amps))
+
+    def _purge_command_times(self, now: datetime) -> None:
+        """Forget commands older than an hour."""
+        while self._command_times and now - self._command_times[0] > timedelta(hours=1):
+            self._command_times.popleft()
+
+    @callback
+    def _async_evaluate(self) -> None:
+        """Send a new setpoint to the vehicle if it is worth it."""
+        data = self._coordinator.data
+        power = self._target_power()
+        if (
+            data is None
+            or power is None
+            or data.charge_state.charging_state != ChargingState.CHARGING
+            or (self._command_task is not None and not self._command_task.done())
+        ):
+            return
+
+        charge_state = data.charge_state
+        desired = self._desired_amps(power, charge_state)
+        current = (
+            self._setpoint
+            if self._setpoint is not None
+            else charge_state.charge_current_request
+        )
+        if abs(desired - current) < self._hysteresis:
+            return
+
+        now = datetime.now()
+        if self._command_times and now - self._command_times[-1] < self._hold_time:
+            if self._unsub_hold is None:
+                self._unsub_hold = async_call_later(
+                    self._hass,
+                    self._command_times[-1] + self._hold_time - now,
+                    self._async_hold_expired,
+                )
+            return
+
+        self._purge_command_times(now)
+        if len(self._command_times) >= self._max_commands_per_hour:
+            _LOGGER.debug(
+                "Command budget of %d per hour reached, keeping %sA",
+                self._max_commands_per_hour,
+                current,
+            )
+            return
+
+        self._command_times.append(now)
+        self._command_task = self._hass.async_create_background_task(
+            self._async_set_charge_amps(desired),
+            name=f"Tesla vehicle {self._coordinator.vehicle.vin} charge amps",
+        )
+
+    @callback
+    def _async_hold_expired(self, _now: datetime) -> None:
+        """Re-evaluate the setpoint once the hold time is over."""
+        self._unsub_hold = None
+        self._async_evaluate()
+
+    async def _async_set_charge_amps(self, amps: int) -> None:
+        """Send the new charge amps to the vehicle."""
+        _LOGGER.debug("Setting charge amps to %sA to follow target power", amps)
+        try:
+            await self._coordinator.vehicle.async_set_charge_amps(amps, automatic=True)
+        except Exception:
+            _LOGGER.exception("Error setting charge amps to %sA", amps)
+            return
+
+        self._setpoint = amps
@@ -0,0 +1,67 @@
+"""Clock of the time-dependent vehicle and Owner API client logic."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import heapq
+import itertools
+import time
+
+
+class Clock:
+    """Wall clock, monotonic clock and sleeps, read from the system."""
+
+    def now(self) -> datetime:
+        """Return the local time."""
+        return datetime.now()
+
+    def monotonic(self) -> float:
+        """Return seconds of a clock that never goes back."""
+        return time.monotonic()
+
+    async def sleep(self, seconds: float) -> None:
+        """Sleep on the event loop."""
+        await asyncio.sleep(seconds)
+
+
+class FakeClock(Clock):
+    """Virtual clock whose sleeps return right away, in virtual deadline order.
+
+    A sleeping task lets the other ready tasks run once, then the clock jumps
+    to the earliest deadline among the sleepers and wakes that one. Scenarios
+    of hours, where tasks only wait on the clock, run in milliseconds.
+    """
+
+    def __init__(self, start: datetime | None = None) -> None:
+        """Initialize the clock, at midnight on January 1st 2024 by default."""
+        self._start = start or datetime(2024, 1, 1)
+        self._elapsed = 0.0
+        self._order = itertools.count()
+        self._sleepers: list[tuple[float, int]] = []
+
+    def now(self) -> datetime:
+        """Return the virtual local time."""
+        return self._start + timedelta(seconds=self._elapsed)
+
+    def monotonic(self) -> float:
+        """Return the virtual seconds elapsed since the start."""
+        return self._elapsed
+
+    async def sleep(self, seconds: float) -> None:
+        """Return once the other sleepers with earlier deadlines woke up."""
+        sleeper = (self._elapsed + max(seconds, 0), next(self._order))
+        heapq.heappush(self._sleepers, sleeper)
+        try:
+            await asyncio.sleep(0)
+            while self._sleepers[0] is not sleeper:
+                await asyncio.sleep(0)
+        except BaseException:
+            self._sleepers.remove(sleeper)
+            heapq.heapify(self._sleepers)
+            raise
+        heapq.heappop(self._sleepers)
+        self._elapsed = max(self._elapsed, sleeper[0])
+
+
+SYSTEM_CLOCK = Clock()
@@ -1,10 +1,65 @@
 """Config flow for Tesla Connector."""
 
+from __future__ import annotations
+
+from asyncio import TimeoutError
+from collections.abc import Mapping
+from importlib import import_module
+import logging
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import ClientError
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.core import callback
+from homeassistant.helpers import selector
+
+from .const import (
+    CONF_CHARGING_ANALYTICS,
+    CONF_HEDGE_REQUESTS,
+    CONF_HYSTERESIS_AMPS,
+    CONF_MAX_COMMANDS_PER_HOUR,
+    CONF_MIN_HOLD_TIME,
+    CONF_PREWAKE,
+    CONF_REFRESH_TOKEN,
+    CONF_TARGET_POWER_ENTITY,
+    CONF_VIN,
+    CONF_WALL_CONNECTOR_ID,
+    DEFAULT_CHARGING_ANALYTICS,
+    DEFAULT_HEDGE_REQUESTS,
+    DEFAULT_HYSTERESIS_AMPS,
+    DEFAULT_MAX_COMMANDS_PER_HOUR,
+    DEFAULT_MIN_HOLD_TIME,
+    DEFAULT_PREWAKE,
+    DOMAIN,
+)
+from .owner_api.exceptions import TeslaBaseException, TeslaTokenException
+
+if TYPE_CHECKING:
+    from .discovery import TeslaProducts
+    from .owner_api.client import TeslaAPIClient
 
-from .const import CONF_REFRESH_TOKEN, CONF_VIN, CONF_WALL_CONNECTOR_ID, DOMAIN
+_LOGGER = logging.getLogger(__name__)
+
+TOKEN_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_REFRESH_TOKEN): str,
+    }
+)
+
+
+def _select(options: dict[str, str]) -> selector.SelectSelector:
+    """Return a dropdown of the given values and labels."""
+    return selector.SelectSelector(
+        selector.SelectSelectorConfig(
+            options=[
+                selector.SelectOptionDict(value=value, label=f"{label} ({value})")
+                for value, label in options.items()
+            ],
+            mode=selector.SelectSelectorMode.DROPDOWN,
+        )
+    )
 
 
 class TeslaConnectorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -12,49 +67,202 @@ class TeslaConnectorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def __init__(self) -> None:
         """Initialize the config flow."""
-        self.data = {}
+        self._products: TeslaProducts | None = None
+        self._entry: config_entries.ConfigEntry | None = None
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> TeslaConnectorOptionsFlow:
+        """Return the options flow."""
+        return TeslaConnectorOptionsFlow(config_entry)
+
+    async def _async_fetch_products(
+        self, refresh_token: str, client: TeslaAPIClient | None = None
+    ) -> dict[str, str]:
+        """Fetch the products of the account, return the errors."""
+        # The Owner API stack is only imported once the flow talks to it
+        await self.hass.async_add_import_executor_job(
+            import_module, ".discovery", __package__
+        )
+        from .discovery import async_get_products
+
+        try:
+            self._products = await async_get_products(self.hass, refresh_token, client)
+        except TeslaTokenException:
+            return {"base": "invalid_auth"}
+        except (ClientError, TimeoutError, TeslaBaseException) as err:
+            _LOGGER.debug("Error fetching the products: %s", err)
+            return {"base": "cannot_connect"}
+        return {}
 
     async def async_step_user(self, user_input=None):
         """Handle the user step."""
+        errors = {}
         if user_input is not None:
-            self.data[CONF_REFRESH_TOKEN] = user_input[CONF_REFRESH_TOKEN]
-            return await self.async_step_vehicle()
+            errors = await self._async_fetch_products(user_input[CONF_REFRESH_TOKEN])
+            if not errors:
+                return await self.async_step_devices()
 
         return self.async_show_form(
-            step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_REFRESH_TOKEN): str,
-                }
-            ),
+            step_id="user", data_schema=TOKEN_SCHEMA, errors=errors
         )
 
-    async def async_step_vehicle(self, user_input=None):
-        """Handle the vehicle step."""
+    async def async_step_devices(self, user_input=None):
+        """Handle the choice of the vehicle and of the wall connector site."""
+        products = self._products
+        if not products.vehicles:
+            return self.async_abort(reason="no_vehicles")
+        if not products.energy_sites:
+            return self.async_abort(reason="no_energy_sites")
+
+        errors = {}
         if user_input is not None:
-            self.data[CONF_VIN] = user_input[CONF_VIN]
-            return await self.async_step_wall_connector()
+            from .discovery import async_validate_devices
+
+            vin = user_input[CONF_VIN]
+            if self._entry is None or vin != self._entry.unique_id:
+                await self.async_set_unique_id(vin, raise_on_progress=False)
+                self._abort_if_unique_id_configured()
+
+            errors = await async_validate_devices(
+                products, vin, user_input[CONF_WALL_CONNECTOR_ID]
+            )
+            if not errors:
+                data = {CONF_REFRESH_TOKEN: products.client.refresh_token, **user_input}
+                if self._entry is not None:
+                    return self.async_update_reload_and_abort(
+                        self._entry,
+                        unique_id=vin,
+                        title=products.vehicles[vin],
+                        data=data,
+                        reason="reconfigure_successful",
+                    )
+                return self.async_create_entry(title=products.vehicles[vin], data=data)
 
+        current = user_input or (self._entry.data if self._entry is not None else {})
         return self.async_show_form(
-            step_id="vehicle",
+            step_id="devices",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_VIN): str,
+                    vol.Required(
+                        CONF_VIN,
+                        default=current.get(CONF_VIN, next(iter(products.vehicles))),
+                    ): _select(products.vehicles),
+                    vol.Required(
+                        CONF_WALL_CONNECTOR_ID,
+                        default=current.get(
+                            CONF_WALL_CONNECTOR_ID, next(iter(products.energy_sites))
+                        ),
+                    ): _select(products.energy_sites),
                 }
             ),
+            errors=errors,
         )
 
-    async def async_step_wall_connector(self, user_input=None):
-        """Handle the wall connector step."""
+    async def async_step_reauth(self, entry_data: Mapping[str, Any]):
+        """Handle a rejected refresh token."""
+        self._entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(self, user_input=None):
+        """Ask for a new refresh token."""
+        errors = {}
         if user_input is not None:
-            self.data[CONF_WALL_CONNECTOR_ID] = user_input[CONF_WALL_CONNECTOR_ID]
-            return self.async_create_entry(title="Tesla Connector", data=self.data)
+            errors = await self._async_fetch_products(user_input[CONF_REFRESH_TOKEN])
+            if not errors and self._entry.data[CONF_VIN] not in self._products.vehicles:
+                errors = {"base": "vehicle_not_found"}
+            if not errors:
+                return self.async_update_reload_and_abort(
+                    self._entry,
+                    data={
+                        **self._entry.data,
+                        CONF_REFRESH_TOKEN: self._products.client.refresh_token,
+                    },
+                )
+
+        return self.async_show_form(
+            step_id="reauth_confirm", data_schema=TOKEN_SCHEMA, errors=errors
+        )
+
+    async def async_step_reconfigure(self, user_input=None):
+        """Handle the choice of another vehicle or wall connector site."""
+        self._entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
+        # The client of the loaded entry holds the latest rotated refresh token
+        entry_data = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id)
+        client: TeslaAPIClient | None = entry_data["client"] if entry_data else None
+        if errors := await self._async_fetch_products(
+            client.refresh_token if client else self._entry.data[CONF_REFRESH_TOKEN],
+            client,
+        ):
+            return self.async_abort(reason=errors["base"])
+        return await self.async_step_devices()
+
+
+class TeslaConnectorOptionsFlow(config_entries.OptionsFlow):
+    """Handle the options of Tesla Connector."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(self, user_input=None):
+        """Handle the charge amps controller options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        target_entity_id = options.get(CONF_TARGET_POWER_ENTITY)
 
         return self.async_show_form(
-            step_id="wall_connector",
+            step_id="init",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_WALL_CONNECTOR_ID): str,
+                    vol.Optional(
+                        CONF_TARGET_POWER_ENTITY,
+                        description=(
+                            {"suggested_value": target_entity_id}
+                            if target_entity_id
+                            else None
+                        ),
+                    ): selector.EntitySelector(
+                        selector.EntitySelectorConfig(
+                            domain=["sensor", "number", "input_number"]
+                        )
+                    ),
+                    vol.Required(
+                        CONF_HYSTERESIS_AMPS,
+                        default=options.get(
+                            CONF_HYSTERESIS_AMPS, DEFAULT_HYSTERESIS_AMPS
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+                    vol.Required(
+                        CONF_MIN_HOLD_TIME,
+                        default=options.get(CONF_MIN_HOLD_TIME, DEFAULT_MIN_HOLD_TIME),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Required(
+                        CONF_MAX_COMMANDS_PER_HOUR,
+                        default=options.get(
+                            CONF_MAX_COMMANDS_PER_HOUR, DEFAULT_MAX_COMMANDS_PER_HOUR
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    vol.Required(
+                        CONF_PREWAKE,
+                        default=options.get(CONF_PREWAKE, DEFAULT_PREWAKE),
+                    ): bool,
+                    vol.Required(
+                        CONF_HEDGE_REQUESTS,
+                        default=options.get(
+                            CONF_HEDGE_REQUESTS, DEFAULT_HEDGE_REQUESTS
+                        ),
+                    ): bool,
+                    vol.Required(
+                        CONF_CHARGING_ANALYTICS,
+                        default=options.get(
+                            CONF_CHARGING_ANALYTICS, DEFAULT_CHARGING_ANALYTICS
+                        ),
+                    ): bool,
                 }
             ),
         )
@@ -11,19 +11,100 @@ PLATFORMS = [
     PLATFORM.SWITCH,
 ]
 
+SERVICE_PROFILE = "profile"
+SERVICE_RECORD_TRAFFIC = "record_traffic"
+SERVICE_SEND_COMMANDS = "send_commands"
+SERVICE_TRACE = "trace"
+SERVICE_CHARGING_ANALYTICS = "charging_analytics"
+SERVICE_CHARGING_SESSIONS = "charging_sessions"
+SERVICE_SEND_FLEET_COMMANDS = "send_fleet_commands"
+
+DATA_PRODUCTS = f"{DOMAIN}_products"
+DATA_BUDGETS = f"{DOMAIN}_budgets"
+PRODUCTS_CACHE_TTL = 300  # seconds
+
 OAUTH2_TOKEN = "https://auth.tesla.com/oauth2/v3/token"
 OAUTH2_CLIENT_ID = "ownerapi"
 
 CONF_REFRESH_TOKEN = "refresh_token"
 CONF_VIN = "vin"
 CONF_WALL_CONNECTOR_ID = "wall_connector_id"
+CONF_TARGET_POWER_ENTITY = "target_power_entity"
+CONF_HYSTERESIS_AMPS = "hysteresis_amps"
+CONF_MIN_HOLD_TIME = "min_hold_time"
+CONF_MAX_COMMANDS_PER_HOUR = "max_commands_per_hour"
+CONF_HEDGE_REQUESTS = "hedge_requests"
+CONF_PREWAKE = "prewake"
+CONF_CHARGING_ANALYTICS = "charging_analytics"
+
+DEFAULT_HYSTERESIS_AMPS = 2
+DEFAULT_MIN_HOLD_TIME = 300  # seconds
+DEFAULT_MAX_COMMANDS_PER_HOUR = 6
+DEFAULT_HEDGE_REQUESTS = False
+DEFAULT_PREWAKE = False
+DEFAULT_CHARGING_ANALYTICS = True
+
+CONTROLLER_MIN_AMPS = 5
+CONTROLLER_MAX_AMPS = 32
+CONTROLLER_DEFAULT_VOLTAGE = 230
 
 UPDATE_INTERVAL = 60  # seconds
 COORDINATOR_TIMEOUT = 10  # seconds
+DATA_FRESH_THRESHOLD = 15  # seconds, explicit refreshes are skipped below
 WAKE_UP_TIMEOUT = 60  # seconds
+WAKE_UP_INTERVAL = 2  # seconds between wake up requests
 WAKE_UP_THRESHOLD = 30  # minutes
 COMMAND_TIMEOUT = 10  # seconds
+COMMAND_DEADLINE = 45  # seconds
+COMMAND_MAX_ATTEMPTS = 4
+COMMAND_RETRY_BASE_DELAY = 1  # seconds
+COMMAND_RETRY_MAX_DELAY = 10  # seconds
+COMMAND_COALESCE_DELAY = 2  # seconds to gather commands before waking up
 SLEEP_THRESHOLD = 15  # minutes
+CONFIRM_TIMEOUT = 30  # seconds
+CONFIRM_INITIAL_INTERVAL = 1  # seconds
+CONFIRM_MAX_INTERVAL = 8  # seconds
+FLEET_CONCURRENCY = 4  # vehicles woken, commanded and confirmed at once
+FLEET_MAX_CONCURRENCY = 20
+FLEET_WAKE_UP_ESTIMATE = 20  # seconds, until a wake up of the vehicle was timed
+
+PREWAKE_STORAGE_VERSION = 1
+PREWAKE_SLOT_MINUTES = 15
+PREWAKE_HISTORY_DAYS = 28
+PREWAKE_MIN_WEEKS = 2  # distinct weeks with a command in the same slot
+PREWAKE_LEAD = 120  # seconds before the slot
+PREWAKE_HIT_WINDOW = 30 * 60  # seconds after a pre-wake
+PREWAKE_DAILY_BUDGET = 2
+PREWAKE_SAVE_DELAY = 60  # seconds
+
+SESSION_LOG_MIN_INTERVAL = 30  # seconds between samples, polls are a minute apart
+SESSION_LOG_GAP = 15 * 60  # seconds without samples closing a session
+
+ANALYTICS_MIN_SOC_DELTA = 10  # % charged for a capacity estimate
+ANALYTICS_RECENT_SESSIONS = 5  # sessions of the capacity estimate
+
+# Seconds each vehicle_data section is reused before being fetched again
+SECTION_TTLS = {
+    "charge_state": 0,
+    "drive_state": 0,
+    "climate_state": 5 * 60,
+    "vehicle_state": 0,  # locks, doors and sentry mode back enabled entities
+    "vehicle_config": 24 * 3600,
+    "gui_settings": 24 * 3600,
+}
+# Sections fetched whatever the enabled entities, the vehicle itself and the
+# charging features read them
+REQUIRED_SECTIONS = ("charge_state", "drive_state")
+
+REQUEST_BUDGET = 60  # requests per client
+COMMAND_BUDGET = 150  # command and wake up requests per account, ten woken vehicles
+REQUEST_BUDGET_PERIOD = 300  # seconds
+HEDGE_PERCENTILE = 95
+HEDGE_WINDOW = 200  # latest latencies of each request
+HEDGE_MIN_SAMPLES = 20
+HEDGE_MIN_DELAY = 0.5  # seconds
+HEDGE_MAX_DELAY = 5  # seconds, below COORDINATOR_TIMEOUT
+HEDGE_MAX_RATIO = 0.1  # hedges per request
 
 # Sensor Types
 SENSOR_BATTERY_LEVEL = "battery_level"
@@ -38,7 +119,21 @@ SENSOR_CHARGER_VOLTAGE = "charger_voltage"
 SENSOR_CHARGE_ENERGY_ADDED = "charge_energy_added"
 SENSOR_VEHICLE_STATE = "state"
 
+SENSOR_ESTIMATED_CAPACITY = "estimated_capacity"
+SENSOR_CHARGING_EFFICIENCY = "charging_efficiency"
+
 SENSOR_WALL_CONNECTOR_VIN = "vin"
+SENSOR_WALL_CONNECTOR_POWER = "wall_connector_power"
+SENSOR_WALL_CONNECTOR_STATE = "wall_connector_state"
+SENSOR_WALL_CONNECTOR_FAULT_STATE = "wall_connector_fault_state"
+SENSOR_WALL_CONNECTOR_SESSION_ENERGY = "session_energy"
+
+SENSOR_SOLAR_POWER = "solar_power"
+SENSOR_BATTERY_POWER = "battery_power"
+SENSOR_GRID_POWER = "grid_power"
+SENSOR_LOAD_POWER = "load_power"
+SENSOR_POWERWALL_LEVEL = "percentage_charged"
+SENSOR_GRID_STATUS = "grid_status"
 
 # Binary Sensor Types
 BINARY_SENSOR_LOCKED = "locked"
@@ -1,18 +1,38 @@
 """Coordinator for Tesla Connector integration."""
 
+from __future__ import annotations
+
 import asyncio
+from collections.abc import Callable
+from datetime import datetime
 import logging
+import time
+from typing import TYPE_CHECKING
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, timedelta
 
-from .const import COORDINATOR_TIMEOUT, DOMAIN, UPDATE_INTERVAL
-from .models.device import TeslaBaseDevice
-from .models.vehicle.vehicle import TeslaVehicle
-from .models.wall_connector.wall_connector import WallConnector
+from .const import COORDINATOR_TIMEOUT, DATA_FRESH_THRESHOLD, DOMAIN, UPDATE_INTERVAL
 from .owner_api.exceptions import TeslaTokenException
+from .profiler import PROFILER
+from .tracing import TRACER
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .models.device import TeslaBaseDevice
+    from .models.energy_site.energy_site import EnergySite
+    from .models.energy_site.energy_site_data import EnergySiteData
+    from .models.vehicle.vehicle import TeslaVehicle
+    from .models.vehicle.vehicle_data import VehicleData
+    from .models.wall_connector.wall_connector import WallConnector
+    from .models.wall_connector.wall_connector_data import (
+        WallConnectorData,
+        WallConnectorStatus,
+    )
+    from .session_log import ChargingSessionLog
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,9 +59,26 @@ class TeslaBaseCoordinator(DataUpdateCoordinator):
         return self._device
 
     async def _async_update_data(self) -> dict:
-        """Update data from the API."""
+        """Update data from the API, profiling the refresh when requested."""
+        with TRACER.span("refresh", device=self._device.device_id):
+            if PROFILER.active:
+                return await PROFILER.async_profile(
+                    f"refresh_{self._device.device_id}", self._async_fetch_data
+                )
+            return await self._async_fetch_data()
+
+    async def _async_fetch_data(self) -> dict:
+        """Fetch data from the API."""
         raise NotImplementedError("This method should be overridden in subclasses.")
 
+    @callback
+    def async_want_section(self, section: str) -> CALLBACK_TYPE:
+        """Fetch a data section until the returned callback is called.
+
+        Devices fetching all their data at once have nothing to select.
+        """
+        return lambda: None
+
     def get_device_info(self) -> DeviceInfo:
         """Return device information."""
         return DeviceInfo(
@@ -58,46 +95,327 @@ class TeslaVehicleCoordinator(TeslaBaseCoordinator):
         self,
         hass: HomeAssistant,
         vehicle: TeslaVehicle,
+        wall_connector_coordinator: "TeslaWallConnectorCoordinator | None" = None,
+        session_log: ChargingSessionLog | None = None,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(hass, vehicle, name="Tesla Vehicle Coordinator")
 
+        self._wall_connector_coordinator = wall_connector_coordinator
+        self._session_log = session_log
+        self._session_listeners: list[Callable[[np.ndarray, np.ndarray], None]] = []
+        self._plug_refresh_task: asyncio.Task | None = None
+        self._unsub_plug: CALLBACK_TYPE | None = None
+        self._fetching = False
+        self._pushed_data: VehicleData | None = None
+
+        # Data fetched outside of the polls, e.g. to confirm a command, is
+        # pushed to the entities and postpones the next poll
+        self._unsub_data = vehicle.add_data_listener(self._async_handle_vehicle_data)
+
+        if wall_connector_coordinator is not None:
+            self._unsub_plug = wall_connector_coordinator.async_track_vehicle_plug(
+                vehicle.vin, self.async_handle_plug_event
+            )
+
     @property
     def vehicle(self) -> TeslaVehicle:
         """Return the Tesla vehicle."""
         return self._device
 
-    async def _async_update_data(self) -> dict:
+    @callback
+    def async_want_section(self, section: str) -> CALLBACK_TYPE:
+        """Fetch a vehicle data section until the returned callback is called."""
+        return self.vehicle.want_section(section)
+
+    def _should_skip_poll(self) -> bool:
+        """Return whether polling can be skipped to let the vehicle sleep.
+
+        The wall connector is cheap to poll: while it reports the vehicle is not
+        plugged in and the vehicle is known to be asleep, nothing is fetched.
+        """
+        if self._wall_connector_coordinator is None:
+            return False
+
+        connected = self._wall_connector_coordinator.is_vehicle_connected(
+            self.vehicle.vin
+        )
+        current_data = self.vehicle.current_data
+        return (
+            connected is False
+            and current_data is not None
+            and current_data.state != "online"
+        )
+
+    async def _async_fetch_data(self) -> dict:
+        if self._should_skip_poll():
+            _LOGGER.debug(
+                "Vehicle %s is asleep and not plugged in, skipping poll",
+                self.vehicle.vin,
+            )
+            if self._session_log is not None:
+                await self._async_log_charging(None)
+            return self.vehicle.current_data
+
+        self._fetching = True
+        self._pushed_data = None
         try:
             async with asyncio.timeout(COORDINATOR_TIMEOUT):
-                return await self.vehicle.async_get_vehicle_data()
+                data = await self.vehicle.async_get_vehicle_data()
         except TeslaTokenException as err:
             _LOGGER.error("Tesla token expired, re-authentication required")
             raise ConfigEntryAuthFailed from err
         except Exception:
             _LOGGER.exception("Error fetching tesla data")
-            return self.vehicle.current_data
+            data = None
+        finally:
+            self._fetching = False
+
+        if self._pushed_data is not None:
+            # The last data pushed during the poll is its own or newer
+            data, self._pushed_data = self._pushed_data, None
+
+        if self._session_log is not None:
+            await self._async_log_charging(data)
+        return data if data is not None else self.vehicle.current_data
+
+    async def _async_log_charging(self, data: VehicleData | None) -> None:
+        """Write the charging state to the session log.
+
+        Without online vehicle data, the open session closes once it got no
+        sample for SESSION_LOG_GAP.
+        """
+        try:
+            if data is None or data.state != "online":
+                closed = await self.hass.async_add_executor_job(
+                    self._session_log.close_idle, time.time()
+                )
+            else:
+                closed = await self.hass.async_add_executor_job(
+                    self._session_log.record,
+                    time.time(),
+                    data,
+                    self._connector_status(),
+                )
+        except OSError:
+            _LOGGER.exception(
+                "Error writing the charging session log of %s", self.vehicle.vin
+            )
+            return
+
+        if closed is not None:
+            for listener in list(self._session_listeners):
+                listener(*closed)
+
+    def _connector_status(self) -> WallConnectorStatus | None:
+        """Return the status of the wall connector charging the vehicle."""
+        if self._wall_connector_coordinator is None:
+            return None
+        wall_connector_data = self._wall_connector_coordinator.data
+        if wall_connector_data is None:
+            return None
+        return wall_connector_data.by_vin.get(self.vehicle.vin)
+
+    @callback
+    def async_add_session_listener(
+        self, listener: Callable[[np.ndarray, np.ndarray], None]
+    ) -> CALLBACK_TYPE:
+        """Call the listener with each closed charging session and its samples."""
+        self._session_listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            self._session_listeners.remove(listener)
+
+        return _remove
+
+    @callback
+    def _async_handle_vehicle_data(self, data: VehicleData) -> None:
+        """Push vehicle data fetched outside of a poll to the entities.
+
+        Data fetched while a poll is in flight is kept for the poll to return,
+        it is newer than the poll's own data when fetched after it.
+        """
+        if self._fetching:
+            self._pushed_data = data
+            return
+        self.async_set_updated_data(data)
+        if self._session_log is not None:
+            self.hass.async_create_background_task(
+                self._async_log_charging(data),
+                name=f"Tesla vehicle {self.vehicle.vin} session log",
+            )
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh unless the vehicle data was just fetched."""
+        last_fetch = self.vehicle.last_data_fetch
+        if (
+            last_fetch is not None
+            and (datetime.now() - last_fetch).total_seconds() < DATA_FRESH_THRESHOLD
+        ):
+            _LOGGER.debug(
+                "Vehicle %s data fetched at %s, skipping refresh",
+                self.vehicle.vin,
+                last_fetch,
+            )
+            return
+        await super().async_request_refresh()
+
+    @callback
+    def async_handle_plug_event(self, plugged_in: bool) -> None:
+        """Refresh the vehicle right away when it is plugged in or out."""
+        _LOGGER.debug(
+            "Vehicle %s %s, refreshing vehicle data",
+            self.vehicle.vin,
+            "plugged in" if plugged_in else "unplugged",
+        )
+
+        if self._plug_refresh_task is not None and not self._plug_refresh_task.done():
+            self._plug_refresh_task.cancel()
+
+        self._plug_refresh_task = self.hass.async_create_background_task(
+            self._async_plug_refresh(),
+            name=f"Tesla vehicle {self.vehicle.vin} plug refresh",
+        )
+
+    async def _async_plug_refresh(self) -> None:
+        """Wake the vehicle up and refresh its data."""
+        try:
+            await self.vehicle.async_ensure_car_woke_up(force=True)
+        except Exception:
+            _LOGGER.exception("Error waking up vehicle %s", self.vehicle.vin)
+            return
+
+        await self.async_refresh()
+
+    async def async_shutdown(self) -> None:
+        """Cancel the plug refresh and stop listening to the vehicle data."""
+        await super().async_shutdown()
+
+        if self._unsub_plug is not None:
+            self._unsub_plug()
+            self._unsub_plug = None
+
+        if self._unsub_data is not None:
+            self._unsub_data()
+            self._unsub_data = None
+
+        if self._plug_refresh_task is not None:
+            self._plug_refresh_task.cancel()
+            self._plug_refresh_task = None
 
 
 class TeslaWallConnectorCoordinator(TeslaBaseCoordinator):
     """Tesla Wall Connector Data Update Coordinator."""
 
-    def __init__(self, hass: HomeAssistant, wall_connector: WallConnector) -> None:
-        """Initialize the coordinator."""
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        wall_connector: WallConnector,
+        site_coordinator: TeslaEnergySiteCoordinator,
+    ) -> None:
+        """Initialize the coordinator, fed by the live status of the site."""
         super().__init__(hass, wall_connector, name="Tesla Wall Connector Coordinator")
+        # The site coordinator polls, each live status updates the connectors
+        self.update_interval = None
+
+        self._plug_listeners: dict[str, list[Callable[[bool], None]]] = {}
+        self._site_coordinator = site_coordinator
+        self._site_data: EnergySiteData | None = None
+        self._unsub_site: CALLBACK_TYPE | None = site_coordinator.async_add_listener(
+            self._async_handle_site_data
+        )
 
     @property
     def wall_connector(self) -> WallConnector:
         """Return the Tesla Wall Connector."""
         return self._device
 
-    async def _async_update_data(self) -> dict:
+    def is_vehicle_connected(self, vin: str) -> bool | None:
+        """Return whether a vehicle is plugged in, None when unknown."""
+        data: WallConnectorData | None = self.wall_connector.current_data
+        if data is None:
+            return None
+        return data.get_connector_for_vin(vin) is not None
+
+    @callback
+    def async_track_vehicle_plug(
+        self, vin: str, action: Callable[[bool], None]
+    ) -> CALLBACK_TYPE:
+        """Call the action when the vehicle is plugged in or out."""
+        self._plug_listeners.setdefault(vin, []).append(action)
+
+        @callback
+        def _remove() -> None:
+            self._plug_listeners[vin].remove(action)
+
+        return _remove
+
+    @callback
+    def _async_dispatch_plug_events(
+        self, previous: WallConnectorData | None, current: WallConnectorData
+    ) -> None:
+        """Notify listeners of vehicles plugged in or out since the last poll."""
+        if previous is None:
+            return
+
+        for vin, actions in self._plug_listeners.items():
+            plugged_in = current.get_connector_for_vin(vin) is not None
+            if plugged_in == (previous.get_connector_for_vin(vin) is not None):
+                continue
+            for action in list(actions):
+                action(plugged_in)
+
+    @callback
+    def _async_handle_site_data(self) -> None:
+        """Update the wall connectors from a new live status of the site."""
+        site_data: EnergySiteData | None = self._site_coordinator.data
+        if site_data is None or site_data is self._site_data:
+            return
+        self._site_data = site_data
+
+        previous = self.wall_connector.current_data
+        data = self.wall_connector.update_from_live_status(site_data.raw)
+        self._async_dispatch_plug_events(previous, data)
+        self.async_set_updated_data(data)
+
+    async def _async_fetch_data(self) -> dict:
+        """Have the site coordinator poll, its listener updates the connectors."""
+        await self._site_coordinator.async_request_refresh()
+        return self.wall_connector.current_data
+
+    async def async_shutdown(self) -> None:
+        """Stop following the live status of the site."""
+        await super().async_shutdown()
+
+        if self._unsub_site is not None:
+            self._unsub_site()
+            self._unsub_site = None
+
+
+class TeslaEnergySiteCoordinator(TeslaBaseCoordinator):
+    """Tesla energy site live status coordinator.
+
+    A single live_status poll serves the energy sensors and the wall connector
+    coordinator.
+    """
+
+    def __init__(self, hass: HomeAssistant, energy_site: EnergySite) -> None:
+        """Initialize the coordinator."""
+        super().__init__(hass, energy_site, name="Tesla Energy Site Coordinator")
+
+    @property
+    def energy_site(self) -> EnergySite:
+        """Return the Tesla energy site."""
+        return self._device
+
+    async def _async_fetch_data(self) -> dict:
         try:
             async with asyncio.timeout(COORDINATOR_TIMEOUT):
-                return await self.wall_connector.async_get_wall_connector_data()
+                return await self.energy_site.async_get_live_status()
         except TeslaTokenException:
             _LOGGER.error("Tesla token expired, re-authentication required")
             raise ConfigEntryAuthFailed
         except Exception:
-            _LOGGER.exception("Error fetching wall connector data")
-            return self.wall_connector.current_data
+            _LOGGER.exception("Error fetching energy site live status")
+            return self.energy_site.current_data
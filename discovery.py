@@ -0,0 +1,137 @@
+"""Discovery of the vehicles and energy sites of a Tesla account."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import logging
+import time
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    CONF_VIN,
+    COMMAND_BUDGET,
+    CONF_WALL_CONNECTOR_ID,
+    DATA_BUDGETS,
+    DATA_PRODUCTS,
+    PRODUCTS_CACHE_TTL,
+)
+from .owner_api.client import TeslaAPIClient
+from .owner_api.exceptions import TeslaTokenException
+from .owner_api.hedging import RateBudget
+from .owner_api.transport import AiohttpTransport
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class TeslaProducts:
+    """Vehicles and energy sites of an account, with the client that listed them."""
+
+    client: TeslaAPIClient
+    vehicles: dict[str, str]
+    energy_sites: dict[str, str]
+    fetched_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def from_products(cls, client: TeslaAPIClient, products: list) -> TeslaProducts:
+        """Sort the products of the account into vehicles and energy sites."""
+        vehicles = {}
+        energy_sites = {}
+        for product in products:
+            if vin := product.get("vin"):
+                vehicles[vin] = product.get("display_name") or vin
+            elif site_id := product.get("energy_site_id"):
+                energy_sites[str(site_id)] = product.get("site_name") or str(site_id)
+        return cls(client, vehicles, energy_sites)
+
+    @property
+    def is_fresh(self) -> bool:
+        """Return whether the products can still be reused."""
+        return time.monotonic() - self.fetched_at < PRODUCTS_CACHE_TTL
+
+
+def _budgets(hass: HomeAssistant) -> dict[str, RateBudget]:
+    """Return the command budgets of the accounts, keyed by refresh token."""
+    return hass.data.setdefault(DATA_BUDGETS, {})
+
+
+@callback
+def async_create_client(hass: HomeAssistant, refresh_token: str) -> TeslaAPIClient:
+    """Return a client sending its requests through the Home Assistant session.
+
+    The clients of the entries of an account share its command budget.
+    """
+    return TeslaAPIClient(
+        refresh_token,
+        transport=AiohttpTransport(async_get_clientsession(hass)),
+        command_budget=_budgets(hass).setdefault(
+            refresh_token, RateBudget(COMMAND_BUDGET)
+        ),
+    )
+
+
+def _products_cache(hass: HomeAssistant) -> dict[str, TeslaProducts]:
+    """Return the products cache, keyed by refresh token, without stale entries."""
+    cache: dict[str, TeslaProducts] = hass.data.setdefault(DATA_PRODUCTS, {})
+    for refresh_token in [token for token, item in cache.items() if not item.is_fresh]:
+        del cache[refresh_token]
+    return cache
+
+
+async def async_get_products(
+    hass: HomeAssistant, refresh_token: str, client: TeslaAPIClient | None = None
+) -> TeslaProducts:
+    """Return the products of the account, exchanging the token only once.
+
+    The client of a loaded entry is passed to list the products without
+    rotating its refresh token.
+    """
+    cache = _products_cache(hass)
+    if (products := cache.get(refresh_token)) is not None:
+        return products
+
+    client = client or async_create_client(hass, refresh_token)
+    response = await client.async_get_products()
+    products = TeslaProducts.from_products(client, response.data)
+
+    # The token refresh rotates the refresh token, the entry stores the new one
+    cache[refresh_token] = cache[client.refresh_token] = products
+    budgets = _budgets(hass)
+    budgets[refresh_token] = budgets[client.refresh_token] = client.command_budget
+    return products
+
+
+@callback
+def async_get_cached_client(
+    hass: HomeAssistant, refresh_token: str
+) -> TeslaAPIClient | None:
+    """Return the client of recently fetched products, already authenticated."""
+    if (products := _products_cache(hass).get(refresh_token)) is not None:
+        return products.client
+    return None
+
+
+async def async_validate_devices(
+    products: TeslaProducts, vin: str, site_id: str
+) -> dict[str, str]:
+    """Check that the vehicle and the energy site answer, return the errors."""
+    vehicle, site = await asyncio.gather(
+        products.client.async_get_vehicle(vin),
+        products.client.async_get_site_live_status(site_id),
+        return_exceptions=True,
+    )
+
+    errors = {}
+    for key, result, error in (
+        (CONF_VIN, vehicle, "vehicle_unavailable"),
+        (CONF_WALL_CONNECTOR_ID, site, "site_unavailable"),
+    ):
+        if isinstance(result, TeslaTokenException):
+            return {"base": "invalid_auth"}
+        if isinstance(result, Exception):
+            _LOGGER.debug("Error validating %s: %s", key, result)
+            errors[key] = error
+    return errors
@@ -0,0 +1,473 @@
+"""Entity descriptions shared by the Tesla Connector platforms."""
+
+from dataclasses import dataclass
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.number import NumberDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.components.switch import SwitchDeviceClass
+from homeassistant.const import (
+    PERCENTAGE,
+    STATE_OFF,
+    STATE_ON,
+    UnitOfElectricCurrent,
+    UnitOfElectricPotential,
+    UnitOfEnergy,
+    UnitOfLength,
+    UnitOfPower,
+    UnitOfPressure,
+    UnitOfSpeed,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+
+from .const import (
+    BINARY_SENSOR_LOCKED,
+    SENSOR_BATTERY_LEVEL,
+    SENSOR_BATTERY_POWER,
+    SENSOR_BATTERY_RANGE,
+    SENSOR_CHARGE_AMPS,
+    SENSOR_CHARGE_CURRENT,
+    SENSOR_CHARGE_ENERGY_ADDED,
+    SENSOR_CHARGE_LIMIT_SOC,
+    SENSOR_CHARGER_VOLTAGE,
+    SENSOR_CHARGING_EFFICIENCY,
+    SENSOR_CHARGING_STATE,
+    SENSOR_ESTIMATED_CAPACITY,
+    SENSOR_GRID_POWER,
+    SENSOR_GRID_STATUS,
+    SENSOR_LOAD_POWER,
+    SENSOR_MINUTES_TO_FULL_CHARGE,
+    SENSOR_ODOMETER,
+    SENSOR_POWERWALL_LEVEL,
+    SENSOR_SOLAR_POWER,
+    SENSOR_VEHICLE_STATE,
+    SENSOR_WALL_CONNECTOR_FAULT_STATE,
+    SENSOR_WALL_CONNECTOR_POWER,
+    SENSOR_WALL_CONNECTOR_SESSION_ENERGY,
+    SENSOR_WALL_CONNECTOR_STATE,
+    SENSOR_WALL_CONNECTOR_VIN,
+)
+from .models.vehicle.vehicle_data import SECTION_SCHEMAS
+
+
+@dataclass(frozen=True, slots=True)
+class TeslaSensorDescription:
+    """Class to describe a Tesla sensor."""
+
+    name: str
+    value_path: str
+    unit: str | None = None
+    device_class: str | None = None
+    icon: str | None = None
+    suggested_display_precision: int | None = None
+    min_value: int | None = None
+    max_value: int | None = None
+    step: int | None = None
+    on_value: str | None = None
+    off_value: str | None = None
+    enabled_default: bool = True
+
+
+SENSOR_DESCRIPTIONS: dict[str, TeslaSensorDescription] = {
+    SENSOR_BATTERY_LEVEL: TeslaSensorDescription(
+        name="Niveau batterie",
+        value_path="charge_state.battery_level",
+        unit=PERCENTAGE,
+        device_class=SensorDeviceClass.BATTERY,
+        icon="mdi:battery",
+    ),
+    SENSOR_BATTERY_RANGE: TeslaSensorDescription(
+        name="Autonomie batterie",
+        value_path="charge_state.battery_range",
+        unit=UnitOfLength.KILOMETERS,
+        device_class=SensorDeviceClass.DISTANCE,
+        icon="mdi:car-electric",
+    ),
+    SENSOR_CHARGE_AMPS: TeslaSensorDescription(
+        name="Ampères de charge voulus",
+        value_path="charge_state.charge_amps",
+        unit=UnitOfElectricCurrent.AMPERE,
+        icon="mdi:flash",
+    ),
+    SENSOR_CHARGE_CURRENT: TeslaSensorDescription(
+        name="Ampères de charge",
+        value_path="charge_state.charge_current_request",
+        unit=UnitOfElectricCurrent.AMPERE,
+        icon="mdi:flash",
+    ),
+    SENSOR_MINUTES_TO_FULL_CHARGE: TeslaSensorDescription(
+        name="Minutes restantes",
+        value_path="charge_state.minutes_to_full_charge",
+        unit=UnitOfTime.MINUTES,
+        icon="mdi:clock-outline",
+    ),
+    SENSOR_ODOMETER: TeslaSensorDescription(
+        name="Odomètre",
+        value_path="vehicle_state.odometer",
+        unit=UnitOfLength.KILOMETERS,
+        device_class=SensorDeviceClass.DISTANCE,
+        icon="mdi:counter",
+    ),
+    SENSOR_CHARGING_STATE: TeslaSensorDescription(
+        name="État de charge",
+        value_path="charge_state.charging_state",
+        icon="mdi:ev-plug-ccs2",
+    ),
+    SENSOR_CHARGE_LIMIT_SOC: TeslaSensorDescription(
+        name="Limite de charge",
+        value_path="charge_state.charge_limit_soc",
+        unit=PERCENTAGE,
+        device_class=SensorDeviceClass.BATTERY,
+        icon="mdi:battery-charging-80",
+    ),
+    SENSOR_CHARGER_VOLTAGE: TeslaSensorDescription(
+        name="Tension du chargeur",
+        value_path="charge_state.charger_voltage",
+        unit=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        icon="mdi:flash",
+    ),
+    SENSOR_CHARGE_ENERGY_ADDED: TeslaSensorDescription(
+        name="Session de charge",
+        value_path="charge_state.charge_energy_added",
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        icon="mdi:car-electric",
+    ),
+}
+
+
+WALL_CONNECTOR_SENSOR_DESCRIPTIONS: dict[str, TeslaSensorDescription] = {
+    SENSOR_WALL_CONNECTOR_VIN: TeslaSensorDescription(
+        name="VIN connecté",
+        value_path="vin",
+        icon="mdi:car-key",
+    ),
+}
+
+
+WALL_CONNECTOR_UNIT_SENSOR_DESCRIPTIONS: dict[str, TeslaSensorDescription] = {
+    SENSOR_WALL_CONNECTOR_POWER: TeslaSensorDescription(
+        name="Puissance borne",
+        value_path="wall_connector_power",
+        unit=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        icon="mdi:ev-station",
+        suggested_display_precision=0,
+    ),
+    SENSOR_WALL_CONNECTOR_STATE: TeslaSensorDescription(
+        name="État borne",
+        value_path="state_name",
+        icon="mdi:ev-plug-type2",
+    ),
+    SENSOR_WALL_CONNECTOR_FAULT_STATE: TeslaSensorDescription(
+        name="Défaut borne",
+        value_path="wall_connector_fault_state",
+        icon="mdi:alert-circle-outline",
+    ),
+    SENSOR_WALL_CONNECTOR_SESSION_ENERGY: TeslaSensorDescription(
+        name="Session de charge borne",
+        value_path="session_energy_kwh",
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        icon="mdi:lightning-bolt",
+        suggested_display_precision=2,
+    ),
+    SENSOR_WALL_CONNECTOR_VIN: TeslaSensorDescription(
+        name="VIN connecté borne",
+        value_path="vin",
+        icon="mdi:car-key",
+    ),
+}
+
+
+ENERGY_SITE_SENSOR_DESCRIPTIONS: dict[str, TeslaSensorDescription] = {
+    SENSOR_SOLAR_POWER: TeslaSensorDescription(
+        name="Production solaire",
+        value_path="status.solar_power",
+        unit=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        icon="mdi:solar-power",
+        suggested_display_precision=0,
+    ),
+    SENSOR_BATTERY_POWER: TeslaSensorDescription(
+        name="Puissance Powerwall",
+        value_path="status.battery_power",
+        unit=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        icon="mdi:home-battery",
+        suggested_display_precision=0,
+    ),
+    SENSOR_GRID_POWER: TeslaSensorDescription(
+        name="Puissance réseau",
+        value_path="status.grid_power",
+        unit=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        icon="mdi:transmission-tower",
+        suggested_display_precision=0,
+    ),
+    SENSOR_LOAD_POWER: TeslaSensorDescription(
+        name="Consommation maison",
+        value_path="status.load_power",
+        unit=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        icon="mdi:home-lightning-bolt",
+        suggested_display_precision=0,
+    ),
+    SENSOR_POWERWALL_LEVEL: TeslaSensorDescription(
+        name="Niveau Powerwall",
+        value_path="status.percentage_charged",
+        unit=PERCENTAGE,
+        device_class=SensorDeviceClass.BATTERY,
+        icon="mdi:home-battery",
+        suggested_display_precision=0,
+    ),
+    SENSOR_GRID_STATUS: TeslaSensorDescription(
+        name="État du réseau",
+        value_path="status.grid_status",
+        icon="mdi:transmission-tower",
+    ),
+}
+
+
+ANALYTICS_SENSOR_DESCRIPTIONS: dict[str, TeslaSensorDescription] = {
+    SENSOR_ESTIMATED_CAPACITY: TeslaSensorDescription(
+        name="Capacité estimée batterie",
+        value_path=SENSOR_ESTIMATED_CAPACITY,
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY_STORAGE,
+        icon="mdi:battery-heart-variant",
+        suggested_display_precision=1,
+    ),
+    SENSOR_CHARGING_EFFICIENCY: TeslaSensorDescription(
+        name="Rendement de charge",
+        value_path=SENSOR_CHARGING_EFFICIENCY,
+        unit=PERCENTAGE,
+        icon="mdi:transmission-tower-export",
+        suggested_display_precision=1,
+    ),
+}
+
+
+BINARY_SENSOR_DESCRIPTIONS: dict[str, TeslaSensorDescription] = {
+    BINARY_SENSOR_LOCKED: TeslaSensorDescription(
+        name="Véhicule verrouillé",
+        value_path="vehicle_state.locked",
+        device_class=BinarySensorDeviceClass.LOCK,
+        on_value="Vérrouillé",
+        off_value="Déverrouillé",
+    ),
+    SENSOR_VEHICLE_STATE: TeslaSensorDescription(
+        name="État du véhicule",
+        value_path="state",
+        icon="mdi:car-connected",
+        on_value="En ligne",
+        off_value="Endormie",
+    ),
+}
+
+
+NUMBER_DESCRIPTIONS: dict[str, TeslaSensorDescription] = {
+    SENSOR_CHARGE_LIMIT_SOC: TeslaSensorDescription(
+        name="Limite de charge",
+        value_path="charge_state.charge_limit_soc",
+        unit=PERCENTAGE,
+        device_class=NumberDeviceClass.BATTERY,
+        icon="mdi:battery",
+        min_value=0,
+        max_value=100,
+        step=5,
+    ),
+    SENSOR_CHARGE_AMPS: TeslaSensorDescription(
+        name="Ampères de charge",
+        value_path="charge_state.charge_amps",
+        unit=None,
+        device_class=NumberDeviceClass.CURRENT,
+        icon="mdi:flash",
+        min_value=1,
+        max_value=32,
+        step=1,
+    ),
+}
+
+
+SWITCH_DESCRIPTIONS: dict[str, TeslaSensorDescription] = {
+    BINARY_SENSOR_LOCKED: TeslaSensorDescription(
+        name="Véhicule verrouillé",
+        value_path="vehicle_state.locked",
+        unit=None,
+        device_class=SwitchDeviceClass.SWITCH,
+        icon="mdi:lock",
+    ),
+    SENSOR_CHARGING_STATE: TeslaSensorDescription(
+        name="Véhicule en charge",
+        value_path="charge_state.charging_state",
+        unit=None,
+        device_class=SwitchDeviceClass.SWITCH,
+        icon="mdi:car-electric",
+    ),
+}
+
+
+# Device class of the generated sensors, from the unit of their field
+_UNIT_DEVICE_CLASSES: dict[str, SensorDeviceClass] = {
+    UnitOfElectricCurrent.AMPERE: SensorDeviceClass.CURRENT,
+    UnitOfElectricPotential.VOLT: SensorDeviceClass.VOLTAGE,
+    UnitOfEnergy.KILO_WATT_HOUR: SensorDeviceClass.ENERGY,
+    UnitOfLength.KILOMETERS: SensorDeviceClass.DISTANCE,
+    UnitOfPower.KILO_WATT: SensorDeviceClass.POWER,
+    UnitOfPressure.BAR: SensorDeviceClass.PRESSURE,
+    UnitOfSpeed.KILOMETERS_PER_HOUR: SensorDeviceClass.SPEED,
+    UnitOfTemperature.CELSIUS: SensorDeviceClass.TEMPERATURE,
+    UnitOfTime.HOURS: SensorDeviceClass.DURATION,
+    UnitOfTime.MINUTES: SensorDeviceClass.DURATION,
+}
+
+# Percentages that are a state of charge, the charge limits have no device class
+_STATE_OF_CHARGE_FIELDS = {"battery_level", "usable_battery_level"}
+
+# Names of the generated entities, in French like the hand-written ones. Every
+# field without a hand-written description needs one.
+_FIELD_NAMES: dict[str, str] = {
+    "charge_state.usable_battery_level": "Niveau batterie utilisable",
+    "charge_state.est_battery_range": "Autonomie estimée",
+    "charge_state.ideal_battery_range": "Autonomie idéale",
+    "charge_state.charger_actual_current": "Courant du chargeur",
+    "charge_state.charger_pilot_current": "Courant pilote du chargeur",
+    "charge_state.charger_phases": "Phases du chargeur",
+    "charge_state.charger_power": "Puissance du chargeur",
+    "charge_state.charge_current_request_max": "Ampères de charge maximum",
+    "charge_state.charge_limit_soc_max": "Limite de charge maximum",
+    "charge_state.charge_limit_soc_min": "Limite de charge minimum",
+    "charge_state.charge_limit_soc_std": "Limite de charge standard",
+    "charge_state.charge_miles_added_rated": "Autonomie ajoutée",
+    "charge_state.charge_port_latch": "Verrou du port de charge",
+    "charge_state.charge_rate": "Vitesse de charge",
+    "charge_state.conn_charge_cable": "Câble de charge",
+    "charge_state.fast_charger_type": "Type de charge rapide",
+    "charge_state.time_to_full_charge": "Temps restant de charge",
+    "charge_state.scheduled_charging_start_time": "Début de charge programmée",
+    "charge_state.battery_heater_on": "Chauffage batterie",
+    "charge_state.charge_enable_request": "Charge demandée",
+    "charge_state.charge_port_door_open": "Trappe de charge ouverte",
+    "charge_state.fast_charger_present": "Charge rapide",
+    "charge_state.scheduled_charging_pending": "Charge programmée en attente",
+    "vehicle_state.car_version": "Version logicielle",
+    "vehicle_state.center_display_state": "État de l'écran central",
+    "vehicle_state.df": "Porte conducteur",
+    "vehicle_state.dr": "Porte arrière conducteur",
+    "vehicle_state.pf": "Porte passager",
+    "vehicle_state.pr": "Porte arrière passager",
+    "vehicle_state.ft": "Coffre avant",
+    "vehicle_state.rt": "Coffre arrière",
+    "vehicle_state.fd_window": "Fenêtre conducteur",
+    "vehicle_state.fp_window": "Fenêtre passager",
+    "vehicle_state.rd_window": "Fenêtre arrière conducteur",
+    "vehicle_state.rp_window": "Fenêtre arrière passager",
+    "vehicle_state.tpms_pressure_fl": "Pression pneu avant gauche",
+    "vehicle_state.tpms_pressure_fr": "Pression pneu avant droit",
+    "vehicle_state.tpms_pressure_rl": "Pression pneu arrière gauche",
+    "vehicle_state.tpms_pressure_rr": "Pression pneu arrière droit",
+    "vehicle_state.is_user_present": "Utilisateur présent",
+    "vehicle_state.sentry_mode": "Mode sentinelle",
+    "vehicle_state.valet_mode": "Mode voiturier",
+    "climate_state.inside_temp": "Température intérieure",
+    "climate_state.outside_temp": "Température extérieure",
+    "climate_state.driver_temp_setting": "Consigne température conducteur",
+    "climate_state.passenger_temp_setting": "Consigne température passager",
+    "climate_state.cabin_overheat_protection": "Protection surchauffe habitacle",
+    "climate_state.climate_keeper_mode": "Mode maintien climatisation",
+    "climate_state.defrost_mode": "Mode dégivrage",
+    "climate_state.fan_status": "Ventilation",
+    "climate_state.seat_heater_left": "Siège chauffant gauche",
+    "climate_state.seat_heater_right": "Siège chauffant droit",
+    "climate_state.is_climate_on": "Climatisation",
+    "climate_state.is_auto_conditioning_on": "Climatisation automatique",
+    "climate_state.is_preconditioning": "Préconditionnement",
+    "climate_state.is_front_defroster_on": "Dégivrage avant",
+    "climate_state.is_rear_defroster_on": "Dégivrage arrière",
+    "climate_state.battery_heater": "Chauffage batterie climatisation",
+    "climate_state.steering_wheel_heater": "Volant chauffant",
+    "drive_state.shift_state": "Rapport engagé",
+    "drive_state.speed": "Vitesse",
+    "drive_state.power": "Puissance de conduite",
+    "drive_state.heading": "Cap",
+    "drive_state.latitude": "Latitude",
+    "drive_state.longitude": "Longitude",
+    "drive_state.gps_as_of": "Date de la position",
+    "vehicle_config.car_type": "Modèle",
+    "vehicle_config.trim_badging": "Finition",
+    "vehicle_config.exterior_color": "Couleur extérieure",
+    "vehicle_config.wheel_type": "Jantes",
+    "vehicle_config.charge_port_type": "Type de port de charge",
+    "vehicle_config.plg": "Hayon électrique",
+    "vehicle_config.rhd": "Conduite à droite",
+    "vehicle_config.has_seat_cooling": "Sièges ventilés",
+    "vehicle_config.can_accept_navigation_requests": "Accepte la navigation",
+    "gui_settings.gui_charge_rate_units": "Unité de vitesse de charge",
+    "gui_settings.gui_distance_units": "Unité de distance",
+    "gui_settings.gui_range_display": "Affichage de l'autonomie",
+    "gui_settings.gui_temperature_units": "Unité de température",
+    "gui_settings.gui_tirepressure_units": "Unité de pression des pneus",
+    "gui_settings.gui_24_hour_time": "Format 24 heures",
+    "gui_settings.show_range_units": "Unités d'autonomie affichées",
+}
+
+
+def _generated_descriptions(
+    binary: bool,
+) -> dict[str, TeslaSensorDescription]:
+    """Describe the vehicle data fields without a hand-written description.
+
+    Boolean fields become binary sensors, the others sensors. Generated
+    entities are disabled by default, so that their sections are only fetched
+    once a user enables them.
+    """
+    described = {
+        description.value_path
+        for descriptions in (
+            SENSOR_DESCRIPTIONS,
+            BINARY_SENSOR_DESCRIPTIONS,
+            NUMBER_DESCRIPTIONS,
+            SWITCH_DESCRIPTIONS,
+        )
+        for description in descriptions.values()
+    }
+    descriptions = {}
+    for section, schema in SECTION_SCHEMAS.items():
+        for attribute, field in schema.items():
+            value_path = f"{section}.{attribute}"
+            if (
+                attribute == "timestamp"
+                or value_path in described
+                or (field.type is bool) is not binary
+            ):
+                continue
+            name = _FIELD_NAMES[value_path]
+            if binary:
+                description = TeslaSensorDescription(
+                    name=name,
+                    value_path=value_path,
+                    on_value=STATE_ON,
+                    off_value=STATE_OFF,
+                    enabled_default=False,
+                )
+            else:
+                if attribute in _STATE_OF_CHARGE_FIELDS:
+                    device_class = SensorDeviceClass.BATTERY
+                else:
+                    device_class = _UNIT_DEVICE_CLASSES.get(field.unit)
+                description = TeslaSensorDescription(
+                    name=name,
+                    value_path=value_path,
+                    unit=field.unit,
+                    device_class=device_class,
+                    enabled_default=False,
+                )
+            descriptions[f"{section}_{attribute}"] = description
+    return descriptions
+
+
+GENERATED_SENSOR_DESCRIPTIONS = _generated_descriptions(binary=False)
+GENERATED_BINARY_SENSOR_DESCRIPTIONS = _generated_descriptions(binary=True)
@@ -1,6 +1,11 @@
 """Tesla device model."""
 
-from ..owner_api.client import TeslaAPIClient
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..owner_api.client import TeslaAPIClient
 
 
 class TeslaBaseDevice:
@@ -15,3 +20,8 @@ class TeslaBaseDevice:
     def device_id(self) -> str:
         """Return the device ID."""
         return self._device_id
+
+    @property
+    def api_client(self) -> TeslaAPIClient:
+        """Return the Owner API client of the device."""
+        return self._apiClient
@@ -0,0 +1 @@
+"""Package for Tesla energy sites."""
@@ -0,0 +1,30 @@
+"""Energy site models."""
+
+from ...owner_api.client import TeslaAPIClient
+from ..device import TeslaBaseDevice
+from .energy_site_data import EnergySiteData
+
+
+class EnergySite(TeslaBaseDevice):
+    """Representation of a Tesla energy site."""
+
+    def __init__(self, site_id: str, apiClient: TeslaAPIClient) -> None:
+        """Initialize the energy site."""
+        super().__init__(site_id, apiClient)
+        self._current_data: EnergySiteData | None = None
+
+    @property
+    def site_id(self) -> str:
+        """Return the energy site ID."""
+        return self._device_id
+
+    @property
+    def current_data(self) -> EnergySiteData | None:
+        """Return the current live status of the site (cached)."""
+        return self._current_data
+
+    async def async_get_live_status(self) -> EnergySiteData:
+        """Get the live status of the site from the Tesla API."""
+        response = await self._apiClient.async_get_site_live_status(self.site_id)
+        self._current_data = EnergySiteData(response.data)
+        return self._current_data
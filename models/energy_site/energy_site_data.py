@@ -0,0 +1,45 @@
+"""Energy site models."""
+
+from ..schema import Field, snapshot_class
+
+ENERGY_SITE_SCHEMA: dict[str, Field] = {
+    "solar_power": Field(float, unit="W"),
+    "battery_power": Field(float, unit="W"),
+    "grid_power": Field(float, unit="W"),
+    "load_power": Field(float, unit="W"),
+    "generator_power": Field(float, unit="W"),
+    "percentage_charged": Field(float, unit="%"),
+    "energy_left": Field(float, unit="Wh"),
+    "total_pack_energy": Field(float, unit="Wh"),
+    "grid_status": Field(str),
+    "island_status": Field(str),
+    "storm_mode_active": Field(bool),
+    "backup_capable": Field(bool),
+    "timestamp": Field(str),
+}
+
+EnergySiteStatus = snapshot_class(
+    "EnergySiteStatus", ENERGY_SITE_SCHEMA, "Power flows snapshot of an energy site."
+)
+
+
+class EnergySiteData:
+    """Live status of an energy site, its power flows and its wall connectors.
+
+    The raw payload is kept for the wall connectors, parsed by their model.
+    """
+
+    __slots__ = ("raw", "status")
+
+    def __init__(self, response: dict) -> None:
+        """Initialize the energy site data."""
+        self.raw = response
+        self.status = EnergySiteStatus.from_dict(response)
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether both snapshots hold the same data."""
+        if not isinstance(other, EnergySiteData):
+            return NotImplemented
+        return self.raw is other.raw or self.raw == other.raw
+
+    __hash__ = None
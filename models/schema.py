@@ -0,0 +1,149 @@
+"""Declarative schema helpers to build immutable API snapshots."""
+
+from collections import namedtuple
+from collections.abc import Callable
+from typing import Any
+
+MILES_TO_KM = 1.609344
+
+
+class Field:
+    """Describe a single field of an API payload section."""
+
+    __slots__ = ("default", "fallback", "key", "scale", "type", "unit")
+
+    def __init__(
+        self,
+        type_: type,
+        default: Any = None,
+        *,
+        key: str | None = None,
+        scale: float | None = None,
+        fallback: str | None = None,
+        unit: str | None = None,
+    ) -> None:
+        """Initialize the field.
+
+        `key` is the payload key when it differs from the attribute name,
+        `scale` is applied to numeric values to normalize units and
+        `fallback` names another field whose value is used when the key is missing
+        and `unit` is the unit of the normalized value.
+        """
+        self.type = type_
+        self.default = default
+        self.key = key
+        self.scale = scale
+        self.fallback = fallback
+        self.unit = unit
+
+
+def _to_bool(value: Any) -> bool:
+    """Coerce an API value to a boolean."""
+    if isinstance(value, str):
+        return value.lower() in ("true", "1", "on", "yes")
+    return bool(value)
+
+
+def _to_int(value: Any) -> int:
+    """Coerce an API value to an integer, accepting decimal strings."""
+    return int(float(value)) if isinstance(value, str) else int(value)
+
+
+_CASTS: dict[type, Callable[[Any], Any]] = {bool: _to_bool, int: _to_int}
+
+
+def _make_converter(field: Field) -> Callable[[Any], Any]:
+    """Build the coercion function of a field."""
+    type_ = field.type
+    cast = _CASTS.get(type_, type_)
+    default = field.default
+    scale = field.scale
+
+    if scale is None:
+
+        def convert(value: Any) -> Any:
+            if value is None:
+                return default
+            if value.__class__ is type_:
+                return value
+            try:
+                return cast(value)
+            except (TypeError, ValueError):
+                return default
+
+    else:
+
+        def convert(value: Any) -> Any:
+            if value is None:
+                return default
+            try:
+                return cast(float(value) * scale)
+            except (TypeError, ValueError):
+                return default
+
+    return convert
+
+
+def snapshot_class(name: str, schema: dict[str, Field], doc: str) -> type:
+    """Generate a slotted, immutable snapshot class from a schema.
+
+    Instances are tuples: they hold no per-instance `__dict__` and compare
+    with a single tuple comparison.
+    """
+    attributes = tuple(schema)
+    converters = tuple(
+        (field.key or attribute, _make_converter(field))
+        for attribute, field in schema.items()
+    )
+    fallbacks = tuple(
+        (index, schema[attribute].key or attribute, attributes.index(field.fallback))
+        for index, (attribute, field) in enumerate(schema.items())
+        if field.fallback is not None
+    )
+
+    def from_dict(cls, data: dict):
+        """Build a snapshot from a raw API payload section."""
+        get = data.get
+        values = [convert(get(key)) for key, convert in converters]
+        for index, key, fallback_index in fallbacks:
+            if get(key) is None:
+                values[index] = values[fallback_index]
+        return tuple.__new__(cls, values)
+
+    return type(
+        name,
+        (namedtuple(f"_{name}", attributes),),
+        {
+            "__slots__": (),
+            "__doc__": doc,
+            "schema": schema,
+            "from_dict": classmethod(from_dict),
+        },
+    )
+
+
+class LazySection:
+    """Descriptor building a section snapshot on first access."""
+
+    __slots__ = ("_key", "_member", "_snapshot")
+
+    def __init__(self, key: str, snapshot: type) -> None:
+        """Initialize the descriptor with the payload key and snapshot class."""
+        self._key = key
+        self._snapshot = snapshot
+        self._member = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Bind the descriptor to the private slot holding the parsed section."""
+        self._member = owner.__dict__[f"_{name}"]
+
+    def __get__(self, obj, objtype=None):
+        """Return the parsed section, building it if needed."""
+        if obj is None:
+            return self
+        try:
+            return self._member.__get__(obj, objtype)
+        except AttributeError:
+            value = self._snapshot.from_dict(obj.raw.get(self._key) or {})
+            self._member.__set__(obj, value)
+            return value
@@ -0,0 +1,105 @@
+"""Commands that can be sent to Tesla vehicles."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from .vehicle_data import ChargingState
+
+if TYPE_CHECKING:
+    from .vehicle_data import VehicleData
+
+COMMAND_CHARGE_START = "charge_start"
+COMMAND_CHARGE_STOP = "charge_stop"
+COMMAND_SET_CHARGE_LIMIT = "set_charge_limit"
+COMMAND_SET_CHARGING_AMPS = "set_charging_amps"
+COMMAND_DOOR_LOCK = "door_lock"
+COMMAND_DOOR_UNLOCK = "door_unlock"
+
+
+@dataclass(frozen=True, slots=True)
+class CommandSpec:
+    """How to send a command and recognize its effect.
+
+    A command replaces the command of the same group queued by an earlier
+    call while the vehicle is about to be woken up. `section` is the vehicle
+    data section showing the effect.
+    """
+
+    method: str
+    group: str
+    section: str
+    confirm: Callable[[VehicleData, int | None], bool]
+    takes_value: bool = False
+
+
+COMMANDS: dict[str, CommandSpec] = {
+    COMMAND_CHARGE_START: CommandSpec(
+        "async_start_charge",
+        "charging",
+        "charge_state",
+        lambda data, _: data.charge_state.charging_state == ChargingState.CHARGING,
+    ),
+    COMMAND_CHARGE_STOP: CommandSpec(
+        "async_stop_charge",
+        "charging",
+        "charge_state",
+        lambda data, _: data.charge_state.charging_state != ChargingState.CHARGING,
+    ),
+    COMMAND_SET_CHARGE_LIMIT: CommandSpec(
+        "async_set_charge_limit",
+        "charge_limit",
+        "charge_state",
+        lambda data, value: data.charge_state.charge_limit_soc == value,
+        takes_value=True,
+    ),
+    COMMAND_SET_CHARGING_AMPS: CommandSpec(
+        "async_set_charge_amps",
+        "charge_amps",
+        "charge_state",
+        lambda data, value: data.charge_state.charge_current_request == value,
+        takes_value=True,
+    ),
+    COMMAND_DOOR_LOCK: CommandSpec(
+        "async_lock_doors",
+        "doors",
+        "vehicle_state",
+        lambda data, _: data.vehicle_state.locked is True,
+    ),
+    COMMAND_DOOR_UNLOCK: CommandSpec(
+        "async_unlock_doors",
+        "doors",
+        "vehicle_state",
+        lambda data, _: data.vehicle_state.locked is False,
+    ),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class VehicleCommand:
+    """A command with its value, if it takes one.
+
+    `automatic` marks the commands the integration sends on its own, e.g. to
+    follow a target power, rather than on behalf of the user.
+    """
+
+    name: str
+    value: int | None = None
+    automatic: bool = field(default=False, compare=False)
+
+    @property
+    def spec(self) -> CommandSpec:
+        """Return the specification of the command."""
+        return COMMANDS[self.name]
+
+    def is_confirmed(self, data: VehicleData) -> bool:
+        """Return whether the vehicle data shows the effect of the command."""
+        return self.spec.confirm(data, self.value)
+
+
+def coalesce(commands: Sequence[VehicleCommand]) -> list[VehicleCommand]:
+    """Keep the last command of each group, the ones whose effect remains."""
+    last = {command.spec.group: command for command in commands}
+    return [command for command in commands if last[command.spec.group] is command]
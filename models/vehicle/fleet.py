@@ -0,0 +1,136 @@
+"""Commands sent to several vehicles at once."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+import logging
+import math
+from typing import Any
+
+from ...clock import SYSTEM_CLOCK, Clock
+from ...const import FLEET_CONCURRENCY, FLEET_WAKE_UP_ESTIMATE, WAKE_UP_INTERVAL
+from ...owner_api.exceptions import TeslaBaseException
+from ...owner_api.hedging import RateBudget
+from ...tracing import TRACER
+from .commands import VehicleCommand
+from .vehicle import TeslaVehicle
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class FleetResult:
+    """Outcome and step durations of the commands of a vehicle."""
+
+    vin: str
+    error: str | None = None
+    queued: float = 0.0  # seconds waiting for a concurrency slot and the budget
+    wake_up: float | None = None
+    command: float | None = None
+    confirm: float | None = None
+
+    @property
+    def success(self) -> bool:
+        """Return whether every step succeeded."""
+        return self.error is None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the result with durations rounded to the millisecond."""
+        return {
+            "success": self.success,
+            "error": self.error,
+            "queued": round(self.queued, 3),
+            "wake_up": None if self.wake_up is None else round(self.wake_up, 3),
+            "command": None if self.command is None else round(self.command, 3),
+            "confirm": None if self.confirm is None else round(self.confirm, 3),
+        }
+
+
+def _expected_requests(vehicle: TeslaVehicle, commands: int) -> int:
+    """Return the command budget the commands of a vehicle are expected to use.
+
+    A wake up sends a request every WAKE_UP_INTERVAL for as long as the last
+    wake up of the vehicle took. Confirmation polls are reads, they do not
+    count against the command budget.
+    """
+    requests = commands
+    if vehicle.needs_wake_up:
+        duration = vehicle.wake_up_duration or FLEET_WAKE_UP_ESTIMATE
+        requests += math.ceil(duration / WAKE_UP_INTERVAL)
+    return requests
+
+
+async def async_send_fleet_commands(
+    vehicles: Sequence[TeslaVehicle],
+    commands: Sequence[VehicleCommand],
+    confirm: bool = True,
+    concurrency: int = FLEET_CONCURRENCY,
+    clock: Clock = SYSTEM_CLOCK,
+) -> list[FleetResult]:
+    """Wake up, command and confirm the vehicles concurrently.
+
+    At most `concurrency` vehicles go through their steps at once, so the
+    fleet completes in about the time of its slowest vehicle while the
+    requests stay bounded. Each vehicle reserves its expected requests in the
+    command budget of its account, vehicles of an account wait for each other
+    rather than overrunning it, and a vehicle is not commanded when the budget
+    has not enough requests left. A failing vehicle does not stop the
+    others, its error is reported in its result.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    commands = list(commands)
+    reserved: dict[RateBudget, int] = {}
+    released = asyncio.Condition()
+
+    @asynccontextmanager
+    async def _async_reserve(vehicle: TeslaVehicle) -> AsyncIterator[None]:
+        budget = vehicle.api_client.command_budget
+        needed = _expected_requests(vehicle, len(commands))
+        async with released:
+            while budget.remaining - reserved.get(budget, 0) < needed:
+                if not reserved.get(budget):
+                    raise TeslaBaseException("Request budget exhausted")
+                await released.wait()
+            reserved[budget] = reserved.get(budget, 0) + needed
+        try:
+            yield
+        finally:
+            async with released:
+                reserved[budget] -= needed
+                released.notify_all()
+
+    async def _async_run(vehicle: TeslaVehicle) -> FleetResult:
+        result = FleetResult(vehicle.vin)
+        start = clock.monotonic()
+        async with semaphore:
+            with TRACER.span("fleet_vehicle", vin=vehicle.vin):
+                try:
+                    async with _async_reserve(vehicle):
+                        result.queued = clock.monotonic() - start
+                        await _async_run_steps(vehicle, result)
+                except Exception as err:
+                    _LOGGER.warning(
+                        "Fleet commands failed for VIN %s: %s", vehicle.vin, err
+                    )
+                    result.error = str(err) or type(err).__name__
+        return result
+
+    async def _async_run_steps(vehicle: TeslaVehicle, result: FleetResult) -> None:
+        step = clock.monotonic()
+        await vehicle.async_ensure_car_woke_up()
+        result.wake_up = clock.monotonic() - step
+
+        step = clock.monotonic()
+        await vehicle.async_send_commands(commands)
+        result.command = clock.monotonic() - step
+
+        if confirm:
+            step = clock.monotonic()
+            await vehicle.async_confirm_commands(commands)
+            result.confirm = clock.monotonic() - step
+
+    with TRACER.span("fleet", vehicles=len(vehicles), commands=len(commands)):
+        return await asyncio.gather(*(_async_run(vehicle) for vehicle in vehicles))
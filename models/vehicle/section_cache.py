@@ -0,0 +1,87 @@
+"""Cache of the vehicle data sections that change slowly."""
+
+from collections import Counter
+from collections.abc import Callable, Iterable
+from ...clock import SYSTEM_CLOCK, Clock
+from ...const import REQUIRED_SECTIONS, SECTION_TTLS
+
+
+class SectionCache:
+    """Sections of the vehicle_data payload, each with its own time to live.
+
+    Sections with a time to live of 0 are fetched by every poll, the others
+    are reused from previous payloads until they expire or are invalidated.
+    Only the required sections and the ones wanted, e.g. by enabled entities,
+    are fetched, besides sections held after a command.
+    """
+
+    def __init__(
+        self,
+        ttls: dict[str, float] = SECTION_TTLS,
+        required: Iterable[str] = REQUIRED_SECTIONS,
+        clock: Clock = SYSTEM_CLOCK,
+    ) -> None:
+        """Initialize an empty cache."""
+        self._ttls = ttls
+        self._clock = clock
+        self._required = frozenset(required)
+        self._wanted: Counter[str] = Counter()
+        self._sections: dict[str, dict] = {}
+        self._fetched_at: dict[str, float] = {}
+        self._hot_until: dict[str, float] = {}
+
+    def want(self, section: str) -> Callable[[], None]:
+        """Fetch the section until the returned callback is called."""
+        self._wanted[section] += 1
+
+        def _release() -> None:
+            self._wanted[section] -= 1
+            if not self._wanted[section]:
+                del self._wanted[section]
+
+        return _release
+
+    def due(self) -> list[str]:
+        """Return the sections to fetch with the next poll."""
+        now = self._clock.monotonic()
+        return [
+            section
+            for section, ttl in self._ttls.items()
+            if now < self._hot_until.get(section, 0)
+            or (
+                (section in self._required or section in self._wanted)
+                and (
+                    section not in self._fetched_at
+                    or now - self._fetched_at[section] >= ttl
+                )
+            )
+        ]
+
+    def invalidate(self, *sections: str, hold: float = 0) -> None:
+        """Fetch the sections, all when none is given, with the next poll.
+
+        With `hold` the sections keep being fetched by every poll for that many
+        seconds, e.g. while waiting for a command to show up.
+        """
+        now = self._clock.monotonic()
+        for section in sections or tuple(self._ttls):
+            self._fetched_at.pop(section, None)
+            if hold:
+                self._hot_until[section] = now + hold
+
+    def merge(self, payload: dict, sections: list[str]) -> dict:
+        """Store the fetched sections and complete the payload from the cache."""
+        now = self._clock.monotonic()
+        for section in sections:
+            if isinstance(fresh := payload.get(section), dict):
+                self._sections[section] = fresh
+                self._fetched_at[section] = now
+            else:
+                self._fetched_at.pop(section, None)
+
+        cached = {
+            section: value
+            for section, value in self._sections.items()
+            if section not in payload
+        }
+        return {**payload, **cached} if cached else payload
@@ -1,34 +1,116 @@
 """Vehicle model for Tesla vehicles."""
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from functools import partial
 import logging
 
-from aiohttp import ClientResponseError
+from aiohttp import ClientError, ClientResponseError
 from asyncio import TimeoutError
 
-from ...const import COMMAND_TIMEOUT, SLEEP_THRESHOLD, WAKE_UP_THRESHOLD
+from ...clock import SYSTEM_CLOCK, Clock
+from ...const import (
+    COMMAND_COALESCE_DELAY,
+    COMMAND_TIMEOUT,
+    CONFIRM_INITIAL_INTERVAL,
+    CONFIRM_MAX_INTERVAL,
+    CONFIRM_TIMEOUT,
+    SLEEP_THRESHOLD,
+    WAKE_UP_INTERVAL,
+    WAKE_UP_THRESHOLD,
+    WAKE_UP_TIMEOUT,
+)
 from ...owner_api.api_response import TeslaAPIResponse
 from ...owner_api.client import TeslaAPIClient
-from ...owner_api.exceptions import TeslaBaseException
+from ...owner_api.exceptions import (
+    TeslaBaseException,
+    TeslaCommandSupersededException,
+)
+from ...owner_api.retry import (
+    RetryAction,
+    RetryPolicy,
+    classify_error,
+    classify_response,
+)
+from ...profiler import PROFILER
+from ...tracing import TRACER
 from ..device import TeslaBaseDevice
+from .commands import (
+    COMMAND_CHARGE_START,
+    COMMAND_CHARGE_STOP,
+    COMMAND_DOOR_LOCK,
+    COMMAND_DOOR_UNLOCK,
+    COMMAND_SET_CHARGE_LIMIT,
+    COMMAND_SET_CHARGING_AMPS,
+    VehicleCommand,
+    coalesce,
+)
+from .section_cache import SectionCache
 from .vehicle_data import ChargingState, VehicleData
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class _QueuedCommand:
+    """Command waiting for the next wake window, with the callers awaiting it."""
+
+    command: VehicleCommand
+    futures: list[asyncio.Future] = field(default_factory=list)
+
+    @property
+    def abandoned(self) -> bool:
+        """Return whether every caller stopped waiting for the command."""
+        return all(future.done() for future in self.futures)
+
+    def set_result(self, response: TeslaAPIResponse) -> None:
+        """Resolve the callers awaiting the command."""
+        for future in self.futures:
+            if not future.done():
+                future.set_result(response)
+
+    def set_exception(self, err: BaseException) -> None:
+        """Fail the callers awaiting the command."""
+        for future in self.futures:
+            if not future.done():
+                future.set_exception(err)
+
+    def cancel(self) -> None:
+        """Cancel the callers still awaiting the command."""
+        for future in self.futures:
+            future.cancel()
+
+
 class TeslaVehicle(TeslaBaseDevice):
     """Representation of a Tesla vehicle."""
 
-    def __init__(self, vin: str, apiClient: TeslaAPIClient) -> None:
+    def __init__(
+        self,
+        vin: str,
+        apiClient: TeslaAPIClient,
+        retry_policy: RetryPolicy | None = None,
+        clock: Clock | None = None,
+    ) -> None:
         """Initialize a TeslaVehicle with a VIN and Tesla API client."""
         super().__init__(vin, apiClient)
         self._current_data = None
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._clock = clock or SYSTEM_CLOCK
+        self._sections = SectionCache(clock=self._clock)
 
         self._last_wake_up: datetime = None
         self._last_command_send: datetime = None
+        self._last_data_fetch: datetime | None = None
+        self._last_offline: datetime | None = None
+        self._wake_up_duration: float | None = None
+        self._data_listeners: list[Callable[[VehicleData], None]] = []
+        self._command_listeners: list[Callable[[VehicleCommand], None]] = []
+
+        self._queue: list[_QueuedCommand] = []
+        self._queue_task: asyncio.Task | None = None
+        self._coalescing = False
 
     @property
     def vin(self) -> str:
@@ -40,11 +122,47 @@ class TeslaVehicle(TeslaBaseDevice):
         """Return the current data of the vehicle (cached)."""
         return self._current_data
 
+    @property
+    def wake_up_duration(self) -> float | None:
+        """Return how long the vehicle last took to wake up, in seconds."""
+        return self._wake_up_duration
+
+    @property
+    def last_data_fetch(self) -> datetime | None:
+        """Return when vehicle data was last fetched from the API."""
+        return self._last_data_fetch
+
+    def add_data_listener(
+        self, listener: Callable[[VehicleData], None]
+    ) -> Callable[[], None]:
+        """Call the listener with every vehicle data fetched from the API."""
+        self._data_listeners.append(listener)
+
+        def _remove() -> None:
+            self._data_listeners.remove(listener)
+
+        return _remove
+
+    def want_section(self, section: str) -> Callable[[], None]:
+        """Fetch a vehicle data section until the returned callback is called."""
+        return self._sections.want(section)
+
+    def add_command_listener(
+        self, listener: Callable[[VehicleCommand], None]
+    ) -> Callable[[], None]:
+        """Call the listener with every command sent successfully."""
+        self._command_listeners.append(listener)
+
+        def _remove() -> None:
+            self._command_listeners.remove(listener)
+
+        return _remove
+
     async def async_get_vehicle_data(self) -> VehicleData:
         """Get vehicle data from the Tesla API."""
         if (
             self._last_command_send
-            and datetime.now() - self._last_command_send
+            and self._clock.now() - self._last_command_send
             > timedelta(minutes=SLEEP_THRESHOLD)
             and (
                 not self._current_data
@@ -56,76 +174,142 @@ class TeslaVehicle(TeslaBaseDevice):
                 "Skipping vehicle data fetch to allow sleep mode, last command sent at %s",
                 self._last_command_send,
             )
-            if self._current_data is not None:
-                self._current_data.state = "offline"
+            self._mark_offline()
             return self._current_data
 
         try:
-            vehicle_data = await self._apiClient.async_get_vehicle_data(self.vin)
-            self._current_data = VehicleData(vehicle_data.data)
+            sections = self._sections.due()
+            with TRACER.span("vehicle_data", vin=self.vin, sections=",".join(sections)):
+                vehicle_data = await self._apiClient.async_get_vehicle_data(
+                    self.vin, sections
+                )
+            self._current_data = VehicleData(
+                self._sections.merge(vehicle_data.data, sections)
+            )
+            self._last_data_fetch = self._clock.now()
+            for listener in list(self._data_listeners):
+                listener(self._current_data)
         except ClientResponseError as err:
             if err.status == 408:
                 _LOGGER.info(
                     "Request timed out, vehicle is potentially offline.. getting cached data"
                 )
-                if self._current_data is not None:
-                    self._current_data.state = "offline"
+                self._mark_offline()
 
         return self._current_data
 
-    async def _async_wake_up(self) -> TeslaAPIResponse:
+    def _mark_offline(self) -> None:
+        """Mark the vehicle data offline, the vehicle is asleep or unreachable."""
+        self._last_offline = self._clock.now()
+        if self._current_data is not None:
+            self._current_data = self._current_data.with_state("offline")
+
+    async def _async_wake_up(self, timeout: float) -> TeslaAPIResponse:
         """Wake up the vehicle."""
-        return await self._apiClient.async_wake_up_car(self.vin)
+        return await self._apiClient.async_wake_up_car(self.vin, timeout)
+
+    @property
+    def needs_wake_up(self) -> bool:
+        """Return whether the vehicle must be woken up before a command.
 
-    async def async_ensure_car_woke_up(self, force=False) -> TeslaAPIResponse:
-        """Wake up the vehicle if necessary."""
-        should_wake_up = (
+        Only an offline vehicle seen after the last wake up needs another one,
+        data fetched before it may still show the vehicle asleep.
+        """
+        return (
             self._last_wake_up is None
-            or self._current_data is None
-            or self._current_data.state == "offline"
-            or datetime.now() - self._last_wake_up
+            or (
+                self._last_offline is not None
+                and self._last_offline >= self._last_wake_up
+            )
+            or self._clock.now() - self._last_wake_up
             > timedelta(minutes=WAKE_UP_THRESHOLD)
-            or force
         )
 
-        if should_wake_up:
-            await self._async_wake_up()
-            self._last_wake_up = datetime.now()
-            self._last_command_send = datetime.now()
+    async def async_ensure_car_woke_up(
+        self, force=False, timeout: float = WAKE_UP_TIMEOUT
+    ) -> TeslaAPIResponse:
+        """Wake up the vehicle if necessary, waiting at most timeout seconds."""
+        if force or self.needs_wake_up:
+            start = self._clock.monotonic()
+            with TRACER.span("wake_up", vin=self.vin, forced=force):
+                await self._async_wake_up(timeout)
+            duration = self._clock.monotonic() - start
+            if duration >= 2 * WAKE_UP_INTERVAL:
+                # A vehicle already online answers the first request
+                self._wake_up_duration = duration
+            # The cabin may have changed while nothing was polled
+            self._sections.invalidate("climate_state")
+            self._last_wake_up = self._clock.now()
+            self._last_command_send = self._clock.now()
 
     async def _async_send_command(
         self, command: Callable[..., TeslaAPIResponse]
     ) -> TeslaAPIResponse:
-        """Send a command to the vehicle with retries."""
-        start_time = datetime.now()
+        """Send a command to the vehicle, profiling it when requested."""
+        if PROFILER.active:
+            return await PROFILER.async_profile(
+                f"command_{self.vin}", partial(self._async_run_command, command)
+            )
+        return await self._async_run_command(command)
+
+    async def _async_run_command(
+        self, command: Callable[..., TeslaAPIResponse]
+    ) -> TeslaAPIResponse:
+        """Send a command to the vehicle, retrying according to the retry policy."""
+        start_time = self._clock.now()
+        deadline = start_time + timedelta(seconds=self._retry_policy.deadline)
         _LOGGER.debug("Sending command to vehicle: %s", self.vin)
 
-        await self.async_ensure_car_woke_up()
+        attempt = 0
+        while True:
+            attempt += 1
+            with TRACER.span("attempt", vin=self.vin, attempt=attempt) as span:
+                try:
+                    async with asyncio.timeout(delay=COMMAND_TIMEOUT):
+                        response: TeslaAPIResponse = await command()
+                except (TimeoutError, ClientError) as err:
+                    action = classify_error(err)
+                    error: Exception = err
+                else:
+                    action = classify_response(response)
+                    error = TeslaBaseException(
+                        f"Command failed for vehicle vin: {self.vin} REASON: {response.reason}"
+                    )
+                span.set_attribute("action", action)
+
+            if action == RetryAction.SUCCESS:
+                break
+
+            remaining = (deadline - self._clock.now()).total_seconds()
+            if (
+                action == RetryAction.FATAL
+                or attempt >= self._retry_policy.max_attempts
+                or remaining <= 0
+            ):
+                raise error
+
+            _LOGGER.warning(
+                "Attempt %d/%d failed for VIN %s (%s): %s",
+                attempt,
+                self._retry_policy.max_attempts,
+                self.vin,
+                action,
+                error,
+            )
 
-        retries = 3
-        for attempt in range(1, retries + 1):
-            try:
-                async with asyncio.timeout(delay=COMMAND_TIMEOUT):
-                    response: TeslaAPIResponse = await command()
-                    if not response.result:
-                        raise TeslaBaseException(
-                            f"Command failed for vehicle vin: {self.vin} REASON: {response.reason}"
-                        )
-                    break
-            except (TimeoutError, TeslaBaseException) as err:
-                _LOGGER.warning(
-                    "Attempt %d/%d failed for VIN %s: %s",
-                    attempt,
-                    retries,
-                    self.vin,
-                    err,
+            if action == RetryAction.RETRY_AFTER_WAKE:
+                # The wake up counts against the deadline of the command
+                try:
+                    await self.async_ensure_car_woke_up(force=True, timeout=remaining)
+                except (TimeoutError, ClientError, TeslaBaseException) as err:
+                    raise error from err
+            else:
+                await self._clock.sleep(
+                    min(self._retry_policy.backoff(attempt), remaining)
                 )
-                if attempt == retries:
-                    raise
-                await asyncio.sleep(5)
 
-        duration = datetime.now() - start_time
-        self._last_command_send = datetime.now()
+        duration = self._clock.now() - start_time
+        self._last_command_send = self._clock.now()
 
         _LOGGER.info(
             "Command completed for VIN %s in %ss", self.vin, duration.total_seconds()
@@ -133,68 +317,236 @@ class TeslaVehicle(TeslaBaseDevice):
 
         return response
 
-    async def async_start_charge(self) -> TeslaAPIResponse:
-        """Toggle the charge state of the vehicle."""
-        result = await self._async_send_command(
-            partial(self._apiClient.async_start_charge, self.vin)
-        )
+    async def async_send_commands(
+        self, commands: Sequence[VehicleCommand]
+    ) -> list[TeslaAPIResponse]:
+        """Send commands in order, sharing a single wake up.
+
+        When the vehicle has to be woken up, commands are queued for
+        COMMAND_COALESCE_DELAY so that the ones sent meanwhile by other calls
+        run in the same wake window. The commands are sent in order, those
+        queued after a command that failed are not sent and fail as well.
+        """
+        if not commands:
+            return []
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in commands]
+        self._enqueue(commands, futures)
+
+        if self._queue_task is None:
+            delay = COMMAND_COALESCE_DELAY if self.needs_wake_up else 0
+            self._queue_task = loop.create_task(
+                self._async_run_queue(delay), name=f"Tesla commands {self.vin}"
+            )
 
-        await self.async_wait_charging_state(ChargingState.CHARGING)
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    def _enqueue(
+        self, commands: Sequence[VehicleCommand], futures: list[asyncio.Future]
+    ) -> None:
+        """Queue the commands of a call.
+
+        While the queue waits for COMMAND_COALESCE_DELAY, a command replaces
+        the command of the same group queued by an earlier call. The callers
+        of an identical command share its response, the callers of another one
+        get a TeslaCommandSupersededException.
+        """
+        earlier = list(self._queue) if self._coalescing else []
+        for command, future in zip(commands, futures):
+            queued = _QueuedCommand(command, [future])
+            for other in earlier:
+                if other.command.spec.group != command.spec.group:
+                    continue
+                _LOGGER.debug(
+                    "Command %s replaces queued %s for VIN %s",
+                    command.name,
+                    other.command.name,
+                    self.vin,
+                )
+                earlier.remove(other)
+                self._queue.remove(other)
+                if other.command == command:
+                    queued.futures[:0] = other.futures
+                else:
+                    other.set_exception(
+                        TeslaCommandSupersededException(
+                            f"Command {other.command.name} for vehicle {self.vin}"
+                            f" was replaced by {command.name}"
+                        )
+                    )
+                break
+            self._queue.append(queued)
 
-        return result
+    def cancel_commands(self) -> None:
+        """Cancel the queued commands and the ones being sent."""
+        if self._queue_task is not None:
+            self._queue_task.cancel()
 
-    async def async_stop_charge(self) -> TeslaAPIResponse:
-        """Toggle the charge state of the vehicle."""
-        result = await self._async_send_command(
-            partial(self._apiClient.async_stop_charge, self.vin)
+    async def _async_run_queue(self, delay: float) -> None:
+        """Wake up the vehicle once and run the queued commands back to back."""
+        try:
+            if delay:
+                self._coalescing = True
+                try:
+                    await self._clock.sleep(delay)
+                finally:
+                    self._coalescing = False
+            while self._queue:
+                batch, self._queue = self._queue, []
+                try:
+                    await self._async_run_batch(batch)
+                finally:
+                    for queued in batch:
+                        queued.cancel()
+        finally:
+            for queued in self._queue:
+                queued.cancel()
+            self._queue, self._queue_task = [], None
+
+    async def _async_run_batch(self, batch: list[_QueuedCommand]) -> None:
+        """Run a batch of queued commands after a single wake up check."""
+        _LOGGER.debug(
+            "Running %d command(s) for VIN %s: %s",
+            len(batch),
+            self.vin,
+            [queued.command.name for queued in batch],
         )
+        with TRACER.span("command_batch", vin=self.vin, commands=len(batch)):
+            try:
+                await self.async_ensure_car_woke_up()
+            except Exception as err:
+                for queued in batch:
+                    queued.set_exception(err)
+                return
 
-        await self.async_wait_charging_state(ChargingState.STOPPED)
+            for index, queued in enumerate(batch):
+                if queued.abandoned:
+                    continue
+                if (failure := await self._async_run_queued(queued)) is None:
+                    continue
+                # Later commands may depend on the failed one
+                for skipped in batch[index + 1 :]:
+                    skipped.set_exception(
+                        TeslaBaseException(
+                            f"Command {skipped.command.name} for vehicle {self.vin}"
+                            f" was not sent, {queued.command.name} failed: {failure}"
+                        )
+                    )
+                return
 
-        return result
+    async def _async_run_queued(self, queued: _QueuedCommand) -> Exception | None:
+        """Send a queued command and hand its outcome to the callers.
 
-    async def async_wait_charging_state(self, state: ChargingState) -> None:
-        """Wait for the vehicle to reach a specific charging state."""
-        start_time = datetime.now()
-        _LOGGER.debug("Waiting for vehicle to reach charging state %s", state)
+        Return the error of a failed command.
+        """
+        command = queued.command
+        method = getattr(self._apiClient, command.spec.method)
+        args = () if command.value is None else (command.value,)
+        try:
+            with TRACER.span(
+                "command", vin=self.vin, command=command.name, value=command.value
+            ):
+                response = await self._async_send_command(
+                    partial(method, self.vin, *args)
+                )
+        except Exception as err:
+            queued.set_exception(err)
+            return err
+        self._sections.invalidate(command.spec.section, hold=CONFIRM_TIMEOUT)
+        queued.set_result(response)
+        for listener in list(self._command_listeners):
+            listener(command)
+        return None
+
+    async def async_confirm_commands(
+        self, commands: Sequence[VehicleCommand]
+    ) -> VehicleData:
+        """Wait for the vehicle data to show the effect of every command."""
+        commands = coalesce(commands)
+        with TRACER.span("confirm", vin=self.vin, commands=len(commands)):
+            return await self.async_wait_for_data(
+                lambda data: all(command.is_confirmed(data) for command in commands)
+            )
 
-        while datetime.now() - start_time < timedelta(seconds=30):
-            await asyncio.sleep(5)
-            await self.async_get_vehicle_data()
+    async def _async_send_one(self, command: VehicleCommand) -> TeslaAPIResponse:
+        """Send a single command through the command queue."""
+        (response,) = await self.async_send_commands([command])
+        return response
+
+    async def async_start_charge(self) -> TeslaAPIResponse:
+        """Start charging the vehicle."""
+        return await self._async_send_one(VehicleCommand(COMMAND_CHARGE_START))
 
-            if self.current_data.charge_state.charging_state == state:
-                time = datetime.now() - start_time
+    async def async_stop_charge(self) -> TeslaAPIResponse:
+        """Stop charging the vehicle."""
+        return await self._async_send_one(VehicleCommand(COMMAND_CHARGE_STOP))
+
+    async def async_wait_for_data(
+        self,
+        predicate: Callable[[VehicleData], bool],
+        timeout: float = CONFIRM_TIMEOUT,
+    ) -> VehicleData:
+        """Poll the vehicle data until it matches the predicate.
+
+        The first polls are close to each other to confirm fast commands quickly,
+        the interval then doubles up to CONFIRM_MAX_INTERVAL.
+        """
+        start_time = self._clock.now()
+        deadline = start_time + timedelta(seconds=timeout)
+        interval = CONFIRM_INITIAL_INTERVAL
+
+        while (remaining := (deadline - self._clock.now()).total_seconds()) > 0:
+            await self._clock.sleep(min(interval, remaining))
+            interval = min(interval * 2, CONFIRM_MAX_INTERVAL)
+
+            data = await self.async_get_vehicle_data()
+            if data is not None and predicate(data):
                 _LOGGER.debug(
-                    "Vehicle reached charging state %s in %ss",
-                    self.current_data.charge_state.charging_state,
-                    time.total_seconds(),
+                    "Vehicle %s confirmed state in %ss",
+                    self.vin,
+                    (self._clock.now() - start_time).total_seconds(),
                 )
-                return
+                return data
 
         raise TeslaBaseException(
-            f"Vehicle did not reach charging state {state} in time"
+            f"Vehicle {self.vin} did not reach the expected state in time"
         )
 
+    async def async_wait_charging_state(self, state: ChargingState) -> VehicleData:
+        """Wait for the vehicle to reach a specific charging state."""
+        _LOGGER.debug("Waiting for vehicle to reach charging state %s", state)
+
+        try:
+            return await self.async_wait_for_data(
+                lambda data: data.charge_state.charging_state == state
+            )
+        except TeslaBaseException as err:
+            raise TeslaBaseException(
+                f"Vehicle did not reach charging state {state} in time"
+            ) from err
+
     async def async_set_charge_limit(self, limit: int) -> TeslaAPIResponse:
         """Set the charge limit of the vehicle."""
-        return await self._async_send_command(
-            partial(self._apiClient.async_set_charge_limit, self.vin, limit)
+        return await self._async_send_one(
+            VehicleCommand(COMMAND_SET_CHARGE_LIMIT, limit)
         )
 
-    async def async_set_charge_amps(self, amps: int) -> TeslaAPIResponse:
+    async def async_set_charge_amps(
+        self, amps: int, automatic: bool = False
+    ) -> TeslaAPIResponse:
         """Set the charge amps of the vehicle."""
-        return await self._async_send_command(
-            partial(self._apiClient.async_set_charge_amps, self.vin, amps)
+        return await self._async_send_one(
+            VehicleCommand(COMMAND_SET_CHARGING_AMPS, amps, automatic=automatic)
         )
 
     async def async_lock_doors(self) -> TeslaAPIResponse:
         """Lock the doors of the vehicle."""
-        return await self._async_send_command(
-            partial(self._apiClient.async_lock_doors, self.vin)
-        )
+        return await self._async_send_one(VehicleCommand(COMMAND_DOOR_LOCK))
 
     async def async_unlock_doors(self) -> TeslaAPIResponse:
         """Unlock the doors of the vehicle."""
-        return await self._async_send_command(
-            partial(self._apiClient.async_unlock_doors, self.vin)
-        )
+        return await self._async_send_one(VehicleCommand(COMMAND_DOOR_UNLOCK))
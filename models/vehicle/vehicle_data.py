@@ -1,5 +1,7 @@
 """Vehicle data model for Tesla vehicles."""
 
+from ..schema import MILES_TO_KM, Field, LazySection, snapshot_class
+
 
 class ChargingState:
     """Class to hold charging state."""
@@ -11,40 +13,207 @@ class ChargingState:
     DISCONNECTED = "Disconnected"
 
 
-class VehicleChargeState:
-    """Class to hold vehicle charge state."""
+CHARGE_STATE_SCHEMA: dict[str, Field] = {
+    "battery_level": Field(int, 0, unit="%"),
+    "usable_battery_level": Field(int, unit="%"),
+    "battery_range": Field(float, 0.0, scale=MILES_TO_KM, unit="km"),
+    "est_battery_range": Field(float, scale=MILES_TO_KM, unit="km"),
+    "ideal_battery_range": Field(float, scale=MILES_TO_KM, unit="km"),
+    "battery_heater_on": Field(bool),
+    "charge_amps": Field(int, 0, unit="A"),
+    "charger_actual_current": Field(int, fallback="charge_amps", unit="A"),
+    "charger_pilot_current": Field(int, unit="A"),
+    "charger_phases": Field(int),
+    "charger_power": Field(int, unit="kW"),
+    "charger_voltage": Field(int, 240, unit="V"),
+    "charge_current_request": Field(int, 0, unit="A"),
+    "charge_current_request_max": Field(int, 0, unit="A"),
+    "charge_enable_request": Field(bool),
+    "charge_energy_added": Field(float, 0.0, unit="kWh"),
+    "charge_limit_soc": Field(int, 0, unit="%"),
+    "charge_limit_soc_max": Field(int, unit="%"),
+    "charge_limit_soc_min": Field(int, unit="%"),
+    "charge_limit_soc_std": Field(int, unit="%"),
+    "charge_miles_added_rated": Field(float, scale=MILES_TO_KM, unit="km"),
+    "charge_port_door_open": Field(bool),
+    "charge_port_latch": Field(str),
+    "charge_rate": Field(float, scale=MILES_TO_KM, unit="km/h"),
+    "charging_state": Field(str, ChargingState.STOPPED),
+    "conn_charge_cable": Field(str),
+    "fast_charger_present": Field(bool),
+    "fast_charger_type": Field(str),
+    "minutes_to_full_charge": Field(int, 0, unit="min"),
+    "time_to_full_charge": Field(float, unit="h"),
+    "scheduled_charging_pending": Field(bool),
+    "scheduled_charging_start_time": Field(int),
+    "timestamp": Field(int),
+}
 
-    def __init__(self, data: dict) -> None:
-        """Initialize the vehicle charge state with the given data."""
-        self.battery_level = data.get("battery_level", 0)
-        self.battery_range = data.get("battery_range", 0)
-        self.charge_amps = data.get("charge_amps", 0)
-        self.charger_actual_current = data.get(
-            "charger_actual_current", self.charge_amps
-        )
-        self.charge_current_request = data.get("charge_current_request", 0)
-        self.charge_current_request_max = data.get("charge_current_request_max", 0)
-        self.charge_limit_soc = data.get("charge_limit_soc", 0)
-        self.minutes_to_full_charge = data.get("minutes_to_full_charge", 0)
-        self.charging_state = data.get("charging_state", ChargingState.STOPPED)
-        self.charger_voltage = data.get("charger_voltage", 240)
-        self.charge_energy_added = data.get("charge_energy_added", 0)
+VEHICLE_STATE_SCHEMA: dict[str, Field] = {
+    "odometer": Field(int, 0, scale=MILES_TO_KM, unit="km"),
+    "locked": Field(bool, False),
+    "car_version": Field(str),
+    "center_display_state": Field(int),
+    "df": Field(int),
+    "dr": Field(int),
+    "pf": Field(int),
+    "pr": Field(int),
+    "ft": Field(int),
+    "rt": Field(int),
+    "fd_window": Field(int),
+    "fp_window": Field(int),
+    "rd_window": Field(int),
+    "rp_window": Field(int),
+    "is_user_present": Field(bool),
+    "sentry_mode": Field(bool),
+    "valet_mode": Field(bool),
+    "tpms_pressure_fl": Field(float, unit="bar"),
+    "tpms_pressure_fr": Field(float, unit="bar"),
+    "tpms_pressure_rl": Field(float, unit="bar"),
+    "tpms_pressure_rr": Field(float, unit="bar"),
+    "timestamp": Field(int),
+}
+
+CLIMATE_STATE_SCHEMA: dict[str, Field] = {
+    "inside_temp": Field(float, unit="°C"),
+    "outside_temp": Field(float, unit="°C"),
+    "driver_temp_setting": Field(float, unit="°C"),
+    "passenger_temp_setting": Field(float, unit="°C"),
+    "is_climate_on": Field(bool),
+    "is_auto_conditioning_on": Field(bool),
+    "is_preconditioning": Field(bool),
+    "is_front_defroster_on": Field(bool),
+    "is_rear_defroster_on": Field(bool),
+    "battery_heater": Field(bool),
+    "cabin_overheat_protection": Field(str),
+    "climate_keeper_mode": Field(str),
+    "defrost_mode": Field(int),
+    "fan_status": Field(int),
+    "seat_heater_left": Field(int),
+    "seat_heater_right": Field(int),
+    "steering_wheel_heater": Field(bool),
+    "timestamp": Field(int),
+}
+
+DRIVE_STATE_SCHEMA: dict[str, Field] = {
+    "shift_state": Field(str),
+    "speed": Field(float, scale=MILES_TO_KM, unit="km/h"),
+    "power": Field(int, unit="kW"),
+    "heading": Field(int, unit="°"),
+    "latitude": Field(float),
+    "longitude": Field(float),
+    "gps_as_of": Field(int),
+    "timestamp": Field(int),
+}
 
+VEHICLE_CONFIG_SCHEMA: dict[str, Field] = {
+    "car_type": Field(str),
+    "trim_badging": Field(str),
+    "exterior_color": Field(str),
+    "wheel_type": Field(str),
+    "charge_port_type": Field(str),
+    "plg": Field(bool),
+    "rhd": Field(bool),
+    "has_seat_cooling": Field(bool),
+    "can_accept_navigation_requests": Field(bool),
+    "timestamp": Field(int),
+}
 
-class VehicleState:
-    """Class to hold vehicle state."""
+GUI_SETTINGS_SCHEMA: dict[str, Field] = {
+    "gui_24_hour_time": Field(bool),
+    "gui_charge_rate_units": Field(str),
+    "gui_distance_units": Field(str),
+    "gui_range_display": Field(str),
+    "gui_temperature_units": Field(str),
+    "gui_tirepressure_units": Field(str),
+    "show_range_units": Field(bool),
+    "timestamp": Field(int),
+}
 
-    def __init__(self, data: dict) -> None:
-        """Initialize the vehicle state with the given data."""
-        self.odometer = int(data.get("odometer", 0))
-        self.locked = data.get("locked", False)
+# Schema of each section of the vehicle_data payload
+SECTION_SCHEMAS: dict[str, dict[str, Field]] = {
+    "charge_state": CHARGE_STATE_SCHEMA,
+    "vehicle_state": VEHICLE_STATE_SCHEMA,
+    "climate_state": CLIMATE_STATE_SCHEMA,
+    "drive_state": DRIVE_STATE_SCHEMA,
+    "vehicle_config": VEHICLE_CONFIG_SCHEMA,
+    "gui_settings": GUI_SETTINGS_SCHEMA,
+}
+
+VehicleChargeState = snapshot_class(
+    "VehicleChargeState", CHARGE_STATE_SCHEMA, "Vehicle charge state snapshot."
+)
+VehicleState = snapshot_class(
+    "VehicleState", VEHICLE_STATE_SCHEMA, "Vehicle state snapshot."
+)
+VehicleClimateState = snapshot_class(
+    "VehicleClimateState", CLIMATE_STATE_SCHEMA, "Vehicle climate state snapshot."
+)
+VehicleDriveState = snapshot_class(
+    "VehicleDriveState", DRIVE_STATE_SCHEMA, "Vehicle drive state snapshot."
+)
+VehicleConfig = snapshot_class(
+    "VehicleConfig", VEHICLE_CONFIG_SCHEMA, "Vehicle configuration snapshot."
+)
+VehicleGuiSettings = snapshot_class(
+    "VehicleGuiSettings", GUI_SETTINGS_SCHEMA, "Vehicle display settings snapshot."
+)
 
 
 class VehicleData:
-    """Class to hold vehicle data."""
+    """Immutable snapshot of the vehicle data.
+
+    Sections are parsed from the raw payload the first time they are accessed.
+    """
+
+    __slots__ = (
+        "_charge_state",
+        "_climate_state",
+        "_drive_state",
+        "_gui_settings",
+        "_raw",
+        "_vehicle_config",
+        "_vehicle_state",
+        "state",
+    )
+
+    charge_state: VehicleChargeState = LazySection("charge_state", VehicleChargeState)
+    vehicle_state: VehicleState = LazySection("vehicle_state", VehicleState)
+    climate_state: VehicleClimateState = LazySection(
+        "climate_state", VehicleClimateState
+    )
+    drive_state: VehicleDriveState = LazySection("drive_state", VehicleDriveState)
+    vehicle_config: VehicleConfig = LazySection("vehicle_config", VehicleConfig)
+    gui_settings: VehicleGuiSettings = LazySection("gui_settings", VehicleGuiSettings)
 
-    def __init__(self, data: dict) -> None:
+    def __init__(self, data: dict, state: str | None = None) -> None:
         """Initialize the vehicle data with the given data."""
-        self.state = data.get("state", "offline")
-        self.charge_state = VehicleChargeState(data.get("charge_state", {}))
-        self.vehicle_state = VehicleState(data.get("vehicle_state", {}))
+        object.__setattr__(self, "_raw", data)
+        object.__setattr__(self, "state", state or data.get("state", "offline"))
+
+    def __setattr__(self, name, value) -> None:
+        """Prevent mutation of the snapshot."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether both snapshots hold the same data."""
+        if not isinstance(other, VehicleData):
+            return NotImplemented
+        return self.state == other.state and (
+            self._raw is other._raw or self._raw == other._raw
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """Return a representation of the snapshot."""
+        return f"VehicleData(state={self.state!r})"
+
+    @property
+    def raw(self) -> dict:
+        """Return the raw payload of the snapshot."""
+        return self._raw
+
+    def with_state(self, state: str) -> "VehicleData":
+        """Return a copy of the snapshot with another vehicle state."""
+        return VehicleData(self._raw, state)
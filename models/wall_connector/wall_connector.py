@@ -1,17 +1,29 @@
 """Wall Connector models."""
 
+from ...clock import SYSTEM_CLOCK, Clock
 from ...owner_api.client import TeslaAPIClient
 from ..device import TeslaBaseDevice
-from .wall_connector_data import WallConnectorData
+from .wall_connector_data import (
+    WallConnectorData,
+    WallConnectorState,
+    WallConnectorStatus,
+)
 
 
 class WallConnector(TeslaBaseDevice):
     """Representation of a Tesla Wall Connector."""
 
-    def __init__(self, wall_connector_id: str, apiClient: TeslaAPIClient) -> None:
+    def __init__(
+        self,
+        wall_connector_id: str,
+        apiClient: TeslaAPIClient,
+        clock: Clock | None = None,
+    ) -> None:
         """Initialize the Wall Connector."""
         super().__init__(wall_connector_id, apiClient)
+        self._clock = clock or SYSTEM_CLOCK
         self._current_data = None
+        self._last_update: float | None = None
 
     @property
     def wall_connector_id(self) -> str:
@@ -23,11 +35,54 @@ class WallConnector(TeslaBaseDevice):
         """Return the current data of the Wall Connector (cached)."""
         return self._current_data
 
-    async def async_get_wall_connector_data(self) -> dict:
-        """Get Wall Connector data."""
-        wall_connector_data = await self._apiClient.async_get_wall_connector_status(
-            self.wall_connector_id
+    def update_from_live_status(self, response: dict) -> WallConnectorData:
+        """Update the wall connectors from a live status payload of the site."""
+        self._current_data = self._with_session_energy(WallConnectorData(response))
+        return self._current_data
+
+    def _with_session_energy(self, data: WallConnectorData) -> WallConnectorData:
+        """Fill the session energy of connectors that do not report it.
+
+        The energy is integrated from the power reported by consecutive polls
+        and reset when the vehicle is unplugged. A connector without a DIN
+        cannot be matched to its previous poll and reports 0.
+        """
+        now = self._clock.monotonic()
+        previous = self._current_data
+        elapsed_hours = (
+            (now - self._last_update) / 3600 if self._last_update is not None else 0
         )
-        self._current_data = WallConnectorData(wall_connector_data.data)
+        self._last_update = now
 
-        return self._current_data
+        connectors = []
+        for connector in data.connectors:
+            if connector.session_energy_wh is None:
+                connector = connector._replace(
+                    session_energy_wh=self._integrate_session_energy(
+                        connector,
+                        previous.by_din.get(connector.din) if previous else None,
+                        elapsed_hours,
+                    )
+                )
+            connectors.append(connector)
+
+        return WallConnectorData.from_connectors(tuple(connectors))
+
+    @staticmethod
+    def _integrate_session_energy(
+        connector: WallConnectorStatus,
+        previous: WallConnectorStatus | None,
+        elapsed_hours: float,
+    ) -> float:
+        """Return the session energy of a connector in Wh."""
+        if (
+            previous is None
+            or connector.wall_connector_state == WallConnectorState.DISCONNECTED
+            or (previous.vin and connector.vin and previous.vin != connector.vin)
+        ):
+            return 0.0
+
+        average_power = (
+            previous.wall_connector_power + connector.wall_connector_power
+        ) / 2
+        return (previous.session_energy_wh or 0.0) + average_power * elapsed_hours
@@ -1,16 +1,136 @@
 """Wall Connector models."""
 
+from ..schema import Field, snapshot_class
+
+
+class WallConnectorState:
+    """Class to hold wall connector states."""
+
+    BOOTING = 0
+    CHARGING = 1
+    DISCONNECTED = 2
+    CONNECTED = 4
+    SCHEDULED = 5
+    NEGOTIATING = 6
+    ERROR = 7
+    CHARGING_FINISHED = 8
+    WAITING_CAR = 9
+    CHARGING_REDUCED = 10
+
+    NAMES = {
+        BOOTING: "booting",
+        CHARGING: "charging",
+        DISCONNECTED: "disconnected",
+        CONNECTED: "connected",
+        SCHEDULED: "scheduled",
+        NEGOTIATING: "negotiating",
+        ERROR: "error",
+        CHARGING_FINISHED: "charging_finished",
+        WAITING_CAR: "waiting_car",
+        CHARGING_REDUCED: "charging_reduced",
+    }
+
+
+WALL_CONNECTOR_SCHEMA: dict[str, Field] = {
+    "din": Field(str, ""),
+    "vin": Field(str, ""),
+    "wall_connector_state": Field(int),
+    "wall_connector_fault_state": Field(int),
+    "wall_connector_power": Field(float, 0.0),
+    "ocpp_status": Field(int),
+    "powershare_session_state": Field(int),
+    "session_energy_wh": Field(float),
+}
+
+
+class WallConnectorStatus(
+    snapshot_class(
+        "WallConnectorStatus",
+        WALL_CONNECTOR_SCHEMA,
+        "Live status snapshot of a single wall connector.",
+    )
+):
+    """Live status snapshot of a single wall connector."""
+
+    __slots__ = ()
+
+    @property
+    def state_name(self) -> str | None:
+        """Return the name of the wall connector state."""
+        if self.wall_connector_state is None:
+            return None
+        return WallConnectorState.NAMES.get(
+            self.wall_connector_state, str(self.wall_connector_state)
+        )
+
+    @property
+    def is_connected(self) -> bool:
+        """Return whether a vehicle is plugged in the wall connector."""
+        return bool(self.vin) or self.wall_connector_state not in (
+            None,
+            WallConnectorState.BOOTING,
+            WallConnectorState.DISCONNECTED,
+        )
+
+    @property
+    def session_energy_kwh(self) -> float | None:
+        """Return the energy delivered during the current session in kWh."""
+        if self.session_energy_wh is None:
+            return None
+        return self.session_energy_wh / 1000
+
 
 class WallConnectorData:
-    """Representation of Wall Connector data."""
+    """Representation of the live status of every wall connector of a site."""
+
+    __slots__ = ("by_din", "by_vin", "connectors")
 
     def __init__(self, response: dict) -> None:
         """Initialize the Wall Connector data."""
-
-        self._data = (
-            response.get("wall_connectors", [])[0]
-            if response.get("wall_connectors")
-            else {}
+        self._index(
+            tuple(
+                WallConnectorStatus.from_dict(connector)
+                for connector in response.get("wall_connectors") or ()
+            )
         )
 
-        self.vin = self._data.get("vin", "")
+    @classmethod
+    def from_connectors(
+        cls, connectors: tuple[WallConnectorStatus, ...]
+    ) -> "WallConnectorData":
+        """Build the data from already parsed connector snapshots."""
+        data = cls.__new__(cls)
+        data._index(connectors)
+        return data
+
+    def _index(self, connectors: tuple[WallConnectorStatus, ...]) -> None:
+        """Store the connectors and index them by DIN and connected VIN."""
+        self.connectors = connectors
+        self.by_din = {
+            connector.din: connector for connector in connectors if connector.din
+        }
+        self.by_vin = {
+            connector.vin: connector for connector in connectors if connector.vin
+        }
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether both snapshots hold the same connectors."""
+        if not isinstance(other, WallConnectorData):
+            return NotImplemented
+        return self.connectors == other.connectors
+
+    __hash__ = None
+
+    @property
+    def vin(self) -> str:
+        """Return the VIN of the first connected vehicle."""
+        return next(iter(self.by_vin), "")
+
+    @property
+    def total_power(self) -> float:
+        """Return the power delivered by all wall connectors in W."""
+        return sum(connector.wall_connector_power for connector in self.connectors)
+
+    def get_connector_for_vin(self, vin: str) -> WallConnectorStatus | None:
+        """Return the wall connector a vehicle is plugged in, if any."""
+        return self.by_vin.get(vin)
@@ -1,38 +1,21 @@
 """Tesla Connector Number Entity."""
 
-from homeassistant.components.number import NumberDeviceClass
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .base_sensor import TeslaBaseNumber, TeslaSensorDescription
+from .base_sensor import TeslaBaseNumber
 from .const import DOMAIN, SENSOR_CHARGE_AMPS, SENSOR_CHARGE_LIMIT_SOC
-from .coordinator import TeslaVehicleCoordinator
-from .models.vehicle.vehicle import TeslaVehicle
-
-NUMBER_DESCRIPTIONS: dict[str, TeslaSensorDescription] = {
-    SENSOR_CHARGE_LIMIT_SOC: TeslaSensorDescription(
-        name="Limite de charge",
-        value_path="charge_state.charge_limit_soc",
-        unit=PERCENTAGE,
-        device_class=NumberDeviceClass.BATTERY,
-        icon="mdi:battery",
-        min_value=0,
-        max_value=100,
-        step=5,
-    ),
-    SENSOR_CHARGE_AMPS: TeslaSensorDescription(
-        name="Ampères de charge",
-        value_path="charge_state.charge_amps",
-        unit=None,
-        device_class=NumberDeviceClass.CURRENT,
-        icon="mdi:flash",
-        min_value=1,
-        max_value=32,
-        step=1,
-    ),
-}
+from .entity_descriptions import NUMBER_DESCRIPTIONS, TeslaSensorDescription
+
+if TYPE_CHECKING:
+    from .coordinator import TeslaVehicleCoordinator
+    from .models.vehicle.vehicle import TeslaVehicle
 
 
 async def async_setup_entry(
@@ -69,11 +52,19 @@ class TeslaNumber(TeslaBaseNumber):
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new charge limit."""
-        if self._key == SENSOR_CHARGE_LIMIT_SOC:
-            await self._vehicle.async_set_charge_limit(int(value))
-        elif self._key == SENSOR_CHARGE_AMPS:
-            await self._vehicle.async_set_charge_amps(int(value))
-            if value < 5 and self._attr_native_value > 5:
-                await self._vehicle.async_set_charge_amps(int(value))
-
-        await self.coordinator.async_request_refresh()
+        value = int(value)
+        previous_value = self._attr_native_value
+
+        async def _async_command() -> None:
+            if self._key == SENSOR_CHARGE_LIMIT_SOC:
+                await self._vehicle.async_set_charge_limit(value)
+            elif self._key == SENSOR_CHARGE_AMPS:
+                await self._vehicle.async_set_charge_amps(value)
+                if value < 5 and previous_value is not None and previous_value > 5:
+                    await self._vehicle.async_set_charge_amps(value)
+
+        self.async_run_optimistic_command(
+            value,
+            _async_command,
+            partial(self._vehicle.async_wait_for_data, self._value_matches(value)),
+        )
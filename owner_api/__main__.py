@@ -0,0 +1,214 @@
+"""Poll the Tesla Owner API from the command line and report latencies.
+
+Runs without a Home Assistant instance, from the configuration directory. The
+integration package imports homeassistant, which must be installed:
+
+    python -m custom_components.tesla_connector.owner_api \\
+        --token REFRESH_TOKEN --vin VIN --site SITE_ID --rate 6 --duration 300
+
+vehicle_data and the site live status, which carries the wall connectors, are
+polled at the given rate per minute. --commands runs command round trips
+afterwards, each setting the charge limit to its current value. The JSON
+report gives, per operation, the latency distribution, the JSON size of the
+payloads and the errors. With --base-url and --token-url it polls a local
+stand-in instead, e.g. the one of benchmarks/standin.py.
+"""
+
+import argparse
+import asyncio
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+import json
+import logging
+import statistics
+import sys
+import time
+
+from ..const import OAUTH2_TOKEN
+from .api_response import TeslaAPIResponse
+from .client import TeslaAPIClient
+from .endpoints import OWNER_API_BASE_URL
+from .hedging import percentile_of
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class OperationStats:
+    """Latencies, payload sizes and errors of an operation."""
+
+    latencies: list[float] = field(default_factory=list)
+    sizes: list[int] = field(default_factory=list)
+    errors: Counter[str] = field(default_factory=Counter)
+
+    async def async_time(
+        self, call: Callable[[], Awaitable[TeslaAPIResponse | None]]
+    ) -> TeslaAPIResponse | None:
+        """Run the call and record its latency and payload size."""
+        start = time.perf_counter()
+        try:
+            response = await call()
+        except Exception as err:
+            _LOGGER.debug("Request failed: %s", err)
+            self.errors[str(getattr(err, "status", None) or type(err).__name__)] += 1
+            return None
+        self.latencies.append(time.perf_counter() - start)
+        if response is not None:
+            self.sizes.append(len(json.dumps(response.data, separators=(",", ":"))))
+        return response
+
+    def as_dict(self) -> dict:
+        """Return the report of the operation, latencies in milliseconds."""
+        latencies = [latency * 1000 for latency in self.latencies]
+        return {
+            "count": len(latencies),
+            "errors": dict(self.errors),
+            "latency_ms": {
+                "mean": round(statistics.fmean(latencies), 1) if latencies else 0.0,
+                "p50": round(percentile_of(latencies, 50), 1),
+                "p90": round(percentile_of(latencies, 90), 1),
+                "p95": round(percentile_of(latencies, 95), 1),
+                "p99": round(percentile_of(latencies, 99), 1),
+                "max": round(max(latencies, default=0.0), 1),
+            },
+            "payload_bytes": {
+                "mean": round(statistics.fmean(self.sizes)) if self.sizes else 0,
+                "max": max(self.sizes, default=0),
+            },
+        }
+
+
+async def _async_poll(
+    call: Callable[[], Awaitable[TeslaAPIResponse]],
+    stats: OperationStats,
+    interval: float,
+    duration: float,
+) -> None:
+    """Run the call at a fixed rate for the duration."""
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    tick = 0
+    while loop.time() - start < duration:
+        await stats.async_time(call)
+        tick += 1
+        await asyncio.sleep(max(start + tick * interval - loop.time(), 0))
+
+
+async def _async_commands(
+    client: TeslaAPIClient, vin: str, count: int, stats: OperationStats
+) -> None:
+    """Run command round trips that leave the vehicle unchanged."""
+    try:
+        response = await client.async_get_vehicle_data(vin)
+    except Exception as err:
+        _LOGGER.debug("Request failed: %s", err)
+        status = getattr(err, "status", None)
+        if status == 408:
+            stats.errors["vehicle asleep, pass --wake"] += 1
+        else:
+            stats.errors[str(status or type(err).__name__)] += 1
+        return
+    limit = response.data["charge_state"]["charge_limit_soc"]
+    for _ in range(count):
+        await stats.async_time(lambda: client.async_set_charge_limit(vin, limit))
+
+
+async def async_run(args: argparse.Namespace) -> dict:
+    """Poll the API as configured and return the report."""
+    client = TeslaAPIClient(
+        args.token, base_url=args.base_url, token_url=args.token_url
+    )
+    try:
+        return await _async_run(client, args)
+    finally:
+        await client.async_close()
+
+
+async def _async_run(client: TeslaAPIClient, args: argparse.Namespace) -> dict:
+    """Run the polls and commands with the client."""
+    if args.hedge:
+        client.enable_hedging()
+
+    operations: dict[str, OperationStats] = {}
+    authenticate = operations["token"] = OperationStats()
+    await authenticate.async_time(client.async_authenticate)
+    if authenticate.errors:
+        return {"operations": {"token": authenticate.as_dict()}}
+
+    if args.vin and args.wake:
+        await operations.setdefault("wake_up", OperationStats()).async_time(
+            lambda: client.async_wake_up_car(args.vin)
+        )
+
+    polls = []
+    interval = 60 / args.rate
+    if args.vin:
+        polls.append(
+            _async_poll(
+                lambda: client.async_get_vehicle_data(args.vin),
+                operations.setdefault("vehicle_data", OperationStats()),
+                interval,
+                args.duration,
+            )
+        )
+    if args.site:
+        polls.append(
+            _async_poll(
+                lambda: client.async_get_site_live_status(args.site),
+                operations.setdefault("live_status", OperationStats()),
+                interval,
+                args.duration,
+            )
+        )
+    await asyncio.gather(*polls)
+
+    if args.vin and args.commands:
+        await _async_commands(
+            client,
+            args.vin,
+            args.commands,
+            operations.setdefault("command", OperationStats()),
+        )
+
+    return {
+        "base_url": args.base_url,
+        "rate_per_minute": args.rate,
+        "duration_s": args.duration,
+        "operations": {name: stats.as_dict() for name, stats in operations.items()},
+        "hedging": client.hedge_stats,
+    }
+
+
+def main() -> int:
+    """Print the JSON report of the polls."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--token", required=True, help="refresh token")
+    parser.add_argument("--vin", help="vehicle to poll")
+    parser.add_argument("--site", help="energy site to poll")
+    parser.add_argument("--rate", type=float, default=6, help="polls per minute")
+    parser.add_argument("--duration", type=float, default=60, help="in seconds")
+    parser.add_argument("--commands", type=int, default=0, help="round trips")
+    parser.add_argument("--wake", action="store_true", help="wake the vehicle first")
+    parser.add_argument("--hedge", action="store_true", help="hedge slow requests")
+    parser.add_argument("--base-url", default=OWNER_API_BASE_URL)
+    parser.add_argument("--token-url", default=OAUTH2_TOKEN)
+    parser.add_argument("--output", help="write the report to a file")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    if not args.vin and not args.site:
+        parser.error("nothing to poll, give --vin and/or --site")
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+    report = json.dumps(asyncio.run(async_run(args)), indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(report + "\n")
+    else:
+        print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
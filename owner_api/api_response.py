@@ -4,10 +4,11 @@
 class TeslaAPIResponse:
     """Base class for Tesla API responses."""
 
-    def __init__(self, response: dict) -> None:
+    def __init__(self, response: dict | list) -> None:
         """Initialize the response with the given data."""
-        self._result = response.get("result", False)
-        self._reason = response.get("reason", "")
+        details = response if isinstance(response, dict) else {}
+        self._result = details.get("result", False)
+        self._reason = details.get("reason", "")
         self._data = response
 
     @property
@@ -21,6 +22,6 @@ class TeslaAPIResponse:
         return self._reason
 
     @property
-    def data(self) -> dict:
+    def data(self) -> dict | list:
         """Return the data from the API response."""
         return self._data
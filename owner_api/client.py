@@ -1,25 +1,42 @@
 """Client for interacting with the Tesla Owner API."""
 
-import asyncio
-from datetime import datetime, timedelta
+from datetime import timedelta
+from functools import partial
 import logging
-
-import aiohttp
-
-from ..const import OAUTH2_CLIENT_ID, OAUTH2_TOKEN, WAKE_UP_TIMEOUT
+from pathlib import Path
+
+from ..clock import SYSTEM_CLOCK, Clock
+from ..const import (
+    COMMAND_BUDGET,
+    OAUTH2_CLIENT_ID,
+    OAUTH2_TOKEN,
+    WAKE_UP_INTERVAL,
+    WAKE_UP_TIMEOUT,
+)
+from ..tracing import TRACER
 from .api_response import TeslaAPIResponse
 from .endpoints import (
     CHARGE_START_ENDPOINT,
     CHARGE_STOP_ENDPOINT,
     GET_VEHICLE_DATA_ENDPOINT,
+    GET_VEHICLE_ENDPOINT,
     LOCK_DOORS_ENDPOINT,
+    OWNER_API_BASE_URL,
+    PRODUCTS_ENDPOINT,
     SET_CHARGE_LIMIT_ENDPOINT,
     SET_CHARGING_AMPS_ENDPOINT,
+    SITE_LIVE_STATUS_ENDPOINT,
     UNLOCK_DOORS_ENDPOINT,
     WAKE_UP_ENDPOINT,
-    WALL_CONNECTOR_LIVE_STATUS_ENDPOINT,
 )
 from .exceptions import TeslaTokenException
+from .hedging import HedgePolicy, RateBudget, RequestHedger
+from .transport import (
+    AiohttpTransport,
+    RecordingTransport,
+    TeslaTransport,
+    raise_for_status,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,12 +44,81 @@ _LOGGER = logging.getLogger(__name__)
 class TeslaAPIClient:
     """Client for Owner Tesla API."""
 
-    def __init__(self, refresh_token: str) -> None:
-        """Initialize the Tesla API client with authentication."""
+    def __init__(
+        self,
+        refresh_token: str,
+        base_url: str = OWNER_API_BASE_URL,
+        token_url: str = OAUTH2_TOKEN,
+        transport: TeslaTransport | None = None,
+        clock: Clock | None = None,
+        command_budget: RateBudget | None = None,
+    ) -> None:
+        """Initialize the Tesla API client with authentication.
+
+        Reads count against the rate budget of the client, commands and wake
+        ups against the command budget, shared by the clients of an account.
+        """
         self._refresh_token = refresh_token
         self._access_token = None
+        self._base_url = base_url.rstrip("/")
+        self._token_url = token_url
+        self._transport = transport or AiohttpTransport()
+        self._clock = clock or SYSTEM_CLOCK
+        self._budget = RateBudget(clock=self._clock)
+        self._command_budget = command_budget or RateBudget(
+            COMMAND_BUDGET, clock=self._clock
+        )
+        self._hedger: RequestHedger | None = None
+
+    @property
+    def refresh_token(self) -> str:
+        """Return the refresh token, rotated by each token refresh."""
+        return self._refresh_token
+
+    @property
+    def command_budget(self) -> RateBudget:
+        """Return the rate budget of the command and wake up requests."""
+        return self._command_budget
+
+    @property
+    def hedge_stats(self) -> dict[str, int | float] | None:
+        """Return the hedging counters, None when hedging is disabled."""
+        if self._hedger is None:
+            return None
+        return self._hedger.stats.as_dict()
+
+    def enable_hedging(self, policy: HedgePolicy | None = None) -> None:
+        """Hedge the GET requests that are slower than usual."""
+        if self._hedger is None:
+            self._hedger = RequestHedger(self._budget, policy, clock=self._clock)
+
+    @property
+    def is_recording(self) -> bool:
+        """Return whether the traffic is being recorded."""
+        return isinstance(self._transport, RecordingTransport)
+
+    def start_recording(self, path: str | Path) -> None:
+        """Record requests, responses and timings to a gzip JSONL file."""
+        if not self.is_recording:
+            self._transport = RecordingTransport(self._transport, path)
+
+    async def async_stop_recording(self) -> None:
+        """Stop recording the traffic."""
+        if isinstance(self._transport, RecordingTransport):
+            recorder = self._transport
+            self._transport = recorder.transport
+            await recorder.async_close()
+
+    async def async_close(self) -> None:
+        """Stop recording and release the transport."""
+        await self.async_stop_recording()
+        await self._transport.async_close()
 
     # AUTHENTICATION
+    async def async_authenticate(self) -> None:
+        """Exchange the refresh token for an access token."""
+        await self._async_refresh_token()
+
     async def _async_request(
         self, endpoint: str, method: str = "GET", **kwargs
     ) -> TeslaAPIResponse:
@@ -47,24 +133,31 @@ class TeslaAPIClient:
         }
         kwargs["headers"] = headers
 
-        async with (
-            aiohttp.ClientSession() as session,
-            session.request(method, endpoint, **kwargs) as response,
-        ):
-            if response.status == 401:
-                _LOGGER.debug("Access token expired, refreshing token")
+        url = self._base_url + endpoint
+        (self._budget if method == "GET" else self._command_budget).record()
+        with TRACER.span("request", method=method, endpoint=endpoint) as span:
+            if method == "GET" and self._hedger is not None:
+                response = await self._hedger.async_request(
+                    url, partial(self._transport.async_request, method, url, **kwargs)
+                )
+            else:
+                response = await self._transport.async_request(method, url, **kwargs)
+            span.set_attribute("status", response.status)
+
+        if response.status == 401:
+            _LOGGER.debug("Access token expired, refreshing token")
 
-                await self._async_refresh_token()
-                headers["Authorization"] = f"Bearer {self._access_token}"
+            await self._async_refresh_token()
+            headers["Authorization"] = f"Bearer {self._access_token}"
 
-                return await self._async_request(endpoint, method, **kwargs)
+            return await self._async_request(endpoint, method, **kwargs)
 
-            response.raise_for_status()
-            data = await response.json()
+        raise_for_status(method, url, response)
+        data = response.data or {}
 
-            _LOGGER.debug("Response from Tesla API: %s", data)
+        _LOGGER.debug("Response from Tesla API: %s", data)
 
-            return TeslaAPIResponse(data.get("response", data))
+        return TeslaAPIResponse(data.get("response", data))
 
     async def _async_refresh_token(self) -> None:
         """Refresh the access token if needed."""
@@ -81,26 +174,47 @@ class TeslaAPIClient:
 
         _LOGGER.debug("Refreshing Tesla access token")
 
-        async with (
-            aiohttp.ClientSession() as session,
-            session.post(OAUTH2_TOKEN, json=payload, headers=headers) as response,
-        ):
-            if response.status == 401:
-                _LOGGER.error("Failed to refresh access token: %s", response)
-                raise TeslaTokenException("Failed to refresh access token")
-            response.raise_for_status()
-            resp = await response.json()
+        with TRACER.span("refresh_token") as span:
+            response = await self._transport.async_request(
+                "POST", self._token_url, json=payload, headers=headers
+            )
+            span.set_attribute("status", response.status)
+        if response.status == 401:
+            _LOGGER.error("Failed to refresh access token: %s", response.data)
+            raise TeslaTokenException("Failed to refresh access token")
+        raise_for_status("POST", self._token_url, response)
+        resp = response.data
 
-            _LOGGER.debug("Token refreshed")
-            self._access_token = resp["access_token"]
-            self._refresh_token = resp["refresh_token"]
+        _LOGGER.debug("Token refreshed")
+        self._access_token = resp["access_token"]
+        self._refresh_token = resp["refresh_token"]
+
+    # PRODUCTS
+    async def async_get_products(self) -> TeslaAPIResponse:
+        """Get the vehicles and energy sites of the account."""
+        _LOGGER.debug("Getting the products of the account")
+
+        return await self._async_request(PRODUCTS_ENDPOINT)
 
     # GET VEHICLE DATA
-    async def async_get_vehicle_data(self, vehicle_id: str) -> TeslaAPIResponse:
-        """Get vehicle data."""
-        _LOGGER.debug("Getting vehicle data for VIN %s", vehicle_id)
+    async def async_get_vehicle(self, vehicle_id: str) -> TeslaAPIResponse:
+        """Get the vehicle summary, without waking it up."""
+        _LOGGER.debug("Getting vehicle summary for VIN %s", vehicle_id)
+
+        endpoint = GET_VEHICLE_ENDPOINT.format(vehicle_id=vehicle_id)
+        return await self._async_request(endpoint)
+
+    async def async_get_vehicle_data(
+        self, vehicle_id: str, sections: list[str] | None = None
+    ) -> TeslaAPIResponse:
+        """Get vehicle data, only the given sections when any."""
+        _LOGGER.debug("Getting vehicle data %s for VIN %s", sections or "", vehicle_id)
 
         endpoint = GET_VEHICLE_DATA_ENDPOINT.format(vehicle_id=vehicle_id)
+        if sections:
+            return await self._async_request(
+                endpoint, params={"endpoints": ";".join(sections)}
+            )
         return await self._async_request(endpoint)
 
     # VEHICLE COMMANDS
@@ -112,19 +226,19 @@ class TeslaAPIClient:
 
         endpoint = WAKE_UP_ENDPOINT.format(vehicle_id=vehicle_id)
         timeout = timedelta(seconds=timeout)
-        start_time = datetime.now()
+        start_time = self._clock.now()
 
-        while datetime.now() - start_time < timeout:
+        while self._clock.now() - start_time < timeout:
             response = await self._async_request(endpoint, method="POST")
             state = response.data.get("state")
 
             if state == "online":
                 _LOGGER.debug("Car is now online, waiting for 2 seconds to stabilize")
-                await asyncio.sleep(2)
+                await self._clock.sleep(2)
                 return response
 
             _LOGGER.debug("Car state is %s, retrying", state)
-            await asyncio.sleep(2)
+            await self._clock.sleep(WAKE_UP_INTERVAL)
 
         _LOGGER.debug("Timeout reached while waiting for car to wake up")
         raise TimeoutError("Car did not wake up in time. Check the vehicle connection.")
@@ -179,10 +293,10 @@ class TeslaAPIClient:
         endpoint = LOCK_DOORS_ENDPOINT.format(vehicle_id=vehicle_id)
         return await self._async_request(endpoint, method="POST")
 
-    # WALL CONNECTOR
-    async def async_get_wall_connector_status(self, site_id: str) -> TeslaAPIResponse:
-        """Get the status of the wall connector."""
-        _LOGGER.debug("Getting wall connector status for site %s", site_id)
+    # ENERGY SITE
+    async def async_get_site_live_status(self, site_id: str) -> TeslaAPIResponse:
+        """Get the power flows of the energy site and its wall connectors."""
+        _LOGGER.debug("Getting live status for site %s", site_id)
 
-        endpoint = WALL_CONNECTOR_LIVE_STATUS_ENDPOINT.format(site_id=site_id)
+        endpoint = SITE_LIVE_STATUS_ENDPOINT.format(site_id=site_id)
         return await self._async_request(endpoint)
@@ -2,30 +2,23 @@
 
 OWNER_API_BASE_URL = "https://owner-api.teslamotors.com/api/1"
 
-WAKE_UP_ENDPOINT = f"{OWNER_API_BASE_URL}/vehicles/{{vehicle_id}}/wake_up"
+# Endpoints are relative to the base URL of the client
+PRODUCTS_ENDPOINT = "/products"
 
-GET_VEHICLE_DATA_ENDPOINT = f"{OWNER_API_BASE_URL}/vehicles/{{vehicle_id}}/vehicle_data"
+GET_VEHICLE_ENDPOINT = "/vehicles/{vehicle_id}"
 
-SET_CHARGING_AMPS_ENDPOINT = (
-    f"{OWNER_API_BASE_URL}/vehicles/{{vehicle_id}}/command/set_charging_amps"
-)
+WAKE_UP_ENDPOINT = "/vehicles/{vehicle_id}/wake_up"
 
-SET_CHARGE_LIMIT_ENDPOINT = (
-    f"{OWNER_API_BASE_URL}/vehicles/{{vehicle_id}}/command/set_charge_limit"
-)
+GET_VEHICLE_DATA_ENDPOINT = "/vehicles/{vehicle_id}/vehicle_data"
 
-CHARGE_START_ENDPOINT = (
-    f"{OWNER_API_BASE_URL}/vehicles/{{vehicle_id}}/command/charge_start"
-)
-CHARGE_STOP_ENDPOINT = (
-    f"{OWNER_API_BASE_URL}/vehicles/{{vehicle_id}}/command/charge_stop"
-)
+SET_CHARGING_AMPS_ENDPOINT = "/vehicles/{vehicle_id}/command/set_charging_amps"
 
-UNLOCK_DOORS_ENDPOINT = (
-    f"{OWNER_API_BASE_URL}/vehicles/{{vehicle_id}}/command/door_unlock"
-)
-LOCK_DOORS_ENDPOINT = f"{OWNER_API_BASE_URL}/vehicles/{{vehicle_id}}/command/door_lock"
+SET_CHARGE_LIMIT_ENDPOINT = "/vehicles/{vehicle_id}/command/set_charge_limit"
 
-WALL_CONNECTOR_LIVE_STATUS_ENDPOINT = (
-    f"{OWNER_API_BASE_URL}/energy_sites/{{site_id}}/charger_live_status"
-)
+CHARGE_START_ENDPOINT = "/vehicles/{vehicle_id}/command/charge_start"
+CHARGE_STOP_ENDPOINT = "/vehicles/{vehicle_id}/command/charge_stop"
+
+UNLOCK_DOORS_ENDPOINT = "/vehicles/{vehicle_id}/command/door_unlock"
+LOCK_DOORS_ENDPOINT = "/vehicles/{vehicle_id}/command/door_lock"
+
+SITE_LIVE_STATUS_ENDPOINT = "/energy_sites/{site_id}/live_status"
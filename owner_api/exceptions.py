@@ -9,3 +9,7 @@ class TeslaBaseException(HomeAssistantError):
 
 class TeslaTokenException(TeslaBaseException):
     """Exception raised for token-related errors."""
+
+
+class TeslaCommandSupersededException(TeslaBaseException):
+    """Exception raised for a queued command replaced before being sent."""
@@ -0,0 +1,216 @@
+"""Hedging of idempotent Tesla Owner API requests."""
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+import logging
+import math
+from typing import TypeVar
+
+from ..clock import SYSTEM_CLOCK, Clock
+from ..const import (
+    HEDGE_MAX_DELAY,
+    HEDGE_MAX_RATIO,
+    HEDGE_MIN_DELAY,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_PERCENTILE,
+    HEDGE_WINDOW,
+    REQUEST_BUDGET,
+    REQUEST_BUDGET_PERIOD,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+def percentile_of(values: Iterable[float], percentile: float) -> float:
+    """Return a percentile of the values, 0 without values."""
+    values = sorted(values)
+    if not values:
+        return 0.0
+    index = math.ceil(len(values) * percentile / 100) - 1
+    return values[min(max(index, 0), len(values) - 1)]
+
+
+class LatencyTracker:
+    """Percentile of the latest latencies of a request."""
+
+    def __init__(self, window: int = HEDGE_WINDOW) -> None:
+        """Initialize the tracker."""
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self._samples)
+
+    def record(self, latency: float) -> None:
+        """Record the latency of a request, in seconds."""
+        self._samples.append(latency)
+
+    def percentile(self, percentile: float) -> float | None:
+        """Return a percentile of the samples, None without samples."""
+        if not self._samples:
+            return None
+        return percentile_of(self._samples, percentile)
+
+
+class RateBudget:
+    """Number of requests allowed over a sliding period."""
+
+    def __init__(
+        self,
+        max_requests: int = REQUEST_BUDGET,
+        period: float = REQUEST_BUDGET_PERIOD,
+        clock: Clock = SYSTEM_CLOCK,
+    ) -> None:
+        """Initialize the budget."""
+        self._max_requests = max_requests
+        self._period = period
+        self._clock = clock
+        self._times: deque[float] = deque()
+
+    def _purge(self, now: float) -> None:
+        """Forget the requests older than the period."""
+        while self._times and now - self._times[0] > self._period:
+            self._times.popleft()
+
+    @property
+    def used(self) -> int:
+        """Return the number of requests sent during the period."""
+        self._purge(self._clock.monotonic())
+        return len(self._times)
+
+    @property
+    def remaining(self) -> int:
+        """Return the number of requests still allowed during the period."""
+        return max(self._max_requests - self.used, 0)
+
+    def record(self) -> None:
+        """Record a request."""
+        now = self._clock.monotonic()
+        self._purge(now)
+        self._times.append(now)
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """When to send a second request for a slow idempotent request."""
+
+    percentile: float = HEDGE_PERCENTILE
+    min_samples: int = HEDGE_MIN_SAMPLES
+    min_delay: float = HEDGE_MIN_DELAY
+    max_delay: float = HEDGE_MAX_DELAY
+    max_ratio: float = HEDGE_MAX_RATIO
+
+    def delay(self, tracker: LatencyTracker) -> float | None:
+        """Return the delay before hedging, None while samples are too few."""
+        if len(tracker) < self.min_samples:
+            return None
+        latency = tracker.percentile(self.percentile)
+        return min(max(latency, self.min_delay), self.max_delay)
+
+
+@dataclass(slots=True)
+class HedgeStats:
+    """Counters of hedged requests."""
+
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    skipped_budget: int = 0
+
+    def as_dict(self) -> dict[str, int | float]:
+        """Return the counters with the hedging and win rates."""
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "skipped_budget": self.skipped_budget,
+            "hedge_rate": round(self.hedged / self.requests, 3)
+            if self.requests
+            else 0.0,
+            "win_rate": round(self.hedge_wins / self.hedged, 3) if self.hedged else 0.0,
+        }
+
+
+class RequestHedger:
+    """Send a second request when the first one is slower than usual.
+
+    The delay is the observed latency percentile of the request, so only the
+    tail is hedged. A hedge is only sent while the rate budget has room and
+    hedges stay under `max_ratio` of the requests.
+    """
+
+    def __init__(
+        self,
+        budget: RateBudget,
+        policy: HedgePolicy | None = None,
+        clock: Clock = SYSTEM_CLOCK,
+    ) -> None:
+        """Initialize the hedger."""
+        self._budget = budget
+        self._policy = policy or HedgePolicy()
+        self._clock = clock
+        self._trackers: dict[str, LatencyTracker] = {}
+        self.stats = HedgeStats()
+
+    def _can_hedge(self) -> bool:
+        """Return whether a hedge fits the ratio and the rate budget."""
+        if self.stats.hedged >= self.stats.requests * self._policy.max_ratio:
+            return False
+        if self._budget.remaining <= 0:
+            self.stats.skipped_budget += 1
+            return False
+        return True
+
+    async def _async_timed(
+        self, tracker: LatencyTracker, request: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Run a request and record its latency when it succeeds."""
+        start = self._clock.monotonic()
+        result = await request()
+        tracker.record(self._clock.monotonic() - start)
+        return result
+
+    async def async_request(self, key: str, request: Callable[[], Awaitable[_T]]) -> _T:
+        """Run the request, hedged when it is slower than usual."""
+        tracker = self._trackers.setdefault(key, LatencyTracker())
+        self.stats.requests += 1
+        start = self._clock.monotonic()
+        primary = asyncio.ensure_future(self._async_timed(tracker, request))
+        pending = {primary}
+        try:
+            delay = self._policy.delay(tracker)
+            if delay is None:
+                return await primary
+
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done or not self._can_hedge():
+                return await primary
+
+            _LOGGER.debug("Hedging %s after %.2fs", key, delay)
+            self._budget.record()
+            self.stats.hedged += 1
+            hedge = asyncio.ensure_future(self._async_timed(tracker, request))
+            pending.add(hedge)
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded:
+                    task = primary if primary in succeeded else succeeded[0]
+                    if task is hedge:
+                        # Keep the slow primary in the samples, at least as
+                        # slow as it was when the hedge answered
+                        tracker.record(self._clock.monotonic() - start)
+                        self.stats.hedge_wins += 1
+                    return task.result()
+            # Both requests failed, report the error of the first one
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
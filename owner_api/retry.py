@@ -0,0 +1,107 @@
+"""Retry policy for Tesla Owner API commands."""
+
+from dataclasses import dataclass
+import random
+
+from aiohttp import ClientConnectionError, ClientResponseError
+
+from ..const import (
+    COMMAND_DEADLINE,
+    COMMAND_MAX_ATTEMPTS,
+    COMMAND_RETRY_BASE_DELAY,
+    COMMAND_RETRY_MAX_DELAY,
+)
+from .api_response import TeslaAPIResponse
+
+
+class RetryAction:
+    """Class to hold what to do with a command outcome."""
+
+    SUCCESS = "success"
+    RETRY_AFTER_WAKE = "retry_after_wake"
+    RETRY_WITH_BACKOFF = "retry_with_backoff"
+    FATAL = "fatal"
+
+
+# Reasons returned with `result: false` although the vehicle is in the requested state
+SUCCESS_REASONS = frozenset(
+    {
+        "already_set",
+        "is_charging",
+        "not_charging",
+    }
+)
+
+WAKE_REASONS = frozenset(
+    {
+        "vehicle_unavailable",
+        "vehicle_offline",
+        "could_not_wake_buses",
+        "asleep",
+        "offline",
+    }
+)
+
+BACKOFF_REASONS = frozenset(
+    {
+        "timeout",
+        "busy",
+        "operation_timedout",
+        "internal_error",
+    }
+)
+
+WAKE_STATUSES = frozenset({408})
+BACKOFF_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _normalize_reason(reason: str) -> str:
+    """Normalize a reason string, e.g. 'vehicle unavailable: ...'."""
+    return reason.split(":", 1)[0].strip().lower().replace(" ", "_")
+
+
+def classify_reason(reason: str) -> str:
+    """Classify the reason of a failed command."""
+    reason = _normalize_reason(reason or "")
+    if reason in SUCCESS_REASONS:
+        return RetryAction.SUCCESS
+    if reason in WAKE_REASONS:
+        return RetryAction.RETRY_AFTER_WAKE
+    if reason in BACKOFF_REASONS:
+        return RetryAction.RETRY_WITH_BACKOFF
+    return RetryAction.FATAL
+
+
+def classify_response(response: TeslaAPIResponse) -> str:
+    """Classify the response of a command."""
+    if response.result:
+        return RetryAction.SUCCESS
+    return classify_reason(response.reason)
+
+
+def classify_error(err: BaseException) -> str:
+    """Classify an error raised while sending a command."""
+    if isinstance(err, ClientResponseError):
+        if err.status in WAKE_STATUSES:
+            return RetryAction.RETRY_AFTER_WAKE
+        if err.status in BACKOFF_STATUSES:
+            return RetryAction.RETRY_WITH_BACKOFF
+        return RetryAction.FATAL
+    if isinstance(err, (TimeoutError, ClientConnectionError)):
+        return RetryAction.RETRY_WITH_BACKOFF
+    return RetryAction.FATAL
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with jitter under an overall deadline."""
+
+    max_attempts: int = COMMAND_MAX_ATTEMPTS
+    base_delay: float = COMMAND_RETRY_BASE_DELAY
+    max_delay: float = COMMAND_RETRY_MAX_DELAY
+    deadline: float = COMMAND_DEADLINE
+
+    def backoff(self, attempt: int) -> float:
+        """Return the delay before the next attempt, in seconds."""
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return delay / 2 + random.uniform(0, delay / 2)
@@ -0,0 +1,205 @@
+"""HTTP transports used by the Tesla Owner API client."""
+
+import asyncio
+from collections import defaultdict, deque
+from dataclasses import dataclass
+import gzip
+import json
+from pathlib import Path
+import threading
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from .exceptions import TeslaBaseException
+
+REDACTED = "**REDACTED**"
+REDACTED_KEYS = frozenset(
+    {"access_token", "refresh_token", "id_token", "code", "password"}
+)
+
+
+@dataclass(slots=True)
+class TransportResponse:
+    """Status and decoded JSON body of an HTTP response."""
+
+    status: int
+    data: Any
+
+
+def raise_for_status(method: str, url: str, response: TransportResponse) -> None:
+    """Raise a ClientResponseError if the response status is an error."""
+    if response.status < 400:
+        return
+    request_info = aiohttp.RequestInfo(
+        URL(url), method, CIMultiDictProxy(CIMultiDict()), URL(url)
+    )
+    raise aiohttp.ClientResponseError(
+        request_info,
+        (),
+        status=response.status,
+        message=str(response.data),
+    )
+
+
+class TeslaTransport:
+    """Base class for transports sending requests to the Owner API."""
+
+    async def async_request(self, method: str, url: str, **kwargs) -> TransportResponse:
+        """Send a request and return its response."""
+        raise NotImplementedError("This method should be overridden in subclasses.")
+
+    async def async_close(self) -> None:
+        """Release the resources of the transport."""
+
+
+class AiohttpTransport(TeslaTransport):
+    """Transport sending requests over HTTP with aiohttp.
+
+    Requests share one session so that connections are kept alive. A session
+    given by the caller, e.g. the one of Home Assistant, is left open.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession | None = None) -> None:
+        """Initialize the transport."""
+        self._session = session
+        self._owns_session = False
+
+    async def async_request(self, method: str, url: str, **kwargs) -> TransportResponse:
+        """Send a request and return its response."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+            self._owns_session = True
+        async with self._session.request(method, url, **kwargs) as response:
+            try:
+                data = await response.json(content_type=None)
+            except ValueError:
+                data = None
+            return TransportResponse(response.status, data)
+
+    async def async_close(self) -> None:
+        """Close the session opened by the transport."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._owns_session = False
+
+
+def redact(data: Any) -> Any:
+    """Return a copy of the data with tokens redacted."""
+    if isinstance(data, dict):
+        return {
+            key: REDACTED if key in REDACTED_KEYS else redact(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [redact(value) for value in data]
+    return data
+
+
+class RecordingTransport(TeslaTransport):
+    """Transport recording requests, responses and timings to a JSONL file.
+
+    Records are gzip compressed, one JSON object per line, with tokens redacted.
+    """
+
+    def __init__(self, transport: TeslaTransport, path: str | Path) -> None:
+        """Initialize the recorder around another transport."""
+        self._transport = transport
+        self._path = Path(path)
+        self._file: gzip.GzipFile | None = None
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+
+    @property
+    def transport(self) -> TeslaTransport:
+        """Return the recorded transport."""
+        return self._transport
+
+    async def async_request(self, method: str, url: str, **kwargs) -> TransportResponse:
+        """Send a request through the recorded transport and record it."""
+        start = time.monotonic()
+        response = await self._transport.async_request(method, url, **kwargs)
+        record = {
+            "t": round(start - self._start, 6),
+            "elapsed": round(time.monotonic() - start, 6),
+            "method": method,
+            "path": urlsplit(url).path,
+            "params": kwargs.get("params"),
+            "request": redact(kwargs.get("json")),
+            "status": response.status,
+            "response": redact(response.data),
+        }
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._write, json.dumps(record, separators=(",", ":"))
+        )
+        return response
+
+    def _write(self, line: str) -> None:
+        """Append a record to the file."""
+        with self._lock:
+            if self._file is None:
+                self._file = gzip.open(self._path, "at", encoding="utf-8")
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def _close(self) -> None:
+        """Close the file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    async def async_close(self) -> None:
+        """Close the recording file."""
+        await asyncio.get_running_loop().run_in_executor(None, self._close)
+
+
+class ReplayTransport(TeslaTransport):
+    """Transport serving recorded responses back in order.
+
+    Responses to a given method and path are served in the order they were
+    recorded, each one no sooner than its recorded time divided by `speed`.
+    """
+
+    def __init__(self, records: list[dict], speed: float = 1.0) -> None:
+        """Initialize the replay from records."""
+        self._speed = speed
+        self._records: dict[tuple[str, str], deque[dict]] = defaultdict(deque)
+        for record in sorted(records, key=lambda record: record["t"]):
+            self._records[(record["method"], record["path"])].append(record)
+        self._start: float | None = None
+
+    @classmethod
+    def from_file(cls, path: str | Path, speed: float = 1.0) -> "ReplayTransport":
+        """Load the records of a recording file."""
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            return cls([json.loads(line) for line in file if line.strip()], speed)
+
+    @property
+    def remaining(self) -> int:
+        """Return the number of records not served yet."""
+        return sum(len(records) for records in self._records.values())
+
+    async def async_request(self, method: str, url: str, **kwargs) -> TransportResponse:
+        """Serve the next recorded response for the request."""
+        loop = asyncio.get_running_loop()
+        if self._start is None:
+            self._start = loop.time()
+
+        records = self._records.get((method, urlsplit(url).path))
+        if not records:
+            raise TeslaBaseException(f"No recorded response for {method} {url}")
+
+        record = records.popleft()
+        delay = (
+            self._start + (record["t"] + record["elapsed"]) / self._speed - loop.time()
+        )
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        return TransportResponse(record["status"], record["response"])
@@ -0,0 +1,265 @@
+"""Predictive wake up of Tesla vehicles before their usual command times."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    DOMAIN,
+    PREWAKE_DAILY_BUDGET,
+    PREWAKE_HISTORY_DAYS,
+    PREWAKE_HIT_WINDOW,
+    PREWAKE_LEAD,
+    PREWAKE_MIN_WEEKS,
+    PREWAKE_SAVE_DELAY,
+    PREWAKE_SLOT_MINUTES,
+    PREWAKE_STORAGE_VERSION,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import TeslaVehicleCoordinator
+    from .models.vehicle.commands import VehicleCommand
+
+_LOGGER = logging.getLogger(__name__)
+
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+Slot = tuple[int, int]  # weekday, index of the slot in the day
+
+
+def _slot_of(moment: datetime) -> Slot:
+    """Return the weekly slot of a local time."""
+    minutes = moment.hour * 60 + moment.minute
+    return moment.weekday(), minutes // PREWAKE_SLOT_MINUTES
+
+
+def learn_schedule(history: list[float], now: datetime) -> list[Slot]:
+    """Return the weekly slots with commands during enough distinct weeks."""
+    cutoff = (now - timedelta(days=PREWAKE_HISTORY_DAYS)).timestamp()
+    weeks: dict[Slot, set[tuple[int, int]]] = {}
+    for timestamp in history:
+        if timestamp < cutoff:
+            continue
+        moment = dt_util.as_local(dt_util.utc_from_timestamp(timestamp))
+        weeks.setdefault(_slot_of(moment), set()).add(moment.isocalendar()[:2])
+    return sorted(
+        slot for slot, seen in weeks.items() if len(seen) >= PREWAKE_MIN_WEEKS
+    )
+
+
+def next_wake(schedule: list[Slot], now: datetime) -> datetime | None:
+    """Return the next wake up time, a lead time before a scheduled slot."""
+    midnight = dt_util.start_of_local_day(now)
+    candidates = []
+    for weekday, index in schedule:
+        days = (weekday - now.weekday()) % 7
+        wake = (
+            midnight
+            + timedelta(days=days, minutes=index * PREWAKE_SLOT_MINUTES)
+            - timedelta(seconds=PREWAKE_LEAD)
+        )
+        if wake <= now:
+            wake += timedelta(days=7)
+        candidates.append(wake)
+    return min(candidates, default=None)
+
+
+class PreWakeScheduler:
+    """Wake the vehicle up shortly before the times commands usually come.
+
+    The times of the commands sent by the user are persisted, not the ones the
+    integration sends on its own. The weekly slots with commands during at least
+    PREWAKE_MIN_WEEKS distinct weeks form the schedule. A pre-wake is a hit
+    when a command follows within PREWAKE_HIT_WINDOW.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, coordinator: TeslaVehicleCoordinator
+    ) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._store: Store[dict] = Store(
+            hass,
+            PREWAKE_STORAGE_VERSION,
+            f"{DOMAIN}.{coordinator.vehicle.vin}.commands",
+        )
+
+        self._history: list[float] = []
+        self._wakes: list[float] = []
+        self._prewakes = 0
+        self._hits = 0
+        self._last_prewake: float | None = None
+
+        self._schedule: list[Slot] = []
+        self._next_wake: datetime | None = None
+        self._unsub_wake: CALLBACK_TYPE | None = None
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def schedule(self) -> list[str]:
+        """Return the learned slots, e.g. "Mon 18:00"."""
+        return [
+            f"{WEEKDAYS[weekday]} {index * PREWAKE_SLOT_MINUTES // 60:02d}:"
+            f"{index * PREWAKE_SLOT_MINUTES % 60:02d}"
+            for weekday, index in self._schedule
+        ]
+
+    @property
+    def next_wake(self) -> datetime | None:
+        """Return the time of the next pre-wake."""
+        return self._next_wake
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        """Return the pre-wake counters and hit rate."""
+        return {
+            "prewakes": self._prewakes,
+            "hits": self._hits,
+            "hit_rate": round(self._hits / self._prewakes, 3)
+            if self._prewakes
+            else 0.0,
+            "wakes_today": self._wakes_today(dt_util.now()),
+            "daily_budget": PREWAKE_DAILY_BUDGET,
+        }
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Call the listener when the schedule or the counters change."""
+        self._listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.remove(listener)
+
+        return _remove
+
+    async def async_load(self) -> None:
+        """Load the command history."""
+        if (data := await self._store.async_load()) is None:
+            return
+        self._history = data.get("history", [])
+        self._wakes = data.get("wakes", [])
+        self._prewakes = data.get("prewakes", 0)
+        self._hits = data.get("hits", 0)
+
+    def _data_to_save(self) -> dict:
+        """Return the data to persist."""
+        return {
+            "history": self._history,
+            "wakes": self._wakes,
+            "prewakes": self._prewakes,
+            "hits": self._hits,
+        }
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start recording commands and waking up, return a callback to stop."""
+        unsub_commands = self._coordinator.vehicle.add_command_listener(
+            self._async_handle_command
+        )
+        self._async_reschedule()
+
+        @callback
+        def _stop() -> None:
+            unsub_commands()
+            if self._unsub_wake is not None:
+                self._unsub_wake()
+                self._unsub_wake = None
+
+        return _stop
+
+    async def async_save(self) -> None:
+        """Save the command history right away."""
+        await self._store.async_save(self._data_to_save())
+
+    def _wakes_today(self, now: datetime) -> int:
+        """Return the number of pre-wakes since midnight."""
+        midnight = dt_util.start_of_local_day(now).timestamp()
+        return sum(1 for timestamp in self._wakes if timestamp >= midnight)
+
+    @callback
+    def _async_handle_command(self, command: VehicleCommand) -> None:
+        """Record a command sent to the vehicle on behalf of the user."""
+        if command.automatic:
+            return
+
+        now = dt_util.now()
+        if (
+            self._last_prewake is not None
+            and now.timestamp() - self._last_prewake <= PREWAKE_HIT_WINDOW
+        ):
+            self._hits += 1
+            self._last_prewake = None
+
+        cutoff = (now - timedelta(days=PREWAKE_HISTORY_DAYS)).timestamp()
+        self._history = [t for t in self._history if t >= cutoff]
+        self._history.append(now.timestamp())
+        self._wakes = [t for t in self._wakes if t >= cutoff]
+        self._store.async_delay_save(self._data_to_save, PREWAKE_SAVE_DELAY)
+
+        self._async_reschedule()
+
+    @callback
+    def _async_reschedule(self) -> None:
+        """Learn the schedule again and plan the next pre-wake."""
+        now = dt_util.now()
+        self._schedule = learn_schedule(self._history, now)
+        wake = next_wake(self._schedule, now)
+        if wake != self._next_wake:
+            if self._unsub_wake is not None:
+                self._unsub_wake()
+                self._unsub_wake = None
+            if wake is not None:
+                self._unsub_wake = async_track_point_in_time(
+                    self._hass, self._async_wake, wake
+                )
+            self._next_wake = wake
+            _LOGGER.debug(
+                "Next pre-wake of %s at %s, schedule %s",
+                self._coordinator.vehicle.vin,
+                wake,
+                self.schedule,
+            )
+
+        for listener in list(self._listeners):
+            listener()
+
+    async def _async_wake(self, now: datetime) -> None:
+        """Wake the vehicle up ahead of a scheduled slot."""
+        self._unsub_wake = None
+        self._next_wake = None
+        vehicle = self._coordinator.vehicle
+
+        if not vehicle.needs_wake_up:
+            _LOGGER.debug("Vehicle %s already awake, no pre-wake", vehicle.vin)
+        elif self._wakes_today(now) >= PREWAKE_DAILY_BUDGET:
+            _LOGGER.info(
+                "Pre-wake budget of %d per day reached for %s",
+                PREWAKE_DAILY_BUDGET,
+                vehicle.vin,
+            )
+        else:
+            _LOGGER.debug("Pre-waking vehicle %s", vehicle.vin)
+            try:
+                await vehicle.async_ensure_car_woke_up()
+                # The coordinator skips polls of a sleeping vehicle, fetch once
+                # so that it knows the vehicle is online
+                await vehicle.async_get_vehicle_data()
+            except Exception:
+                _LOGGER.exception("Error pre-waking vehicle %s", vehicle.vin)
+            else:
+                self._wakes.append(now.timestamp())
+                self._prewakes += 1
+                self._last_prewake = now.timestamp()
+                self._store.async_delay_save(self._data_to_save, PREWAKE_SAVE_DELAY)
+
+        self._async_reschedule()
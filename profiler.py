@@ -0,0 +1,155 @@
+"""On-demand profiling of coordinator refreshes and vehicle commands."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+import logging
+from pathlib import Path
+import sys
+import threading
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    import cProfile
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+MODE_CPROFILE = "cprofile"
+MODE_SAMPLING = "sampling"
+MODES = (MODE_CPROFILE, MODE_SAMPLING)
+
+SAMPLING_INTERVAL = 0.005  # seconds
+
+
+class _StackSampler(threading.Thread):
+    """Sample the stack of a thread and count collapsed stacks."""
+
+    def __init__(self, thread_id: int, interval: float) -> None:
+        """Initialize the sampler for the given thread."""
+        super().__init__(name="tesla_connector_sampler", daemon=True)
+        self._thread_id = thread_id
+        self._interval = interval
+        self._stop_event = threading.Event()
+        self.stacks: Counter[str] = Counter()
+
+    def run(self) -> None:
+        """Sample the thread until stopped."""
+        while not self._stop_event.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop_event.set()
+
+
+class Profiler:
+    """Profile the next runs of coordinator refreshes and commands.
+
+    When no profiling is requested callers only check `active`.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the profiler."""
+        self.active = False
+        self._remaining = 0
+        self._mode = MODE_CPROFILE
+        self._output_dir = Path()
+        self._running = False
+
+    def start(self, count: int, mode: str, output_dir: str) -> None:
+        """Profile the next `count` runs."""
+        self._remaining = count
+        self._mode = mode
+        self._output_dir = Path(output_dir)
+        self.active = count > 0
+        _LOGGER.info("Profiling the next %d runs with %s", count, mode)
+
+    async def async_profile(
+        self, label: str, target: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Run the target, profiling it if no other run is being profiled."""
+        if self._running or not self.active:
+            return await target()
+
+        self._running = True
+        self._remaining -= 1
+        self.active = self._remaining > 0
+        start_time = datetime.now()
+        try:
+            if self._mode == MODE_SAMPLING:
+                sampler = _StackSampler(threading.get_ident(), SAMPLING_INTERVAL)
+                sampler.start()
+                try:
+                    return await target()
+                finally:
+                    sampler.stop()
+                    await self._async_write(
+                        label, start_time, "collapsed", self._write_collapsed, sampler
+                    )
+
+            # Only imported once a run is profiled
+            import cProfile
+
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                _LOGGER.warning("Another profiler is active, skipping %s", label)
+                return await target()
+            try:
+                return await target()
+            finally:
+                profile.disable()
+                await self._async_write(
+                    label, start_time, "pstats", self._write_pstats, profile
+                )
+        finally:
+            self._running = False
+
+    async def _async_write(
+        self,
+        label: str,
+        start_time: datetime,
+        extension: str,
+        writer: Callable[[Path, Any], None],
+        result: Any,
+    ) -> None:
+        """Write the profiling result in the output directory."""
+        path = self._output_dir / (
+            f"tesla_connector_{label}_{start_time:%Y%m%d_%H%M%S_%f}.{extension}"
+        )
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, writer, path, result)
+        except OSError:
+            _LOGGER.exception("Error writing profile to %s", path)
+            return
+        _LOGGER.info("Profile of %s written to %s", label, path)
+
+    @staticmethod
+    def _write_pstats(path: Path, profile: cProfile.Profile) -> None:
+        """Write a cProfile result as pstats."""
+        profile.dump_stats(path)
+
+    @staticmethod
+    def _write_collapsed(path: Path, sampler: _StackSampler) -> None:
+        """Write sampled stacks in the collapsed stack format."""
+        sampler.join()
+        path.write_text(
+            "".join(f"{stack} {count}\n" for stack, count in sampler.stacks.items()),
+            encoding="utf-8",
+        )
+
+
+PROFILER = Profiler()
@@ -1,117 +1,43 @@
 """Tesla Connector Sensor Integration."""
 
-import asyncio
-import logging
+from __future__ import annotations
 
-from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import (
-    PERCENTAGE,
-    UnitOfElectricCurrent,
-    UnitOfElectricPotential,
-    UnitOfEnergy,
-    UnitOfLength,
-    UnitOfTime,
+from typing import TYPE_CHECKING
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .base_sensor import TeslaBaseSensor, TeslaSensorDescription
-from .const import (
-    DOMAIN,
-    SENSOR_BATTERY_LEVEL,
-    SENSOR_BATTERY_RANGE,
-    SENSOR_CHARGE_AMPS,
-    SENSOR_CHARGE_CURRENT,
-    SENSOR_CHARGE_ENERGY_ADDED,
-    SENSOR_CHARGE_LIMIT_SOC,
-    SENSOR_CHARGER_VOLTAGE,
-    SENSOR_CHARGING_STATE,
-    SENSOR_MINUTES_TO_FULL_CHARGE,
-    SENSOR_ODOMETER,
-    SENSOR_WALL_CONNECTOR_VIN,
+from .base_sensor import TeslaBaseSensor
+from .const import DOMAIN
+from .entity_descriptions import (
+    ANALYTICS_SENSOR_DESCRIPTIONS,
+    ENERGY_SITE_SENSOR_DESCRIPTIONS,
+    GENERATED_SENSOR_DESCRIPTIONS,
+    SENSOR_DESCRIPTIONS,
+    WALL_CONNECTOR_SENSOR_DESCRIPTIONS,
+    WALL_CONNECTOR_UNIT_SENSOR_DESCRIPTIONS,
+    TeslaSensorDescription,
 )
-from .coordinator import TeslaVehicleCoordinator, TeslaWallConnectorCoordinator
-from .models.vehicle.vehicle import TeslaVehicle
-from .models.wall_connector.wall_connector import WallConnector
-
-SENSOR_DESCRIPTIONS: dict[str, TeslaSensorDescription] = {
-    SENSOR_BATTERY_LEVEL: TeslaSensorDescription(
-        name="Niveau batterie",
-        value_path="charge_state.battery_level",
-        unit=PERCENTAGE,
-        device_class=SensorDeviceClass.BATTERY,
-        icon="mdi:battery",
-    ),
-    SENSOR_BATTERY_RANGE: TeslaSensorDescription(
-        name="Autonomie batterie",
-        value_path="charge_state.battery_range",
-        unit=UnitOfLength.KILOMETERS,
-        device_class=SensorDeviceClass.DISTANCE,
-        icon="mdi:car-electric",
-    ),
-    SENSOR_CHARGE_AMPS: TeslaSensorDescription(
-        name="Ampères de charge voulus",
-        value_path="charge_state.charge_amps",
-        unit=UnitOfElectricCurrent.AMPERE,
-        icon="mdi:flash",
-    ),
-    SENSOR_CHARGE_CURRENT: TeslaSensorDescription(
-        name="Ampères de charge",
-        value_path="charge_state.charge_current_request",
-        unit=UnitOfElectricCurrent.AMPERE,
-        icon="mdi:flash",
-    ),
-    SENSOR_MINUTES_TO_FULL_CHARGE: TeslaSensorDescription(
-        name="Minutes restantes",
-        value_path="charge_state.minutes_to_full_charge",
-        unit=UnitOfTime.MINUTES,
-        icon="mdi:clock-outline",
-    ),
-    SENSOR_ODOMETER: TeslaSensorDescription(
-        name="Odomètre",
-        value_path="vehicle_state.odometer",
-        unit=UnitOfLength.KILOMETERS,
-        device_class=SensorDeviceClass.DISTANCE,
-        icon="mdi:counter",
-    ),
-    SENSOR_CHARGING_STATE: TeslaSensorDescription(
-        name="État de charge",
-        value_path="charge_state.charging_state",
-        icon="mdi:ev-plug-ccs2",
-    ),
-    SENSOR_CHARGE_LIMIT_SOC: TeslaSensorDescription(
-        name="Limite de charge",
-        value_path="charge_state.charge_limit_soc",
-        unit=PERCENTAGE,
-        device_class=SensorDeviceClass.BATTERY,
-        icon="mdi:battery-charging-80",
-    ),
-    SENSOR_CHARGER_VOLTAGE: TeslaSensorDescription(
-        name="Tension du chargeur",
-        value_path="charge_state.charger_voltage",
-        unit=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        icon="mdi:flash",
-    ),
-    SENSOR_CHARGE_ENERGY_ADDED: TeslaSensorDescription(
-        name="Session de charge",
-        value_path="charge_state.charge_energy_added",
-        unit=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        icon="mdi:car-electric",
-    ),
-}
-
-WALL_CONNECTOR_SENSOR_DESCRIPTIONS: dict[str, TeslaSensorDescription] = {
-    SENSOR_WALL_CONNECTOR_VIN: TeslaSensorDescription(
-        name="VIN connecté",
-        value_path="vin",
-        icon="mdi:car-key",
-    ),
-}
-
-_LOGGER = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from .analytics import ChargingAnalytics
+    from .coordinator import (
+        TeslaEnergySiteCoordinator,
+        TeslaVehicleCoordinator,
+        TeslaWallConnectorCoordinator,
+    )
+    from .models.energy_site.energy_site import EnergySite
+    from .models.vehicle.vehicle import TeslaVehicle
+    from .models.wall_connector.wall_connector import WallConnector
+    from .models.wall_connector.wall_connector_data import WallConnectorData
+    from .prewake import PreWakeScheduler
 
 
 async def async_setup_entry(
@@ -126,10 +52,16 @@ async def async_setup_entry(
     wall_connector_coordinator: TeslaWallConnectorCoordinator = hass.data[DOMAIN][
         entry.entry_id
     ]["wall_connector"]
+    energy_site_coordinator: TeslaEnergySiteCoordinator = hass.data[DOMAIN][
+        entry.entry_id
+    ]["energy_site"]
 
     sensors = []
 
-    for sensor_key, sensor_description in SENSOR_DESCRIPTIONS.items():
+    for sensor_key, sensor_description in {
+        **SENSOR_DESCRIPTIONS,
+        **GENERATED_SENSOR_DESCRIPTIONS,
+    }.items():
         sensors.append(
             TeslaVehicleSensor(vehicle_coordinator, sensor_key, sensor_description)
         )
@@ -137,15 +69,58 @@ async def async_setup_entry(
     for sensor_key, sensor_description in WALL_CONNECTOR_SENSOR_DESCRIPTIONS.items():
         sensors.append(
             TeslaWallConnectorSensor(
-                wall_connector_coordinator,
-                sensor_key,
-                sensor_description,
-                vehicle_coordinator.vehicle,
+                wall_connector_coordinator, sensor_key, sensor_description
             )
         )
 
+    for sensor_key, sensor_description in ENERGY_SITE_SENSOR_DESCRIPTIONS.items():
+        sensors.append(
+            TeslaEnergySiteSensor(
+                energy_site_coordinator, sensor_key, sensor_description
+            )
+        )
+
+    if (prewake := hass.data[DOMAIN][entry.entry_id].get("prewake")) is not None:
+        sensors.append(TeslaPreWakeSensor(vehicle_coordinator, prewake))
+
+    if (analytics := hass.data[DOMAIN][entry.entry_id].get("analytics")) is not None:
+        for sensor_key, sensor_description in ANALYTICS_SENSOR_DESCRIPTIONS.items():
+            sensors.append(
+                TeslaChargingAnalyticsSensor(
+                    vehicle_coordinator, analytics, sensor_key, sensor_description
+                )
+            )
+
     async_add_entities(sensors)
 
+    known_dins: set[str] = set()
+
+    @callback
+    def _async_add_wall_connector_units() -> None:
+        """Add sensors for wall connectors seen for the first time."""
+        data: WallConnectorData | None = wall_connector_coordinator.data
+        if data is None:
+            return
+
+        new_sensors = [
+            TeslaWallConnectorUnitSensor(
+                wall_connector_coordinator, sensor_key, sensor_description, din
+            )
+            for din in data.by_din.keys() - known_dins
+            for sensor_key, sensor_description in (
+                WALL_CONNECTOR_UNIT_SENSOR_DESCRIPTIONS.items()
+            )
+        ]
+        known_dins.update(data.by_din)
+
+        if new_sensors:
+            async_add_entities(new_sensors)
+
+    _async_add_wall_connector_units()
+    entry.async_on_unload(
+        wall_connector_coordinator.async_add_listener(_async_add_wall_connector_units)
+    )
+
 
 class TeslaVehicleSensor(TeslaBaseSensor, SensorEntity):
     """Representation of a Tesla vehicle sensor."""
@@ -173,24 +148,151 @@ class TeslaWallConnectorSensor(TeslaBaseSensor, SensorEntity):
         coordinator: TeslaWallConnectorCoordinator,
         key: str,
         description: TeslaSensorDescription,
-        vehicle: TeslaVehicle,
     ) -> None:
         """Initialize the Tesla Wall Connector sensor."""
         super().__init__(coordinator, key, description)
         self._wall_connector: WallConnector = self._device
 
-        self._vehicle = vehicle
+    def _update_state(self, value):
+        """Update the state of the sensor."""
+        self._attr_native_value = value
+
+
+class TeslaEnergySiteSensor(TeslaBaseSensor, SensorEntity):
+    """Representation of a power flow sensor of the energy site."""
+
+    def __init__(
+        self,
+        coordinator: TeslaEnergySiteCoordinator,
+        key: str,
+        description: TeslaSensorDescription,
+    ) -> None:
+        """Initialize the energy site sensor."""
+        super().__init__(coordinator, key, description)
+        self._energy_site: EnergySite = self._device
 
     def _update_state(self, value):
         """Update the state of the sensor."""
-        if self._key == SENSOR_WALL_CONNECTOR_VIN:
-            if (
-                self._vehicle.vin in (value, self._attr_native_value)
-                and self._attr_native_value != value
-            ):
-                _LOGGER.debug("VIN sensor changed, waking up the vehicle")
-                asyncio.ensure_future(
-                    self._vehicle.async_ensure_car_woke_up(force=True)
-                )
+        self._attr_native_value = value
+
+
+class TeslaWallConnectorUnitSensor(TeslaBaseSensor, SensorEntity):
+    """Representation of a sensor of a single wall connector of the site."""
+
+    def __init__(
+        self,
+        coordinator: TeslaWallConnectorCoordinator,
+        key: str,
+        description: TeslaSensorDescription,
+        din: str,
+    ) -> None:
+        """Initialize the wall connector sensor for the given DIN."""
+        super().__init__(coordinator, key, description)
+        self._din = din
+        self._update_state(self._get_value(coordinator.data))
+
+    @property
+    def unique_id(self) -> str:
+        """Return a unique ID for the sensor."""
+        return f"{DOMAIN}_{self._device.device_id}_{self._din}_{self._key}"
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        return f"{self._description.name} {self._din}"
+
+    def _get_value(self, data: WallConnectorData | None):
+        """Extract the value of this wall connector from the site data."""
+        connector = data.by_din.get(self._din) if data is not None else None
+        if connector is None:
+            return None
+        return getattr(connector, self._value_path)
 
+    def _update_state(self, value):
+        """Update the state of the sensor."""
         self._attr_native_value = value
+
+
+class TeslaPreWakeSensor(SensorEntity):
+    """Time of the next predictive wake up of the vehicle."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:alarm"
+    _attr_name = "Prochain réveil anticipé"
+    _attr_should_poll = False
+
+    def __init__(
+        self, coordinator: TeslaVehicleCoordinator, prewake: PreWakeScheduler
+    ) -> None:
+        """Initialize the sensor."""
+        self._coordinator = coordinator
+        self._prewake = prewake
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.device.device_id}_prewake"
+        self._attr_device_info = coordinator.get_device_info()
+
+    @property
+    def native_value(self):
+        """Return the time of the next pre-wake."""
+        return self._prewake.next_wake
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the learned schedule and the hit rate."""
+        return {"schedule": self._prewake.schedule, **self._prewake.stats}
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the changes of the scheduler."""
+        self.async_on_remove(
+            self._prewake.async_add_listener(self.async_write_ha_state)
+        )
+
+
+class TeslaChargingAnalyticsSensor(SensorEntity):
+    """Battery or charging metric computed from the charging sessions."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        coordinator: TeslaVehicleCoordinator,
+        analytics: ChargingAnalytics,
+        key: str,
+        description: TeslaSensorDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self._analytics = analytics
+        self._value_path = description.value_path
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.device.device_id}_{key}"
+        self._attr_device_info = coordinator.get_device_info()
+        self._attr_name = description.name
+        self._attr_icon = description.icon
+        self._attr_native_unit_of_measurement = description.unit
+        self._attr_device_class = description.device_class
+        self._attr_suggested_display_precision = description.suggested_display_precision
+
+    @property
+    def native_value(self):
+        """Return the value of the metric."""
+        return self._analytics.metrics.get(self._value_path)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the number of sessions, the energies and the capacity trend."""
+        metrics = self._analytics.metrics
+        return {
+            key: metrics.get(key)
+            for key in (
+                "sessions",
+                "energy_added_kwh",
+                "connector_energy_kwh",
+                "capacity_trend_kwh_per_year",
+            )
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the changes of the metrics."""
+        self.async_on_remove(
+            self._analytics.async_add_listener(self.async_write_ha_state)
+        )
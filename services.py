@@ -0,0 +1,336 @@
+"""Services for the Tesla Connector integration."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.event import async_call_later
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    CONF_VIN,
+    DOMAIN,
+    FLEET_CONCURRENCY,
+    FLEET_MAX_CONCURRENCY,
+    SERVICE_CHARGING_ANALYTICS,
+    SERVICE_CHARGING_SESSIONS,
+    SERVICE_PROFILE,
+    SERVICE_RECORD_TRAFFIC,
+    SERVICE_SEND_COMMANDS,
+    SERVICE_SEND_FLEET_COMMANDS,
+    SERVICE_TRACE,
+)
+from .models.vehicle.commands import COMMANDS, VehicleCommand
+from .profiler import MODE_CPROFILE, MODES, PROFILER
+from .tracing import TRACER, write_chrome_trace
+
+if TYPE_CHECKING:
+    from .coordinator import TeslaVehicleCoordinator
+    from .owner_api.client import TeslaAPIClient
+    from .session_log import ChargingSessionLog
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_COUNT = "count"
+ATTR_MODE = "mode"
+ATTR_DURATION = "duration"
+ATTR_COMMANDS = "commands"
+ATTR_COMMAND = "command"
+ATTR_VALUE = "value"
+ATTR_CONFIRM = "confirm"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_SESSIONS = "sessions"
+ATTR_VINS = "vins"
+ATTR_CONCURRENCY = "concurrency"
+ATTR_VEHICLES = "vehicles"
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_COUNT, default=5): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+        vol.Optional(ATTR_MODE, default=MODE_CPROFILE): vol.In(MODES),
+    }
+)
+
+RECORD_TRAFFIC_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=3600): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=86400)
+        ),
+    }
+)
+
+TRACE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=60): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=3600)
+        ),
+    }
+)
+
+
+def _command(value: dict) -> VehicleCommand:
+    """Validate a command of the send_commands service."""
+    command = VehicleCommand(value[ATTR_COMMAND], value.get(ATTR_VALUE))
+    if command.spec.takes_value != (command.value is not None):
+        raise vol.Invalid(
+            f"{command.name} {'requires' if command.spec.takes_value else 'takes no'}"
+            " value"
+        )
+    return command
+
+
+COMMANDS_SCHEMA = vol.All(
+    cv.ensure_list,
+    vol.Length(min=1),
+    [
+        vol.All(
+            {
+                vol.Required(ATTR_COMMAND): vol.In(COMMANDS),
+                vol.Optional(ATTR_VALUE): vol.Coerce(int),
+            },
+            _command,
+        )
+    ],
+)
+
+SEND_COMMANDS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_VIN): cv.string,
+        vol.Required(ATTR_COMMANDS): COMMANDS_SCHEMA,
+        vol.Optional(ATTR_CONFIRM, default=True): cv.boolean,
+    }
+)
+
+SEND_FLEET_COMMANDS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_VINS): vol.All(
+            cv.ensure_list, vol.Length(min=1), [cv.string]
+        ),
+        vol.Required(ATTR_COMMANDS): COMMANDS_SCHEMA,
+        vol.Optional(ATTR_CONFIRM, default=True): cv.boolean,
+        vol.Optional(ATTR_CONCURRENCY, default=FLEET_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=FLEET_MAX_CONCURRENCY)
+        ),
+    }
+)
+
+CHARGING_ANALYTICS_SCHEMA = vol.Schema({vol.Required(CONF_VIN): cv.string})
+
+CHARGING_SESSIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_VIN): cv.string,
+        vol.Optional(ATTR_COUNT, default=10): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=1000)
+        ),
+        vol.Inclusive(ATTR_START, "period"): cv.datetime,
+        vol.Inclusive(ATTR_END, "period"): cv.datetime,
+    }
+)
+
+
+def _entry_data(hass: HomeAssistant, vin: str) -> dict[str, Any]:
+    """Return the data of the entry of the vehicle with the VIN."""
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        if entry_data["vehicle"].vehicle.vin == vin:
+            return entry_data
+    raise HomeAssistantError(f"No Tesla vehicle configured with VIN {vin}")
+
+
+def _vehicle_coordinator(hass: HomeAssistant, vin: str) -> TeslaVehicleCoordinator:
+    """Return the coordinator of the vehicle with the VIN."""
+    return _entry_data(hass, vin)["vehicle"]
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Tesla Connector services."""
+
+    @callback
+    def _async_profile(call: ServiceCall) -> None:
+        """Profile the next coordinator refreshes and commands."""
+        PROFILER.start(call.data[ATTR_COUNT], call.data[ATTR_MODE], hass.config.path())
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, _async_profile, schema=PROFILE_SCHEMA
+    )
+
+    async def _async_record_traffic(call: ServiceCall) -> None:
+        """Record the Owner API traffic of every entry for a duration."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        for entry_id, entry_data in hass.data.get(DOMAIN, {}).items():
+            client: TeslaAPIClient = entry_data["client"]
+            if client.is_recording:
+                continue
+
+            path = hass.config.path(f"tesla_connector_{entry_id}_{timestamp}.jsonl.gz")
+            client.start_recording(path)
+            _LOGGER.info("Recording Owner API traffic to %s", path)
+
+            async def _async_stop(_now: datetime, client=client) -> None:
+                await client.async_stop_recording()
+
+            # Unloading the entry closes the client and its recording
+            entry = hass.config_entries.async_get_entry(entry_id)
+            entry.async_on_unload(
+                async_call_later(hass, call.data[ATTR_DURATION], _async_stop)
+            )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RECORD_TRAFFIC,
+        _async_record_traffic,
+        schema=RECORD_TRAFFIC_SCHEMA,
+    )
+
+    async def _async_send_commands(call: ServiceCall) -> None:
+        """Send commands to a vehicle in a single wake window."""
+        coordinator = _vehicle_coordinator(hass, call.data[CONF_VIN])
+        commands: list[VehicleCommand] = call.data[ATTR_COMMANDS]
+
+        await coordinator.vehicle.async_send_commands(commands)
+        if call.data[ATTR_CONFIRM]:
+            # The confirmation polls reach the entities through the coordinator
+            await coordinator.vehicle.async_confirm_commands(commands)
+        else:
+            await coordinator.async_request_refresh()
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEND_COMMANDS,
+        _async_send_commands,
+        schema=SEND_COMMANDS_SCHEMA,
+    )
+
+    async def _async_send_fleet_commands(call: ServiceCall) -> ServiceResponse:
+        """Send commands to several vehicles concurrently, return their results."""
+        from .models.vehicle.fleet import async_send_fleet_commands
+
+        if ATTR_VINS in call.data:
+            coordinators = [
+                _vehicle_coordinator(hass, vin)
+                for vin in dict.fromkeys(call.data[ATTR_VINS])
+            ]
+        else:
+            coordinators = [
+                entry_data["vehicle"]
+                for entry_data in hass.data.get(DOMAIN, {}).values()
+            ]
+        if not coordinators:
+            raise HomeAssistantError("No Tesla vehicle configured")
+
+        start = time.monotonic()
+        results = await async_send_fleet_commands(
+            [coordinator.vehicle for coordinator in coordinators],
+            call.data[ATTR_COMMANDS],
+            call.data[ATTR_CONFIRM],
+            call.data[ATTR_CONCURRENCY],
+        )
+        duration = time.monotonic() - start
+        if not call.data[ATTR_CONFIRM]:
+            for coordinator in coordinators:
+                await coordinator.async_request_refresh()
+
+        return {
+            ATTR_DURATION: round(duration, 3),
+            ATTR_VEHICLES: {result.vin: result.as_dict() for result in results},
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEND_FLEET_COMMANDS,
+        _async_send_fleet_commands,
+        schema=SEND_FLEET_COMMANDS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def _async_trace(call: ServiceCall) -> None:
+        """Trace refreshes, commands and requests, then write a Chrome trace."""
+        if TRACER.active:
+            raise HomeAssistantError("A trace is already running")
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = Path(hass.config.path(f"tesla_connector_trace_{timestamp}.json"))
+        TRACER.start()
+
+        async def _async_stop(_now: datetime) -> None:
+            spans = TRACER.stop()
+            try:
+                await hass.async_add_executor_job(write_chrome_trace, path, spans)
+            except OSError:
+                _LOGGER.exception("Error writing trace to %s", path)
+                return
+            _LOGGER.info("Trace of %d spans written to %s", len(spans), path)
+
+        async_call_later(hass, call.data[ATTR_DURATION], _async_stop)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_TRACE, _async_trace, schema=TRACE_SCHEMA
+    )
+
+    @callback
+    def _async_charging_analytics(call: ServiceCall) -> ServiceResponse:
+        """Return the charging analytics of a vehicle."""
+        entry_data = _entry_data(hass, call.data[CONF_VIN])
+        if (analytics := entry_data.get("analytics")) is None:
+            raise HomeAssistantError(
+                f"Charging analytics are disabled for VIN {call.data[CONF_VIN]}"
+            )
+        return analytics.metrics
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CHARGING_ANALYTICS,
+        _async_charging_analytics,
+        schema=CHARGING_ANALYTICS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def _async_charging_sessions(call: ServiceCall) -> ServiceResponse:
+        """Return the last charging sessions of a vehicle, or those of a period."""
+        from .session_log import session_as_dict
+
+        session_log: ChargingSessionLog | None = _entry_data(hass, call.data[CONF_VIN])[
+            "session_log"
+        ]
+        if session_log is None:
+            raise HomeAssistantError(
+                f"Charging analytics are disabled for VIN {call.data[CONF_VIN]}"
+            )
+        if ATTR_START in call.data:
+            sessions = await hass.async_add_executor_job(
+                session_log.sessions_between,
+                dt_util.as_timestamp(dt_util.as_local(call.data[ATTR_START])),
+                dt_util.as_timestamp(dt_util.as_local(call.data[ATTR_END])),
+            )
+        else:
+            sessions = await hass.async_add_executor_job(
+                session_log.last_sessions, call.data[ATTR_COUNT]
+            )
+        return {ATTR_SESSIONS: [session_as_dict(session) for session in sessions]}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CHARGING_SESSIONS,
+        _async_charging_sessions,
+        schema=CHARGING_SESSIONS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,323 @@
+"""Append-only log of the charging sessions of a vehicle, read through mmap.
+
+The log is made of two files of fixed size records:
+
+- `<name>.charging_samples`, one SAMPLE_DTYPE record per charging sample, the
+  samples of a session being contiguous;
+- `<name>.charging_sessions`, one SESSION_DTYPE record per closed session, in
+  start order, pointing to its samples.
+
+Both are only appended to and never rewritten. The session index is small, so
+queries search it and read the samples of the matching sessions only.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from io import FileIO
+import logging
+import os
+from pathlib import Path
+import threading
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from .const import SESSION_LOG_GAP, SESSION_LOG_MIN_INTERVAL
+from .models.vehicle.vehicle_data import ChargingState
+
+if TYPE_CHECKING:
+    from .models.vehicle.vehicle_data import VehicleData
+    from .models.wall_connector.wall_connector_data import WallConnectorStatus
+
+_LOGGER = logging.getLogger(__name__)
+
+SAMPLE_DTYPE = np.dtype(
+    [
+        ("time", "<f8"),
+        ("session", "<f8"),  # time of the first sample of the session
+        ("soc", "<f4"),  # %
+        ("energy_added", "<f4"),  # kWh, reported by the vehicle
+        ("power", "<f4"),  # kW
+        ("current", "<f4"),  # A
+        ("voltage", "<f4"),  # V
+        ("connector_energy", "<f4"),  # kWh of the wall connector, NaN without
+    ]
+)
+
+SESSION_DTYPE = np.dtype(
+    [
+        ("start", "<f8"),
+        ("end", "<f8"),
+        ("first_sample", "<u8"),
+        ("samples", "<u4"),
+        ("soc_start", "<f4"),
+        ("soc_end", "<f4"),
+        ("energy_added", "<f4"),
+        ("connector_energy", "<f4"),
+        ("connector", "S32"),  # DIN of the wall connector, empty without
+    ]
+)
+
+SessionRecord = tuple[np.ndarray, np.ndarray]  # closed session and its samples
+
+
+def summarize_sessions(samples: np.ndarray, first_sample: int = 0) -> np.ndarray:
+    """Return a session record for each session of contiguous samples.
+
+    Energies are the differences between the first and last samples, so that
+    the vehicle and the wall connector are compared over the same interval.
+    """
+    if not len(samples):
+        return np.empty(0, SESSION_DTYPE)
+
+    session = samples["session"]
+    starts = np.flatnonzero(np.r_[True, session[1:] != session[:-1]])
+    ends = np.r_[starts[1:], len(samples)] - 1
+
+    summaries = np.zeros(len(starts), SESSION_DTYPE)
+    summaries["start"] = samples["time"][starts]
+    summaries["end"] = samples["time"][ends]
+    summaries["first_sample"] = first_sample + starts
+    summaries["samples"] = ends - starts + 1
+    summaries["soc_start"] = samples["soc"][starts]
+    summaries["soc_end"] = samples["soc"][ends]
+
+    energy = samples["energy_added"]
+    summaries["energy_added"] = np.maximum.reduceat(energy, starts) - (
+        np.minimum.reduceat(energy, starts)
+    )
+    # fmax and fmin ignore the samples taken without the wall connector
+    connector = samples["connector_energy"]
+    summaries["connector_energy"] = np.fmax.reduceat(connector, starts) - (
+        np.fmin.reduceat(connector, starts)
+    )
+    return summaries
+
+
+def session_as_dict(session: np.void) -> dict[str, Any]:
+    """Return a session record as JSON compatible values."""
+    connector_energy = float(session["connector_energy"])
+    return {
+        "start": datetime.fromtimestamp(session["start"], timezone.utc).isoformat(),
+        "end": datetime.fromtimestamp(session["end"], timezone.utc).isoformat(),
+        "samples": int(session["samples"]),
+        "soc_start": round(float(session["soc_start"]), 1),
+        "soc_end": round(float(session["soc_end"]), 1),
+        "energy_added_kwh": round(float(session["energy_added"]), 2),
+        "connector_energy_kwh": None
+        if np.isnan(connector_energy)
+        else round(connector_energy, 2),
+        "connector": session["connector"].decode() or None,
+    }
+
+
+def _record_count(path: Path, dtype: np.dtype) -> int:
+    """Return the number of records of a file, dropping a partial last record."""
+    size = path.stat().st_size
+    count, partial = divmod(size, dtype.itemsize)
+    if partial:
+        _LOGGER.warning("Dropping a partially written record of %s", path)
+        os.truncate(path, size - partial)
+    return count
+
+
+class ChargingSessionLog:
+    """Charging samples and sessions of a vehicle in append-only files.
+
+    Methods do blocking I/O and are run in the executor.
+    """
+
+    def __init__(self, directory: Path, name: str) -> None:
+        """Initialize the log of the files with the given name."""
+        self._samples_path = directory / f"{name}.charging_samples"
+        self._sessions_path = directory / f"{name}.charging_sessions"
+        self._lock = threading.Lock()
+        self._samples_file: FileIO | None = None
+        self._sessions_file: FileIO | None = None
+        self._sample_count = 0
+        self._session_count = 0
+        self._maps: dict[Path, np.ndarray] = {}
+
+        self._open_first: int | None = None  # first sample of the open session
+        self._open_session = 0.0
+        self._last_time = 0.0
+        self._connector = b""
+
+    def open(self) -> None:
+        """Open the files, indexing the samples of sessions not indexed yet.
+
+        The samples after the last indexed session form the open session, so
+        that a session goes on across restarts.
+        """
+        with self._lock:
+            self._samples_path.parent.mkdir(parents=True, exist_ok=True)
+            self._samples_file = self._samples_path.open("ab", buffering=0)
+            self._sessions_file = self._sessions_path.open("ab", buffering=0)
+            self._sample_count = _record_count(self._samples_path, SAMPLE_DTYPE)
+            self._session_count = _record_count(self._sessions_path, SESSION_DTYPE)
+
+            sessions = self._sessions()
+            indexed = (
+                int(sessions[-1]["first_sample"] + sessions[-1]["samples"])
+                if len(sessions)
+                else 0
+            )
+            if indexed >= self._sample_count:
+                return
+
+            pending = summarize_sessions(self._samples()[indexed:], indexed)
+            if len(pending) > 1:
+                _LOGGER.debug(
+                    "Indexing %d sessions of %s", len(pending) - 1, self._samples_path
+                )
+                self._sessions_file.write(pending[:-1].tobytes())
+                self._session_count += len(pending) - 1
+            last = pending[-1]
+            self._open_first = int(last["first_sample"])
+            self._open_session = float(self._samples()[self._open_first]["session"])
+            self._last_time = float(last["end"])
+
+    def close(self) -> None:
+        """Close the files, the open session is kept for the next opening."""
+        with self._lock:
+            for file in (self._samples_file, self._sessions_file):
+                if file is not None:
+                    file.close()
+            self._samples_file = self._sessions_file = None
+            self._maps.clear()
+
+    def record(
+        self,
+        now: float,
+        data: VehicleData,
+        connector: WallConnectorStatus | None = None,
+    ) -> SessionRecord | None:
+        """Record the charging state of the vehicle data.
+
+        A sample is appended while the vehicle charges, at most every
+        SESSION_LOG_MIN_INTERVAL. The session closes once the vehicle stops
+        charging or after SESSION_LOG_GAP without samples, the closed session
+        and its samples are then returned.
+        """
+        charge_state = data.charge_state
+        charging = charge_state.charging_state == ChargingState.CHARGING
+
+        with self._lock:
+            if self._samples_file is None:
+                return None
+
+            closed = None
+            if self._open_first is not None and (
+                not charging or now - self._last_time > SESSION_LOG_GAP
+            ):
+                closed = self._close_session()
+
+            if not charging or now - self._last_time < SESSION_LOG_MIN_INTERVAL:
+                return closed
+
+            if self._open_first is None:
+                self._open_first = self._sample_count
+                self._open_session = now
+            connector_energy = np.nan
+            if connector is not None:
+                if connector.session_energy_kwh is not None:
+                    connector_energy = connector.session_energy_kwh
+                self._connector = connector.din.encode()[:32]
+
+            sample = np.array(
+                (
+                    now,
+                    self._open_session,
+                    charge_state.battery_level,
+                    charge_state.charge_energy_added,
+                    charge_state.charger_power or 0,
+                    charge_state.charger_actual_current or 0,
+                    charge_state.charger_voltage or 0,
+                    connector_energy,
+                ),
+                SAMPLE_DTYPE,
+            )
+            self._samples_file.write(sample.tobytes())
+            self._sample_count += 1
+            self._last_time = now
+            return closed
+
+    def close_idle(self, now: float) -> SessionRecord | None:
+        """Close the open session after SESSION_LOG_GAP without samples.
+
+        Polls without online vehicle data, e.g. while the vehicle is asleep or
+        unreachable, cannot tell whether it still charges.
+        """
+        with self._lock:
+            if (
+                self._samples_file is None
+                or self._open_first is None
+                or now - self._last_time <= SESSION_LOG_GAP
+            ):
+                return None
+            return self._close_session()
+
+    def _close_session(self) -> SessionRecord:
+        """Index the open session."""
+        samples = np.array(self._samples()[self._open_first : self._sample_count])
+        session = summarize_sessions(samples, self._open_first)
+        session["connector"] = self._connector
+        self._sessions_file.write(session.tobytes())
+        self._session_count += 1
+        self._open_first = None
+        self._connector = b""
+        _LOGGER.debug(
+            "Charging session closed with %d samples in %s",
+            len(samples),
+            self._samples_path,
+        )
+        return session, samples
+
+    def _map(self, path: Path, dtype: np.dtype, count: int) -> np.ndarray:
+        """Return the records of a file, mapped again once it grew."""
+        mapped = self._maps.get(path)
+        if mapped is None or len(mapped) != count:
+            if count:
+                mapped = np.memmap(path, dtype, "r", shape=(count,))
+            else:
+                mapped = np.empty(0, dtype)
+            self._maps[path] = mapped
+        return mapped
+
+    def _samples(self) -> np.ndarray:
+        """Return the mapped samples."""
+        return self._map(self._samples_path, SAMPLE_DTYPE, self._sample_count)
+
+    def _sessions(self) -> np.ndarray:
+        """Return the mapped session index."""
+        return self._map(self._sessions_path, SESSION_DTYPE, self._session_count)
+
+    def sessions(self) -> np.ndarray:
+        """Return a copy of every closed session."""
+        with self._lock:
+            return np.array(self._sessions())
+
+    def last_sessions(self, count: int) -> np.ndarray:
+        """Return the last closed sessions, the latest last."""
+        if count <= 0:
+            return np.empty(0, SESSION_DTYPE)
+        with self._lock:
+            return np.array(self._sessions()[-count:])
+
+    def sessions_between(self, start: float, end: float) -> np.ndarray:
+        """Return the closed sessions started between two timestamps."""
+        with self._lock:
+            sessions = self._sessions()
+            first = np.searchsorted(sessions["start"], start, "left")
+            last = np.searchsorted(sessions["start"], end, "right")
+            return np.array(sessions[first:last])
+
+    def samples(self, session: np.void | None = None) -> np.ndarray:
+        """Return the samples of a session, or all of them, as a mapped view."""
+        with self._lock:
+            samples = self._samples()
+            if session is None:
+                return samples
+            first = int(session["first_sample"])
+            return samples[first : first + int(session["samples"])]
@@ -1,32 +1,23 @@
 """Tesla Connector Sensor Integration."""
 
-from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING
+
+from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .base_sensor import TeslaBaseSensor, TeslaSensorDescription
+from .base_sensor import TeslaBaseSensor
 from .const import BINARY_SENSOR_LOCKED, DOMAIN, SENSOR_CHARGING_STATE
-from .coordinator import TeslaVehicleCoordinator
-from .models.vehicle.vehicle import TeslaVehicle
+from .entity_descriptions import SWITCH_DESCRIPTIONS, TeslaSensorDescription
 from .models.vehicle.vehicle_data import ChargingState
 
-SWITCH_DESCRIPTIONS: dict[str, TeslaSensorDescription] = {
-    BINARY_SENSOR_LOCKED: TeslaSensorDescription(
-        name="Véhicule verrouillé",
-        value_path="vehicle_state.locked",
-        unit=None,
-        device_class=SwitchDeviceClass.SWITCH,
-        icon="mdi:lock",
-    ),
-    SENSOR_CHARGING_STATE: TeslaSensorDescription(
-        name="Véhicule en charge",
-        value_path="charge_state.charging_state",
-        unit=None,
-        device_class=SwitchDeviceClass.SWITCH,
-        icon="mdi:car-electric",
-    ),
-}
+if TYPE_CHECKING:
+    from .coordinator import TeslaVehicleCoordinator
+    from .models.vehicle.vehicle import TeslaVehicle
 
 
 async def async_setup_entry(
@@ -68,17 +59,31 @@ class TeslaSwitch(TeslaBaseSensor, SwitchEntity):
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the switch on."""
         if self._key == BINARY_SENSOR_LOCKED:
-            await self._vehicle.async_lock_doors()
+            self.async_run_optimistic_command(
+                True,
+                self._vehicle.async_lock_doors,
+                partial(self._vehicle.async_wait_for_data, self._value_matches(True)),
+            )
         elif self._key == SENSOR_CHARGING_STATE:
-            await self._vehicle.async_start_charge()
-
-        await self.coordinator.async_request_refresh()
+            self.async_run_optimistic_command(
+                ChargingState.CHARGING,
+                self._vehicle.async_start_charge,
+                partial(
+                    self._vehicle.async_wait_charging_state, ChargingState.CHARGING
+                ),
+            )
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn the switch off."""
         if self._key == BINARY_SENSOR_LOCKED:
-            await self._vehicle.async_unlock_doors()
+            self.async_run_optimistic_command(
+                False,
+                self._vehicle.async_unlock_doors,
+                partial(self._vehicle.async_wait_for_data, self._value_matches(False)),
+            )
         elif self._key == SENSOR_CHARGING_STATE:
-            await self._vehicle.async_stop_charge()
-
-        await self.coordinator.async_request_refresh()
+            self.async_run_optimistic_command(
+                ChargingState.STOPPED,
+                self._vehicle.async_stop_charge,
+                partial(self._vehicle.async_wait_charging_state, ChargingState.STOPPED),
+            )
@@ -0,0 +1,175 @@
+"""Lightweight tracing spans of refreshes, commands and Owner API requests."""
+
+from __future__ import annotations
+
+from collections import deque
+from contextvars import ContextVar, Token
+import itertools
+import json
+import logging
+import os
+from pathlib import Path
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_SPANS = 10000
+
+_current_span: ContextVar[Span | None] = ContextVar(
+    "tesla_connector_span", default=None
+)
+_span_ids = itertools.count(1)
+
+
+class _NoopSpan:
+    """Span returned while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NoopSpan:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Ignore the attribute."""
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """Timed operation, child of the span active when it is entered."""
+
+    __slots__ = (
+        "name",
+        "attributes",
+        "span_id",
+        "parent_id",
+        "trace_id",
+        "start",
+        "end",
+        "_tracer",
+        "_token",
+    )
+
+    def __init__(self, tracer: Tracer, name: str, attributes: dict[str, Any]) -> None:
+        """Initialize the span."""
+        self.name = name
+        self.attributes = attributes
+        self.span_id = 0
+        self.parent_id: int | None = None
+        self.trace_id = 0
+        self.start = 0
+        self.end = 0
+        self._tracer = tracer
+        self._token: Token[Span | None] | None = None
+
+    def __enter__(self) -> Span:
+        parent = _current_span.get()
+        self.span_id = next(_span_ids)
+        if parent is not None:
+            self.parent_id = parent.span_id
+            self.trace_id = parent.trace_id
+        else:
+            self.trace_id = self.span_id
+        self._token = _current_span.set(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc_info: object) -> None:
+        self.end = time.perf_counter_ns()
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        self._tracer.record(self)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute of the span, e.g. the status of a request."""
+        self.attributes[key] = value
+
+
+class Tracer:
+    """Record spans in a ring buffer while tracing is enabled.
+
+    When tracing is disabled `span` returns a shared no-op span, so callers
+    only pay for the `active` check.
+    """
+
+    def __init__(self, max_spans: int = MAX_SPANS) -> None:
+        """Initialize the tracer."""
+        self.active = False
+        self._spans: deque[Span] = deque(maxlen=max_spans)
+
+    def start(self) -> None:
+        """Start recording spans, forgetting the previous ones."""
+        self._spans.clear()
+        self.active = True
+        _LOGGER.info("Tracing started")
+
+    def stop(self) -> list[Span]:
+        """Stop recording and return the recorded spans."""
+        self.active = False
+        spans = list(self._spans)
+        self._spans.clear()
+        _LOGGER.info("Tracing stopped, %d spans recorded", len(spans))
+        return spans
+
+    def span(self, name: str, **attributes: Any) -> Span | _NoopSpan:
+        """Return a span to use as a context manager."""
+        if not self.active:
+            return _NOOP_SPAN
+        return Span(self, name, attributes)
+
+    def record(self, span: Span) -> None:
+        """Keep a finished span, the oldest ones are dropped once full."""
+        if self.active:
+            self._spans.append(span)
+
+
+def chrome_trace(spans: list[Span]) -> dict[str, Any]:
+    """Return the spans as Chrome trace events.
+
+    Each trace, a root span and its descendants, gets its own track so that
+    concurrent refreshes and commands do not overlap.
+    """
+    pid = os.getpid()
+    events: list[dict[str, Any]] = []
+    for span in spans:
+        if span.parent_id is None:
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": span.trace_id,
+                    "args": {"name": f"{span.name} #{span.trace_id}"},
+                }
+            )
+        events.append(
+            {
+                "name": span.name,
+                "cat": "tesla_connector",
+                "ph": "X",
+                "ts": span.start / 1000,
+                "dur": (span.end - span.start) / 1000,
+                "pid": pid,
+                "tid": span.trace_id,
+                "args": {
+                    **span.attributes,
+                    "span_id": span.span_id,
+                    "parent_id": span.parent_id,
+                },
+            }
+        )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def write_chrome_trace(path: Path, spans: list[Span]) -> None:
+    """Write the spans as a Chrome trace event file."""
+    path.write_text(json.dumps(chrome_trace(spans), default=str), encoding="utf-8")
+
+
+TRACER = Tracer()